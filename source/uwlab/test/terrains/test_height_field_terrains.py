@@ -0,0 +1,78 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import unittest
+
+import uwlab.terrains.height_field as hf_gen
+from uwlab.terrains.height_field.utils import generate_height_fields
+
+
+class TestHeightFieldTerrains(unittest.TestCase):
+    """Test cases for the batched generation of height field terrains."""
+
+    def setUp(self):
+        # configurations of all the height field terrains
+        self.cfgs = {
+            "random_uniform": hf_gen.HfRandomUniformTerrainCfg(
+                noise_range=(-0.05, 0.05), noise_step=0.01, downsampled_scale=0.2
+            ),
+            "pyramid_sloped": hf_gen.HfPyramidSlopedTerrainCfg(slope_range=(0.0, 0.4)),
+            "inverted_pyramid_sloped": hf_gen.HfInvertedPyramidSlopedTerrainCfg(slope_range=(0.0, 0.4)),
+            "pyramid_stairs": hf_gen.HfPyramidStairsTerrainCfg(step_height_range=(0.05, 0.2), step_width=0.3),
+            "inverted_pyramid_stairs": hf_gen.HfInvertedPyramidStairsTerrainCfg(
+                step_height_range=(0.05, 0.2), step_width=0.3
+            ),
+            "discrete_obstacles": hf_gen.HfDiscreteObstaclesTerrainCfg(
+                obstacle_width_range=(0.25, 1.5), obstacle_height_range=(0.05, 0.2), num_obstacles=40
+            ),
+            "wave": hf_gen.HfWaveTerrainCfg(amplitude_range=(0.05, 0.2), num_waves=3),
+            "stepping_stones": hf_gen.HfSteppingStonesTerrainCfg(
+                stone_height_max=0.05, stone_width_range=(0.3, 1.2), stone_distance_range=(0.1, 0.5), holes_depth=-2.0
+            ),
+        }
+        for cfg in self.cfgs.values():
+            cfg.size = (8.0, 6.0)
+            cfg.border_width = 0.25
+            cfg.slope_threshold = 0.75
+        # difficulties and seeds of the batch
+        self.difficulties = np.array([0.0, 0.2, 0.5, 0.7, 0.9, 1.0])
+        self.seeds = [11, 12, 13, 14, 15, 16]
+
+    def test_batch_matches_single_terrain(self):
+        """Test that a terrain generated in a batch is the same as the terrain generated on its own."""
+        for name, cfg in self.cfgs.items():
+            with self.subTest(terrain=name):
+                batch = generate_height_fields(self.difficulties, self.seeds, cfg)
+                for index, (difficulty, seed) in enumerate(zip(self.difficulties, self.seeds)):
+                    single = generate_height_fields(np.array([difficulty]), [seed], cfg)
+                    np.testing.assert_array_equal(batch[index], single[0])
+
+    def test_batch_matches_mesh_function(self):
+        """Test that the mesh function produces the same terrain as the batched generation."""
+        for name, cfg in self.cfgs.items():
+            with self.subTest(terrain=name):
+                batch = generate_height_fields(self.difficulties, self.seeds, cfg)
+                for index, (difficulty, seed) in enumerate(zip(self.difficulties, self.seeds)):
+                    cfg.seed = seed
+                    meshes, _ = cfg.function(difficulty, cfg)
+                    np.testing.assert_allclose(
+                        meshes[0].vertices[:, 2], batch[index].reshape(-1) * cfg.vertical_scale, atol=1e-6
+                    )
+
+
+if __name__ == "__main__":
+    run_tests()
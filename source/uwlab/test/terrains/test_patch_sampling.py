@@ -0,0 +1,129 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import trimesh
+import unittest
+
+from isaaclab.utils.warp import convert_to_warp_mesh
+from uwlab.terrains.utils import HeightMapFlatPatchSamplingCfg
+from uwlab.terrains.utils.patch_sampling import _flat_cell_mask, _raycast_heights
+
+
+class TestHeightMapPatchSampling(unittest.TestCase):
+    """Test cases for sampling flat patches from a height map of a stepped mesh."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.device = "cuda:0" if torch.cuda.is_available() else "cpu"
+        # ground at z = 0 over x in [-2, 2] and a step at z = 0.5 over x in [0, 2]
+        ground = trimesh.creation.box(extents=(4.0, 4.0, 1.0))
+        ground.apply_translation((0.0, 0.0, -0.5))
+        step = trimesh.creation.box(extents=(2.0, 4.0, 0.5))
+        step.apply_translation((1.0, 0.0, 0.25))
+        self.stepped_mesh = trimesh.util.concatenate([ground, step])
+        self.patch_radius = 0.3
+
+    """
+    Tests.
+    """
+
+    def test_flat_cell_mask(self):
+        """Test that the cells close to a step, a hole or outside the z ranges are invalid."""
+        heights = torch.zeros(20, 20)
+        heights[10:] = 0.5
+        heights[3, 3] = float("inf")
+        valid = _flat_cell_mask(heights, 2, 0.1, [(-1.0, 1.0)])
+        # the window of a cell spans two cells to each side, which must not reach the step
+        self.assertTrue(valid[:8, 6:].all())
+        self.assertFalse(valid[8:12].any())
+        self.assertTrue(valid[12:].all())
+        # the cells without a hit invalidate their neighborhood
+        self.assertFalse(valid[1:6, 1:6].any())
+        self.assertTrue(valid[6:8, :].all())
+        # the whole window must lie within one of the z ranges
+        valid = _flat_cell_mask(heights, 2, 1.0, [(0.4, 0.6)])
+        self.assertFalse(valid[:12].any())
+        self.assertTrue(valid[12:].all())
+        valid = _flat_cell_mask(heights, 2, 1.0, [(-0.1, 0.1), (0.4, 0.6)])
+        self.assertTrue(valid[:8, 6:].all())
+        self.assertFalse(valid[8:12].any())
+        # a single range covering both levels lets the height difference decide
+        valid = _flat_cell_mask(heights, 2, 1.0, [(-1.0, 1.0)])
+        self.assertTrue(valid[8:12].all())
+
+    def test_patches_on_step(self):
+        """Test that the patches lie on the level selected by the z range, away from the edge of the step."""
+        wp_mesh = convert_to_warp_mesh(self.stepped_mesh.vertices, self.stepped_mesh.faces, device=self.device)
+        cfg = HeightMapFlatPatchSamplingCfg(
+            num_patches=100, patch_radius=self.patch_radius, z_range=(0.4, 0.6), max_height_diff=0.05
+        )
+        patches = cfg.func(wp_mesh, np.zeros(3), cfg)
+        self.assertEqual(patches.shape, (cfg.num_patches, 3))
+        torch.testing.assert_close(patches[:, 2], torch.full_like(patches[:, 2], 0.5), atol=1e-4, rtol=0.0)
+        self.assertTrue((patches[:, 0] >= self.patch_radius).all())
+        self.assertTrue((patches[:, 0] <= 2.0 - self.patch_radius).all())
+        self.assertTrue(self._passes_ring_check(wp_mesh, patches, cfg).all())
+
+    def test_confirmation(self):
+        """Test that the patches failing the ray-cast confirmation are not returned."""
+        # thin ridges between the samples of the height map, which only the ring ray-casts can hit
+        ridges = []
+        for x in np.arange(-1.9, 2.0, 0.2):
+            ridge = trimesh.creation.box(extents=(0.02, 4.0, 0.2))
+            ridge.apply_translation((x, 0.0, 0.1))
+            ridges.append(ridge)
+        mesh = trimesh.util.concatenate([self.stepped_mesh] + ridges)
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        cfg = HeightMapFlatPatchSamplingCfg(
+            num_patches=200,
+            patch_radius=self.patch_radius,
+            x_range=(-1.5, -0.5),
+            z_range=(-0.1, 0.1),
+            max_height_diff=0.05,
+            resolution=0.2,
+        )
+        origin = np.zeros(3)
+        # the height map misses the ridges, so some drawn patches must fail the ring check
+        samples = torch.tensor([[x, 0.0] for x in np.arange(-2.0, 0.0, 0.2)], dtype=torch.float, device=self.device)
+        heights = _raycast_heights(wp_mesh, samples)
+        self.assertTrue((heights.abs() < 1e-6).all())
+        for max_confirm_iterations in (1, 10):
+            with self.subTest(max_confirm_iterations=max_confirm_iterations):
+                cfg.max_confirm_iterations = max_confirm_iterations
+                patches = cfg.func(wp_mesh, origin, cfg)
+                self.assertTrue(self._passes_ring_check(wp_mesh, patches, cfg).all())
+
+    """
+    Helper functions.
+    """
+
+    def _passes_ring_check(
+        self, wp_mesh, patches: torch.Tensor, cfg: HeightMapFlatPatchSamplingCfg, num_angles: int = 10
+    ) -> torch.Tensor:
+        """Mask of the patches whose ring of ray-casts lies within the z range and is flat enough."""
+        angle = torch.linspace(0, 2 * np.pi, num_angles, device=patches.device)
+        ring = self.patch_radius * torch.stack([torch.cos(angle), torch.sin(angle)], dim=-1)
+        points = (patches[:, :2].unsqueeze(1) + ring).view(-1, 2)
+        ring_heights = _raycast_heights(wp_mesh, points).view(len(patches), -1)
+        low, high = cfg.z_range
+        in_range = ((ring_heights >= low) & (ring_heights <= high)).all(dim=1)
+        return in_range & ((ring_heights.max(dim=1)[0] - ring_heights.min(dim=1)[0]) <= cfg.max_height_diff)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,76 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from uwlab.utils.cuda_graph import CudaGraphCallable
+
+
+@unittest.skipUnless(torch.cuda.is_available(), "Capturing CUDA graphs requires a CUDA device.")
+class TestCudaGraphCallable(unittest.TestCase):
+    """Test cases for capturing and replaying a function as a CUDA graph."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        # the function reads the current input tensor, which a test may reallocate
+        self.buffers = {"input": torch.zeros(8, device=self.device)}
+        self.output = torch.zeros(8, device=self.device)
+        self.num_calls = 0
+        self.warmup = 3
+        self.graph = CudaGraphCallable(
+            self._double, inputs=lambda: [self.buffers["input"], self.output], warmup=self.warmup, name="test"
+        )
+
+    def test_stable_inputs_are_captured_once(self):
+        """Test that a graph with stable inputs is captured once and then replayed."""
+        for step in range(10):
+            self.buffers["input"].fill_(step)
+            self.graph()
+            torch.testing.assert_close(self.output, torch.full_like(self.output, 2.0 * step))
+        self.assertTrue(self.graph.is_captured)
+        self.assertFalse(self.graph.failed)
+        self.assertEqual(self.graph.num_captures, 1)
+        # the function only runs in Python for the warm-up and the capture, the other calls replay the graph
+        self.assertEqual(self.num_calls, self.warmup + 1)
+
+    def test_reallocated_input_is_captured_again(self):
+        """Test that a reallocated input captures the graph exactly once more."""
+        for step in range(5):
+            self.buffers["input"].fill_(step)
+            self.graph()
+        self.assertEqual(self.graph.num_captures, 1)
+        num_calls = self.num_calls
+        # reallocate the input, the graph recorded the address of the previous one
+        self.buffers["input"] = torch.zeros(8, device=self.device)
+        for step in range(10):
+            self.buffers["input"].fill_(step + 10)
+            self.graph()
+            torch.testing.assert_close(self.output, torch.full_like(self.output, 2.0 * (step + 10)))
+        self.assertEqual(self.graph.num_captures, 2)
+        self.assertEqual(self.num_calls - num_calls, self.warmup + 1)
+
+    """
+    Helper functions.
+    """
+
+    def _double(self):
+        self.num_calls += 1
+        torch.mul(self.buffers["input"], 2.0, out=self.output)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -3,6 +3,6 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from .articulation import ArticulationCfg, ArticulationData, UniversalArticulation
+from .articulation import ArticulationCfg, ArticulationData, JointStateHistory, UniversalArticulation
 from .asset_base import AssetBase
 from .asset_base_cfg import AssetBaseCfg
@@ -6,4 +6,5 @@
 from .articulation import UniversalArticulation
 from .articulation_cfg import ArticulationCfg
 from .articulation_data import ArticulationData
+from .state_history import JointStateHistory
 from .articulation_view import *
@@ -30,6 +30,7 @@ from isaaclab.utils.types import ArticulationActions
 from ..asset_base import AssetBase
 from .articulation_data import ArticulationData
 from .articulation_view import ArticulationView
+from .state_history import JointStateHistory
 
 if TYPE_CHECKING:
     from .articulation_cfg import ArticulationCfg
@@ -119,6 +120,11 @@ class UniversalArticulation(AssetBase):
     def data(self) -> ArticulationData:
         return self._data
 
+    @property
+    def state_history(self) -> JointStateHistory | None:
+        """Timestamped joint states read from the view, None if :attr:`ArticulationCfg.state_history_length` is 0."""
+        return self._state_history
+
     @property
     def num_instances(self) -> int:
         return self.view.count
@@ -167,6 +173,15 @@ class UniversalArticulation(AssetBase):
         """
         return self._view
 
+    @property
+    def root_physx_view(self) -> ArticulationView:
+        """Alias of :attr:`view`.
+
+        Lets action terms written against Isaac Lab articulations, e.g. the differential IK action reading
+        :meth:`ArticulationView.get_jacobians`, run on this asset as well.
+        """
+        return self._view
+
     """
     Operations.
     """
@@ -182,37 +197,50 @@ class UniversalArticulation(AssetBase):
         self._external_force_b[env_ids] = 0.0
         self._external_torque_b[env_ids] = 0.0
 
-    def write_data_to_sim(self):
+    def write_data_to_sim(self, env_ids: Sequence[int] | torch.Tensor | None = None):
         """Write external wrenches and joint commands to the simulation.
 
         If any explicit actuators are present, then the actuator models are used to compute the
         joint commands. Otherwise, the joint commands are directly set into the simulation.
 
+        Args:
+            env_ids: Environment indices whose commands are written, e.g. only the environments that were just reset.
+                Defaults to None (all environments).
+
         Note:
             We write external wrench to the simulation here since this function is called before the simulation step.
             This ensures that the external wrench is applied at every simulation step.
         """
+        indices = self._ALL_INDICES if env_ids is None else env_ids
         # write external wrench
         if self.has_external_wrench:
             self.view.apply_forces_and_torques_at_position(
                 force_data=self._external_force_b.view(-1, 3),
                 torque_data=self._external_torque_b.view(-1, 3),
                 position_data=None,
-                indices=self._ALL_INDICES,
+                indices=indices,
                 is_global=False,
             )
 
-        # apply actuator models
-        self._apply_actuator_model()
+        # apply actuator models, unless the environment runs them in a captured CUDA graph
+        # note: partial writes (after resets) happen outside of the graph, so they apply the models themselves
+        if not self._actuator_model_captured or env_ids is not None:
+            self._apply_actuator_model()
         # write actions into simulation
-        self.view.set_dof_actuation_forces(self._joint_effort_target_sim, self._ALL_INDICES)
+        self.view.set_dof_actuation_forces(self._joint_effort_target_sim, indices)
         # position and velocity targets only for implicit actuators
         if self._has_implicit_actuators:
-            self.view.set_dof_position_targets(self._joint_pos_target_sim, self._ALL_INDICES)
-            self.view.set_dof_velocity_targets(self._joint_vel_target_sim, self._ALL_INDICES)
+            self.view.set_dof_position_targets(self._joint_pos_target_sim, indices)
+            self.view.set_dof_velocity_targets(self._joint_vel_target_sim, indices)
 
     def update(self, dt: float):
-        self._data.update(dt)
+        if self._state_history is None:
+            self._data.update(dt)
+        else:
+            # the stamped read is also used as the joint state of this update
+            stamp, joint_pos, joint_vel = self.view.get_dof_states_stamped()
+            self._state_history.append(stamp, joint_pos, joint_vel)
+            self._data.update(dt, joint_pos=joint_pos, joint_vel=joint_vel)
         # self._view.update(dt)
 
     """
@@ -378,9 +406,7 @@ class UniversalArticulation(AssetBase):
         root_poses_xyzw = self._data.root_link_state_w[:, :7].clone()
         root_poses_xyzw[:, 3:] = math_utils.convert_quat(root_poses_xyzw[:, 3:], to="xyzw")
         # Need to invalidate the buffer to trigger the update with the new root pose.
-        self._data._body_state_w.timestamp = -1.0
-        self._data._body_link_state_w.timestamp = -1.0
-        self._data._body_com_state_w.timestamp = -1.0
+        self._data.invalidate_snapshot()
         # set into simulation
         self.view.set_root_transforms(root_poses_xyzw, indices=physx_env_ids)
 
@@ -512,9 +538,7 @@ class UniversalArticulation(AssetBase):
         self._data._previous_joint_vel[env_ids, joint_ids] = velocity
         self._data.joint_acc[env_ids, joint_ids] = 0.0
         # Need to invalidate the buffer to trigger the update with the new root pose.
-        self._data._body_state_w.timestamp = -1.0
-        self._data._body_link_state_w.timestamp = -1.0
-        self._data._body_com_state_w.timestamp = -1.0
+        self._data.invalidate_snapshot()
         # set into simulation
         self.view.set_dof_positions(self._data.joint_pos, indices=physx_env_ids)
         self.view.set_dof_velocities(self._data.joint_vel, indices=physx_env_ids)
@@ -1098,6 +1122,16 @@ class UniversalArticulation(AssetBase):
 
         # container for data access
         self._data = ArticulationData(self.view, self.device)
+        # history of the timestamped joint states
+        self._state_history = None
+        if self.cfg.state_history_length > 0:
+            self._state_history = JointStateHistory(
+                self.cfg.state_history_length,
+                self.num_instances,
+                self.num_joints,
+                self.device,
+                max_extrapolation=self.cfg.state_max_extrapolation,
+            )
 
         # create buffers
         self._create_buffers()
@@ -1348,6 +1382,8 @@ class UniversalArticulation(AssetBase):
                 "Not all actuators are configured! Total number of actuated joints not equal to number of"
                 f" joints available: {total_act_joints} != {self.num_joints - self.num_fixed_tendons}."
             )
+        # precompute the per group index maps and buffers of the actuator pipeline
+        self._prepare_actuator_model()
 
     def _process_fixed_tendons(self):
         """Process fixed tendons."""
@@ -1376,44 +1412,112 @@ class UniversalArticulation(AssetBase):
             self._data.default_fixed_tendon_rest_length = self.view.get_fixed_tendon_rest_lengths().clone()
             self._data.default_fixed_tendon_offset = self.view.get_fixed_tendon_offsets().clone()
 
+    def _prepare_actuator_model(self):
+        """Precomputes what :meth:`_apply_actuator_model` needs for every actuator group.
+
+        The joint indices of a group are turned into a slice when they are contiguous, so that the group's inputs and
+        outputs are views into the articulation buffers instead of gathered copies. Groups with scattered joints gather
+        their inputs into buffers allocated here. The actuator action container is reused across calls.
+        """
+        self._actuator_groups = []
+        for actuator in self.actuators.values():
+            joint_index = self._as_contiguous_slice(actuator.joint_indices)
+            # inputs of scattered groups: joint position, velocity and effort targets, joint positions and velocities
+            gather_buffers = None
+            if not isinstance(joint_index, slice):
+                gather_buffers = torch.zeros(5, self.num_instances, actuator.num_joints, device=self.device)
+            control_action = ArticulationActions(joint_indices=actuator.joint_indices)
+            # TODO: find a cleaner way to handle gear ratio. Only needed for variable gear ratio actuators.
+            has_gear_ratio = hasattr(actuator, "gear_ratio")
+            self._actuator_groups.append((actuator, joint_index, gather_buffers, control_action, has_gear_ratio))
+
+        self._compiled_actuator_model = None
+        if self.cfg.compile_actuator_model:
+            self._compiled_actuator_model = torch.compile(self._compute_actuator_groups, dynamic=False)
+
+        # copies of the joint state at fixed addresses, read by the actuator models when captured in a CUDA graph
+        self._actuator_model_captured = False
+        self._static_joint_pos = torch.zeros_like(self._data.default_joint_pos)
+        self._static_joint_vel = torch.zeros_like(self._data.default_joint_pos)
+
+    def _as_contiguous_slice(self, joint_indices: slice | torch.Tensor) -> slice | torch.Tensor:
+        """Returns the joint indices as a slice if they are an increasing run of consecutive joints."""
+        if isinstance(joint_indices, slice):
+            return joint_indices
+        indices = joint_indices.tolist()
+        if indices == list(range(indices[0], indices[0] + len(indices))):
+            return slice(indices[0], indices[0] + len(indices))
+        return joint_indices
+
     def _apply_actuator_model(self):
         """Processes joint commands for the articulation by forwarding them to the actuators.
 
         The actions are first processed using actuator models. Depending on the robot configuration,
         the actuator models compute the joint level simulation commands and sets them into the PhysX buffers.
+        If :attr:`ArticulationCfg.compile_actuator_model` is set, all groups run as one compiled graph, falling
+        back to eager execution if compilation fails.
+        """
+        if self._compiled_actuator_model is not None:
+            try:
+                self._compiled_actuator_model(self._data.joint_pos, self._data.joint_vel)
+                return
+            except Exception as e:
+                omni.log.warn(f"Compiling the actuator model failed, falling back to eager execution: {e}")
+                self._compiled_actuator_model = None
+        self._compute_actuator_groups(self._data.joint_pos, self._data.joint_vel)
+
+    def _update_static_joint_state(self):
+        """Copies the current joint state into the buffers read by :meth:`_apply_actuator_model_static`."""
+        self._static_joint_pos.copy_(self._data.joint_pos)
+        self._static_joint_vel.copy_(self._data.joint_vel)
+
+    def _apply_actuator_model_static(self):
+        """Applies the actuator models on the joint state copied by :meth:`_update_static_joint_state`.
+
+        All tensors it reads and writes keep their addresses, so that it can be captured in a CUDA graph. While
+        :attr:`_actuator_model_captured` is set, :meth:`write_data_to_sim` leaves applying the models to the caller.
         """
+        self._compute_actuator_groups(self._static_joint_pos, self._static_joint_vel)
+
+    def _compute_actuator_groups(self, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
         # process actions per group
-        for actuator in self.actuators.values():
+        for actuator, joint_index, gather_buffers, control_action, has_gear_ratio in self._actuator_groups:
             # prepare input for actuator model based on cached data
-            # TODO : A tensor dict would be nice to do the indexing of all tensors together
-            control_action = ArticulationActions(
-                joint_positions=self._data.joint_pos_target[:, actuator.joint_indices],
-                joint_velocities=self._data.joint_vel_target[:, actuator.joint_indices],
-                joint_efforts=self._data.joint_effort_target[:, actuator.joint_indices],
-                joint_indices=actuator.joint_indices,
-            )
+            if gather_buffers is None:
+                # contiguous joints, the inputs are views
+                pos_target = self._data.joint_pos_target[:, joint_index]
+                vel_target = self._data.joint_vel_target[:, joint_index]
+                effort_target = self._data.joint_effort_target[:, joint_index]
+                group_pos = joint_pos[:, joint_index]
+                group_vel = joint_vel[:, joint_index]
+            else:
+                pos_target, vel_target, effort_target, group_pos, group_vel = gather_buffers
+                torch.index_select(self._data.joint_pos_target, 1, joint_index, out=pos_target)
+                torch.index_select(self._data.joint_vel_target, 1, joint_index, out=vel_target)
+                torch.index_select(self._data.joint_effort_target, 1, joint_index, out=effort_target)
+                torch.index_select(joint_pos, 1, joint_index, out=group_pos)
+                torch.index_select(joint_vel, 1, joint_index, out=group_vel)
+            # the actuator models replace the fields of the action, so they are set again on every call
+            control_action.joint_positions = pos_target
+            control_action.joint_velocities = vel_target
+            control_action.joint_efforts = effort_target
             # compute joint command from the actuator model
-            control_action = actuator.compute(
-                control_action,
-                joint_pos=self._data.joint_pos[:, actuator.joint_indices],
-                joint_vel=self._data.joint_vel[:, actuator.joint_indices],
-            )
+            control_action = actuator.compute(control_action, joint_pos=group_pos, joint_vel=group_vel)
             # update targets (these are set into the simulation)
             if control_action.joint_positions is not None:
-                self._joint_pos_target_sim[:, actuator.joint_indices] = control_action.joint_positions
+                self._joint_pos_target_sim[:, joint_index] = control_action.joint_positions
             if control_action.joint_velocities is not None:
-                self._joint_vel_target_sim[:, actuator.joint_indices] = control_action.joint_velocities
+                self._joint_vel_target_sim[:, joint_index] = control_action.joint_velocities
             if control_action.joint_efforts is not None:
-                self._joint_effort_target_sim[:, actuator.joint_indices] = control_action.joint_efforts
+                self._joint_effort_target_sim[:, joint_index] = control_action.joint_efforts
             # update state of the actuator model
             # -- torques
-            self._data.computed_torque[:, actuator.joint_indices] = actuator.computed_effort
-            self._data.applied_torque[:, actuator.joint_indices] = actuator.applied_effort
+            self._data.computed_torque[:, joint_index] = actuator.computed_effort
+            self._data.applied_torque[:, joint_index] = actuator.applied_effort
             # -- actuator data
-            self._data.soft_joint_vel_limits[:, actuator.joint_indices] = actuator.velocity_limit
-            # TODO: find a cleaner way to handle gear ratio. Only needed for variable gear ratio actuators.
-            if hasattr(actuator, "gear_ratio"):
-                self._data.gear_ratio[:, actuator.joint_indices] = actuator.gear_ratio
+            self._data.soft_joint_vel_limits[:, joint_index] = actuator.velocity_limit
+            if has_gear_ratio:
+                self._data.gear_ratio[:, joint_index] = actuator.gear_ratio
 
     """
     Internal helpers -- Debugging.
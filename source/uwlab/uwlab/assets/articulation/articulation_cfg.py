@@ -58,3 +58,23 @@ class ArticulationCfg(AssetBaseCfg):
 
     actuators: dict[str, ActuatorBaseCfg] = MISSING
     """Actuators for the robot with corresponding joint names."""
+
+    state_history_length: int = 0
+    """Number of timestamped joint states kept in :attr:`UniversalArticulation.state_history`. Defaults to 0 (no
+    history).
+
+    Each update reads the joint states together with the time the view measured them. Observation terms can then
+    sample the joint states at another time, e.g. the time the next action is applied on the real robot.
+    """
+
+    state_max_extrapolation: float = 0.1
+    """Longest time in seconds the joint positions of the history are extrapolated past the newest sample.
+    Defaults to 0.1."""
+
+    compile_actuator_model: bool = False
+    """Whether to compile the actuator models of all groups into one graph with :func:`torch.compile`.
+    Defaults to False.
+
+    This reduces the per physics step overhead with many actuator groups, at the cost of a compilation on the first
+    step. If compilation fails, the actuator models run eagerly.
+    """
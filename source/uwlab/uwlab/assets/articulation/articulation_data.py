@@ -65,6 +65,14 @@ class ArticulationData:
         # Initialize history for finite differencing
         self._previous_joint_vel = self.view.get_dof_velocities().clone()
 
+        # Initialize the snapshot of the simulation data, read from the view at most once per timestamp.
+        # note: quaternions are converted to (w, x, y, z) once when the snapshot is taken.
+        self._root_pose_w = TimestampedBuffer()
+        self._root_vel_w = TimestampedBuffer()
+        self._link_pose_w = TimestampedBuffer()
+        self._link_vel_w = TimestampedBuffer()
+        self._coms_b = TimestampedBuffer()
+
         # Initialize the lazy buffers.
         self._root_state_w = TimestampedBuffer()
         self._root_link_state_w = TimestampedBuffer()
@@ -82,9 +90,23 @@ class ArticulationData:
         self._body_state_dep_warn = False
         self._ignore_dep_warn = False
 
-    def update(self, dt: float):
+    def update(self, dt: float, joint_pos: torch.Tensor | None = None, joint_vel: torch.Tensor | None = None):
+        """Advance the timestamp of the data.
+
+        Args:
+            dt: Time passed since the last update.
+            joint_pos: Joint positions already read from the view for this update. Defaults to None (read lazily).
+            joint_vel: Joint velocities already read from the view for this update. Defaults to None (read lazily).
+        """
         # update the simulation timestamp
         self._timestamp += dt
+        # use the joint states read by the caller
+        if joint_pos is not None:
+            self._joint_pos.data = joint_pos
+            self._joint_pos.timestamp = self._timestamp
+        if joint_vel is not None:
+            self._joint_vel.data = joint_vel
+            self._joint_vel.timestamp = self._timestamp
         # Trigger an update of the joint acceleration buffer at a higher frequency
         # since we do finite differencing.
         self.joint_acc
@@ -93,6 +115,69 @@ class ArticulationData:
         """Update the kinematic state of all articulations."""
         pass
 
+    def invalidate_snapshot(self):
+        """Drop the snapshot of the root and link data and the body states derived from it.
+
+        The next access reads them from the view again. This is needed after writing a state into the view within
+        the same timestamp.
+        """
+        self._root_pose_w.timestamp = -1.0
+        self._root_vel_w.timestamp = -1.0
+        self._link_pose_w.timestamp = -1.0
+        self._link_vel_w.timestamp = -1.0
+        self._coms_b.timestamp = -1.0
+        self._body_state_w.timestamp = -1.0
+        self._body_link_state_w.timestamp = -1.0
+        self._body_com_state_w.timestamp = -1.0
+
+    ##
+    # Snapshot.
+    ##
+
+    def _read_root_pose_w(self) -> torch.Tensor:
+        """Root link pose ``[pos, quat]`` with quaternion (w, x, y, z). Shape is (num_instances, 7)."""
+        if self._root_pose_w.timestamp < self._timestamp:
+            pose = self.view.get_root_transforms().clone()
+            pose[:, 3:7] = math_utils.convert_quat(pose[:, 3:7], to="wxyz")
+            self._root_pose_w.data = pose
+            self._root_pose_w.timestamp = self._timestamp
+        return self._root_pose_w.data
+
+    def _read_root_vel_w(self) -> torch.Tensor:
+        """Root center of mass velocity ``[lin_vel, ang_vel]``. Shape is (num_instances, 6)."""
+        if self._root_vel_w.timestamp < self._timestamp:
+            self._root_vel_w.data = self.view.get_root_velocities().clone()
+            self._root_vel_w.timestamp = self._timestamp
+        return self._root_vel_w.data
+
+    def _read_link_pose_w(self) -> torch.Tensor:
+        """Link poses ``[pos, quat]`` with quaternion (w, x, y, z). Shape is (num_instances, num_bodies, 7)."""
+        if self._link_pose_w.timestamp < self._timestamp:
+            self.update_articulations_kinematic()
+            pose = self.view.get_link_transforms().clone()
+            pose[..., 3:7] = math_utils.convert_quat(pose[..., 3:7], to="wxyz")
+            self._link_pose_w.data = pose
+            self._link_pose_w.timestamp = self._timestamp
+        return self._link_pose_w.data
+
+    def _read_link_vel_w(self) -> torch.Tensor:
+        """Link center of mass velocities ``[lin_vel, ang_vel]``. Shape is (num_instances, num_bodies, 6)."""
+        if self._link_vel_w.timestamp < self._timestamp:
+            self.update_articulations_kinematic()
+            self._link_vel_w.data = self.view.get_link_velocities().clone()
+            self._link_vel_w.timestamp = self._timestamp
+        return self._link_vel_w.data
+
+    def _read_coms_b(self) -> torch.Tensor:
+        """Center of mass poses ``[pos, quat]`` in the body frames with quaternion (w, x, y, z).
+        Shape is (num_instances, num_bodies, 7)."""
+        if self._coms_b.timestamp < self._timestamp:
+            coms = self.view.get_coms().to(self.device).clone()
+            coms[..., 3:7] = math_utils.convert_quat(coms[..., 3:7], to="wxyz")
+            self._coms_b.data = coms
+            self._coms_b.timestamp = self._timestamp
+        return self._coms_b.data
+
     ##
     # Names.
     ##
@@ -288,12 +373,8 @@ class ArticulationData:
             self._root_state_dep_warn = True
 
         if self._root_state_w.timestamp < self._timestamp:
-            # read data from simulation
-            pose = self.view.get_root_transforms().clone()
-            pose[:, 3:7] = math_utils.convert_quat(pose[:, 3:7], to="wxyz")
-            velocity = self.view.get_root_velocities()
             # set the buffer data and timestamp
-            self._root_state_w.data = torch.cat((pose, velocity), dim=-1)
+            self._root_state_w.data = torch.cat((self._read_root_pose_w(), self._read_root_vel_w()), dim=-1)
             self._root_state_w.timestamp = self._timestamp
         return self._root_state_w.data
 
@@ -305,10 +386,8 @@ class ArticulationData:
         world.
         """
         if self._root_link_state_w.timestamp < self._timestamp:
-            # read data from simulation
-            pose = self.view.get_root_transforms().clone()
-            pose[:, 3:7] = math_utils.convert_quat(pose[:, 3:7], to="wxyz")
-            velocity = self.view.get_root_velocities().clone()
+            pose = self._read_root_pose_w()
+            velocity = self._read_root_vel_w().clone()
 
             # adjust linear velocity to link from center of mass
             velocity[:, :3] += torch.linalg.cross(
@@ -329,10 +408,9 @@ class ArticulationData:
         orientation of the principle inertia.
         """
         if self._root_com_state_w.timestamp < self._timestamp:
-            # read data from simulation (pose is of link)
-            pose = self.view.get_root_transforms().clone()
-            pose[:, 3:7] = math_utils.convert_quat(pose[:, 3:7], to="wxyz")
-            velocity = self.view.get_root_velocities()
+            # pose is of link
+            pose = self._read_root_pose_w()
+            velocity = self._read_root_vel_w()
 
             # adjust pose to center of mass
             pos, quat = math_utils.combine_frame_transforms(
@@ -361,13 +439,8 @@ class ArticulationData:
             self._body_state_dep_warn = True
 
         if self._body_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation
-            poses = self.view.get_link_transforms().clone()
-            poses[..., 3:7] = math_utils.convert_quat(poses[..., 3:7], to="wxyz")
-            velocities = self.view.get_link_velocities()
             # set the buffer data and timestamp
-            self._body_state_w.data = torch.cat((poses, velocities), dim=-1)
+            self._body_state_w.data = torch.cat((self._read_link_pose_w(), self._read_link_vel_w()), dim=-1)
             self._body_state_w.timestamp = self._timestamp
         return self._body_state_w.data
 
@@ -379,11 +452,8 @@ class ArticulationData:
         The position, quaternion, and linear/angular velocity are of the body's link frame relative to the world.
         """
         if self._body_link_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation
-            pose = self.view.get_link_transforms().clone()
-            pose[..., 3:7] = math_utils.convert_quat(pose[..., 3:7], to="wxyz")
-            velocity = self.view.get_link_velocities()
+            pose = self._read_link_pose_w()
+            velocity = self._read_link_vel_w().clone()
 
             # adjust linear velocity to link from center of mass
             velocity[..., :3] += torch.linalg.cross(
@@ -405,11 +475,9 @@ class ArticulationData:
         principle inertia.
         """
         if self._body_com_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation (pose is of link)
-            pose = self.view.get_link_transforms().clone()
-            pose[..., 3:7] = math_utils.convert_quat(pose[..., 3:7], to="wxyz")
-            velocity = self.view.get_link_velocities()
+            # pose is of link
+            pose = self._read_link_pose_w()
+            velocity = self._read_link_vel_w()
 
             # adjust pose to center of mass
             pos, quat = math_utils.combine_frame_transforms(
@@ -553,10 +621,8 @@ class ArticulationData:
 
         This quantity is the position of the actor frame of the root rigid body relative to the world.
         """
-        if self._body_com_state_w.timestamp < self._timestamp:
-            # read data from simulation (pose is of link)
-            pose = self.view.get_root_transforms()
-            return pose[:, :3]
+        if self._root_link_state_w.timestamp < self._timestamp:
+            return self._read_root_pose_w()[:, :3]
         return self.root_link_state_w[:, :3]
 
     @property
@@ -565,11 +631,8 @@ class ArticulationData:
 
         This quantity is the orientation of the actor frame of the root rigid body.
         """
-        if self._body_com_state_w.timestamp < self._timestamp:
-            # read data from simulation (pose is of link)
-            pose = self.view.get_root_transforms().clone()
-            pose[:, 3:7] = math_utils.convert_quat(pose[:, 3:7], to="wxyz")
-            return pose[:, 3:7]
+        if self._root_link_state_w.timestamp < self._timestamp:
+            return self._read_root_pose_w()[:, 3:7]
         return self.root_link_state_w[:, 3:7]
 
     @property
@@ -642,9 +705,7 @@ class ArticulationData:
         This quantity contains the linear and angular velocities of the root rigid body's center of mass frame relative to the world.
         """
         if self._root_com_state_w.timestamp < self._timestamp:
-            # read data from simulation (pose is of link)
-            velocity = self.view.get_root_velocities()
-            return velocity
+            return self._read_root_vel_w()
         return self.root_com_state_w[:, 7:13]
 
     @property
@@ -654,9 +715,7 @@ class ArticulationData:
         This quantity is the linear velocity of the root rigid body's center of mass frame relative to the world.
         """
         if self._root_com_state_w.timestamp < self._timestamp:
-            # read data from simulation (pose is of link)
-            velocity = self.view.get_root_velocities()
-            return velocity[:, 0:3]
+            return self._read_root_vel_w()[:, 0:3]
         return self.root_com_state_w[:, 7:10]
 
     @property
@@ -666,10 +725,7 @@ class ArticulationData:
         This quantity is the angular velocity of the root rigid body's center of mass frame relative to the world.
         """
         if self._root_com_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation (pose is of link)
-            velocity = self.view.get_root_velocities()
-            return velocity[:, 3:6]
+            return self._read_root_vel_w()[:, 3:6]
         return self.root_com_state_w[:, 10:13]
 
     @property
@@ -741,10 +797,7 @@ class ArticulationData:
         This quantity is the position of the rigid bodies' actor frame relative to the world.
         """
         if self._body_link_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation
-            pose = self.view.get_link_transforms()
-            return pose[..., :3]
+            return self._read_link_pose_w()[..., :3]
         return self._body_link_state_w.data[..., :3]
 
     @property
@@ -754,11 +807,7 @@ class ArticulationData:
         This quantity is the orientation of the rigid bodies' actor frame  relative to the world.
         """
         if self._body_link_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation
-            pose = self.view.get_link_transforms().clone()
-            pose[..., 3:7] = math_utils.convert_quat(pose[..., 3:7], to="wxyz")
-            return pose[..., 3:7]
+            return self._read_link_pose_w()[..., 3:7]
         return self.body_link_state_w[..., 3:7]
 
     @property
@@ -813,10 +862,8 @@ class ArticulationData:
         This quantity contains the linear and angular velocities of the rigid bodies' center of mass frame.
         """
         if self._body_com_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation (velocity is of com)
-            velocity = self.view.get_link_velocities()
-            return velocity
+            # velocity is of com
+            return self._read_link_vel_w()
         return self.body_com_state_w[..., 7:13]
 
     @property
@@ -826,10 +873,7 @@ class ArticulationData:
         This quantity is the linear velocity of the rigid bodies' center of mass frame.
         """
         if self._body_com_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation (velocity is of com)
-            velocity = self.view.get_link_velocities()
-            return velocity[..., 0:3]
+            return self._read_link_vel_w()[..., 0:3]
         return self.body_com_state_w[..., 7:10]
 
     @property
@@ -839,10 +883,7 @@ class ArticulationData:
         This quantity is the angular velocity of the rigid bodies' center of mass frame.
         """
         if self._body_com_state_w.timestamp < self._timestamp:
-            self.update_articulations_kinematic()
-            # read data from simulation (velocity is of com)
-            velocity = self.view.get_link_velocities()
-            return velocity[..., 3:6]
+            return self._read_link_vel_w()[..., 3:6]
         return self.body_com_state_w[..., 10:13]
 
     @property
@@ -851,7 +892,7 @@ class ArticulationData:
 
         This quantity is the center of mass location relative to its body frame.
         """
-        return self.view.get_coms().to(self.device)[..., :3]
+        return self._read_coms_b()[..., :3]
 
     @property
     def com_quat_b(self) -> torch.Tensor:
@@ -859,5 +900,4 @@ class ArticulationData:
 
         This quantity is the orientation of the principles axes of inertia relative to its body frame.
         """
-        quat = self.view.get_coms().to(self.device)[..., 3:7]
-        return math_utils.convert_quat(quat, to="wxyz")
+        return self._read_coms_b()[..., 3:7]
@@ -2,3 +2,5 @@ from .articulation_drive import ArticulationDrive
 from .articulation_drive_cfg import ArticulationDriveCfg
 from .articulation_drive_data import ArticulationDriveData
 from .articulation_drive_process import ArticulationDriveDedicatedProcess
+from .command_channel import Command, CommandAck, CommandChannel
+from .state_stream import JointStateSample, LatestCommandWriter, StateStreamReader
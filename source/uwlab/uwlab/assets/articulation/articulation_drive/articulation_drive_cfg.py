@@ -21,4 +21,10 @@ class ArticulationDriveCfg:
 
     dt = 0.01
 
+    busy_wait: float = 0.0
+    """Time in seconds before each poll deadline that a dedicated drive worker spins instead of sleeping."""
+
+    cpu_affinity: list[int] | None = None
+    """CPUs a dedicated drive worker loop is pinned to. Defaults to None (no pinning)."""
+
     device: str = "cpu"
@@ -7,13 +7,15 @@ from __future__ import annotations
 
 import queue
 import threading
-import time
 import torch
 import torch.multiprocessing as mp
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
+from uwlab.utils.timing import DeadlineScheduler, LoopStatistics
+
 from .articulation_drive import ArticulationDrive
+from .command_channel import CommandChannel
 
 if TYPE_CHECKING:
     from . import ArticulationDriveCfg, ArticulationDriveData
@@ -29,7 +31,8 @@ if TYPE_CHECKING:
 #     How it Works:
 #         On creation, every drive class spawns either a multiprocessing Process or a thread (depending on configuration).
 #         This separate worker loop regularly reads from and writes to the hardware (position, velocity, torque, etc.).
-#         Commands from the main thread (such as setting stiffness or limits) go through a queue and get handled in the worker process.
+#         Commands from the main thread (such as setting stiffness or limits) carry their payload through a CommandChannel,
+#         the worker applies all pending commands once per cycle and acknowledges them in one batch.
 
 #     Benefits:
 #         No single bottleneck from multiple drives all sharing one process.
@@ -56,9 +59,23 @@ if TYPE_CHECKING:
 # might become slow or blocking due to heavy hardware calls or large simulations.
 
 
+# setters the worker accepts through the command channel
+_DRIVE_COMMANDS = (
+    "set_dof_stiffnesses",
+    "set_dof_armatures",
+    "set_dof_frictions",
+    "set_dof_dampings",
+    "set_dof_limits",
+)
+
+
 class ArticulationDriveDedicatedProcess(ArticulationDrive):
     def __init__(self, cfg: ArticulationDriveCfg):
         self._dt = cfg.dt
+        self._busy_wait = cfg.busy_wait
+        self._cpu_affinity = cfg.cpu_affinity
+        # recorded by the worker loop, allocated before the worker starts so both sides share the memory
+        self.loop_statistics = LoopStatistics(self._dt)
         if cfg.use_multiprocessing:
             self.manager = mp.Manager()
             self.init_event = mp.Event()
@@ -75,6 +92,7 @@ class ArticulationDriveDedicatedProcess(ArticulationDrive):
             self.ack_queue = queue.Queue()
             self.shared_data: ArticulationDriveData = {}  # type: ignore
             self._proc = threading.Thread(target=self._run, daemon=True, args=(self.init_event,))
+        self.command_channel = CommandChannel(self.cmd_queue, self.ack_queue)
 
     """
     Below method should be implemented by the child class
@@ -122,7 +140,10 @@ class ArticulationDriveDedicatedProcess(ArticulationDrive):
     def _run(self, init_event: threading.Event):
         init_event.set()
 
-        next_poll_time = time.time() + self._dt
+        scheduler = DeadlineScheduler(
+            self._dt, busy_wait=self._busy_wait, cpu_affinity=self._cpu_affinity, statistics=self.loop_statistics
+        )
+        scheduler.start()
         while True:
             if self.shared_data["close"]:
                 break
@@ -130,54 +151,54 @@ class ArticulationDriveDedicatedProcess(ArticulationDrive):
             self._process_blocking_commands()
 
             if self.shared_data["is_running"]:
-                now = time.time()
-                if now >= next_poll_time:
-                    next_poll_time = now + self._dt
-                    # 1) read pos/vel from hardware
-                    pos, vel, eff = self.read_dof_states()
-                    self.shared_data["pos"][:] = pos
-                    self.shared_data["vel"][:] = vel
-                    self.shared_data["torque"][:] = eff
-
-                    # 2) write target to hardware and kinematic
-                    self.write_dof_targets(
-                        pos_target=self.shared_data["pos_target"],
-                        vel_target=self.shared_data["vel_target"],
-                        eff_target=self.shared_data["eff_target"],
-                    )
-                    # Sleep till next poll time
-                    time.sleep(max(next_poll_time - time.time(), 0))
-                else:
-                    # now is less than next poll time, sleep till next poll time
-                    time.sleep(next_poll_time - now)
+                scheduler.wait()
+                # 1) read pos/vel from hardware
+                pos, vel, eff = self.read_dof_states()
+                self.shared_data["pos"][:] = pos
+                self.shared_data["vel"][:] = vel
+                self.shared_data["torque"][:] = eff
+
+                # 2) write target to hardware and kinematic
+                self.write_dof_targets(
+                    pos_target=self.shared_data["pos_target"],
+                    vel_target=self.shared_data["vel_target"],
+                    eff_target=self.shared_data["eff_target"],
+                )
             else:
-                # If not running, keep sleeping
-                time.sleep(self._dt)
+                # If not running, wait for commands instead of sleeping through them and restart pacing on resume
+                scheduler.reset()
+                self._process_blocking_commands(timeout=self._dt)
 
         # Done, disconnect hardware
         self.close()
         print("DynamixelWorker: Child process stopped")
 
-    def _process_blocking_commands(self):
-        if not self.cmd_queue.empty():
-            cmd = self.cmd_queue.get()
-            match cmd:
-                case "set_dof_stiffnesses":
-                    self.set_dof_stiffnesses(self.shared_data["dof_stiffness"])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_stiffnesses"})
-                case "set_dof_armatures":
-                    self.set_dof_armatures(self.shared_data["dof_armatures"])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_armatures"})
-                case "set_dof_frictions":
-                    self.set_dof_frictions(self.shared_data["dof_frictions"])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_frictions"})
-                case "set_dof_dampings":
-                    self.set_dof_dampings(self.shared_data["dof_damping"])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_dampings"})
-                case "set_dof_limits":
-                    self.set_dof_limits(self.shared_data["dof_limits"])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_limits"})
+    def _process_blocking_commands(self, timeout: float | None = None):
+        for command in self.command_channel.drain(timeout):
+            if command.name not in _DRIVE_COMMANDS:
+                self.command_channel.ack(command, "ERROR", f"Unknown command '{command.name}'")
+                continue
+            try:
+                getattr(self, command.name)(command.payload)
+                self.command_channel.ack(command)
+            except Exception as e:
+                self.command_channel.ack(command, "ERROR", repr(e))
+        self.command_channel.publish_acks()
 
     """
     Below methods are for users to call
     """
+
+    def submit_command(self, name: str, payload: torch.Tensor) -> int:
+        """Queue ``name`` (one of the ``set_dof_*`` setters) with its payload for the worker, without waiting."""
+        return self.command_channel.submit(name, payload.cpu().clone())
+
+    def sync_commands(self, timeout: float | None = None):
+        """Wait until the worker has applied every submitted command and report the ones that failed."""
+        for ack in self.command_channel.wait(timeout):
+            if ack.status != "OK":
+                print(f"Warning: Child returned ack={ack}")
+
+    def get_loop_statistics(self) -> dict[str, float]:
+        """Timing statistics of the worker poll loop, see :meth:`uwlab.utils.timing.LoopStatistics.summary`."""
+        return self.loop_statistics.summary()
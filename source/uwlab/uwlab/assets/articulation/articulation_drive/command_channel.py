@@ -0,0 +1,152 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import queue
+import time
+import torch
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Command:
+    """A request from the environment to a worker, carrying its own payload."""
+
+    seq: int
+    """Sequence number assigned by the submitting side."""
+
+    name: str
+    """Name of the command, e.g. ``"set_dof_stiffnesses"``."""
+
+    payload: torch.Tensor | None = None
+    """Data the command applies."""
+
+    indices: torch.Tensor | None = None
+    """Articulation instances the command applies to, i.e. the rows of :attr:`payload` that are used. None
+    addresses all instances."""
+
+    coalesced: list[int] = field(default_factory=list)
+    """Sequence numbers of earlier commands with the same name that this command superseded."""
+
+
+@dataclass
+class CommandAck:
+    """Result of a processed command."""
+
+    seq: int
+    name: str
+    status: str = "OK"
+    message: str = ""
+
+
+class CommandChannel:
+    """Command channel between an environment-side client and a worker loop.
+
+    The client submits :class:`Command` objects without waiting for them. The worker drains *all* pending commands
+    once per cycle, coalesces commands with the same name and instance indices so that only the most recent payload
+    is applied, and
+    answers the whole cycle with a single batch of :class:`CommandAck`. Superseded commands are acknowledged with
+    the status of the command that replaced them. The client only blocks in :meth:`wait`, e.g. before reading back
+    a property, so a burst of setters during a reset completes within one worker cycle.
+
+    Args:
+        cmd_queue: Queue carrying commands from the client to the worker.
+        ack_queue: Queue carrying ack batches from the worker to the client.
+    """
+
+    def __init__(self, cmd_queue: Any, ack_queue: Any):
+        self.cmd_queue = cmd_queue
+        self.ack_queue = ack_queue
+        # client side
+        self._next_seq = 0
+        self._pending: set[int] = set()
+        # worker side
+        self._ack_batch: list[CommandAck] = []
+
+    """
+    Client side.
+    """
+
+    @property
+    def num_pending(self) -> int:
+        """Number of submitted commands that have not been acknowledged yet."""
+        return len(self._pending)
+
+    def submit(self, name: str, payload: torch.Tensor | None = None, indices: torch.Tensor | None = None) -> int:
+        """Queue a command for the worker and return its sequence number without waiting."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._pending.add(seq)
+        self.cmd_queue.put(Command(seq=seq, name=name, payload=payload, indices=indices))
+        return seq
+
+    def wait(self, timeout: float | None = None) -> list[CommandAck]:
+        """Block until all submitted commands are acknowledged.
+
+        Args:
+            timeout: Maximum time to wait in seconds. Waits indefinitely if None.
+
+        Returns:
+            The acknowledgements received while waiting.
+
+        Raises:
+            TimeoutError: If commands are still pending after ``timeout``.
+        """
+        acks: list[CommandAck] = []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                batch: list[CommandAck] = self.ack_queue.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"{len(self._pending)} command(s) not acknowledged within {timeout} s.")
+            for ack in batch:
+                self._pending.discard(ack.seq)
+            acks.extend(batch)
+        return acks
+
+    """
+    Worker side.
+    """
+
+    def drain(self, timeout: float | None = None) -> list[Command]:
+        """Take every pending command, keeping only the latest command per name and instance indices.
+
+        Args:
+            timeout: If given, block up to ``timeout`` seconds for the first command, so an idle worker reacts to
+                commands immediately instead of sleeping through them. Otherwise return immediately.
+
+        Returns:
+            The surviving commands, in the order of their last submission.
+        """
+        commands: dict[tuple, Command] = {}
+        block = timeout is not None
+        while True:
+            try:
+                command: Command = self.cmd_queue.get(timeout=timeout) if block else self.cmd_queue.get_nowait()
+            except queue.Empty:
+                break
+            block = False
+            key = (command.name, None if command.indices is None else tuple(command.indices.tolist()))
+            previous = commands.pop(key, None)
+            if previous is not None:
+                command.coalesced.extend(previous.coalesced)
+                command.coalesced.append(previous.seq)
+            commands[key] = command
+        return list(commands.values())
+
+    def ack(self, command: Command, status: str = "OK", message: str = ""):
+        """Record the result of ``command`` (and of the commands it superseded) for the next batch."""
+        for seq in command.coalesced:
+            self._ack_batch.append(CommandAck(seq=seq, name=command.name, status=status, message=message))
+        self._ack_batch.append(CommandAck(seq=command.seq, name=command.name, status=status, message=message))
+
+    def publish_acks(self):
+        """Send all recorded acknowledgements as one batch."""
+        if self._ack_batch:
+            self.ack_queue.put(self._ack_batch)
+            self._ack_batch = []
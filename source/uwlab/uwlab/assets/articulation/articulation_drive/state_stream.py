@@ -0,0 +1,169 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import threading
+import time
+import torch
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class JointStateSample:
+    """Joint state of a robot at one instant."""
+
+    timestamp: float
+    """Time of reception on the :func:`time.monotonic` clock, in seconds."""
+
+    pos: torch.Tensor
+    """Joint positions of shape (1, num_joints)."""
+
+    vel: torch.Tensor
+    """Joint velocities of shape (1, num_joints)."""
+
+    eff: torch.Tensor
+    """Joint efforts of shape (1, num_joints)."""
+
+
+class StateStreamReader:
+    """Receives joint states in a background thread and keeps the latest one.
+
+    Hardware that streams its state (or that can only be polled with blocking calls) is read by a daemon thread
+    calling ``receive`` in a loop, so the control loop picks up the newest :class:`JointStateSample` with
+    :meth:`latest` without ever waiting on the network. If ``receive`` raises, ``reconnect`` is called (if given)
+    before receiving again.
+
+    Args:
+        receive: Blocking callable returning the next sample, or None if nothing was received.
+        reconnect: Callable re-establishing the connection after ``receive`` failed. Defaults to None.
+        name: Name of the background thread.
+        retry_interval: Seconds to wait after a failed receive. Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        receive: Callable[[], JointStateSample | None],
+        reconnect: Callable[[], Any] | None = None,
+        name: str = "state_stream",
+        retry_interval: float = 0.1,
+    ):
+        self._receive = receive
+        self._reconnect = reconnect
+        self._retry_interval = retry_interval
+        self._latest: JointStateSample | None = None
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.num_samples = 0
+        """Number of samples received so far."""
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def latest(self) -> JointStateSample | None:
+        """The most recent sample without waiting, None if nothing was received yet."""
+        return self._latest
+
+    def wait_for_sample(self, timeout: float | None = None, newer_than: float = -float("inf")) -> JointStateSample:
+        """Block until a sample with a timestamp after ``newer_than`` is available.
+
+        Raises:
+            TimeoutError: If no such sample arrives within ``timeout`` seconds.
+        """
+        with self._condition:
+            ready = self._condition.wait_for(
+                lambda: self._latest is not None and self._latest.timestamp > newer_than, timeout
+            )
+        if not ready:
+            raise TimeoutError(f"No joint state received within {timeout} s.")
+        return self._latest  # type: ignore
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                sample = self._receive()
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                print(f"Warning: State stream receive failed with {e!r}, reconnecting.")
+                time.sleep(self._retry_interval)
+                if self._reconnect is not None:
+                    try:
+                        self._reconnect()
+                    except Exception as reconnect_error:
+                        print(f"Warning: State stream reconnect failed with {reconnect_error!r}.")
+                continue
+            if sample is None:
+                continue
+            with self._condition:
+                self._latest = sample
+                self.num_samples += 1
+                self._condition.notify_all()
+
+
+class LatestCommandWriter:
+    """Sends commands from a background thread, always the most recent one.
+
+    :meth:`submit` hands a command over and returns immediately. If the hardware is still busy with the previous
+    command, older pending commands are replaced, so a slow link drops stale targets instead of queueing them up.
+
+    Args:
+        send: Blocking callable sending one command.
+        name: Name of the background thread.
+    """
+
+    def __init__(self, send: Callable[[Any], Any], name: str = "command_writer"):
+        self._send = send
+        self._pending: Any = None
+        self._has_pending = False
+        self._condition = threading.Condition()
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.num_dropped = 0
+        """Number of commands replaced by a newer one before they were sent."""
+        self.last_send_duration = 0.0
+        """Duration in seconds of the last send."""
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0):
+        with self._condition:
+            self._stop = True
+            self._condition.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def submit(self, command: Any):
+        with self._condition:
+            if self._has_pending:
+                self.num_dropped += 1
+            self._pending = command
+            self._has_pending = True
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._has_pending or self._stop)
+                if self._stop:
+                    return
+                command = self._pending
+                self._pending = None
+                self._has_pending = False
+            start = time.monotonic()
+            try:
+                self._send(command)
+            except Exception as e:
+                print(f"Warning: Sending command failed with {e!r}.")
+            self.last_send_duration = time.monotonic() - start
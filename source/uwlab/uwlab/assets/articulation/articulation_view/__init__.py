@@ -5,4 +5,4 @@
 
 from ..articulation_drive import ArticulationDrive, ArticulationDriveCfg
 from .articulation_view import ArticulationView, SharedDataSchema
-from .articulation_view_cfg import ArticulationViewCfg, BulletArticulationViewCfg
+from .articulation_view_cfg import ArticulationViewCfg, BulletArticulationViewCfg, DummyModeCfg
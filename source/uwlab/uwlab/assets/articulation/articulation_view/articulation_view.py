@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import time
 import torch
 from abc import abstractmethod
 from typing import List, TypedDict
@@ -264,6 +265,52 @@ class ArticulationView:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_jacobians(self) -> torch.Tensor:
+        """
+        Get the geometric Jacobians of the links for each articulation instance, in world frame.
+
+        Follows the PhysX tensor API convention: for fixed-base articulations the root link is excluded.
+
+        Returns:
+            torch.Tensor: A tensor of shape (count, num_bodies - 1, 6, dof_count) for fixed-base articulations,
+                          rows ordered as [vx, vy, vz, wx, wy, wz].
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_generalized_mass_matrices(self) -> torch.Tensor:
+        """
+        Get the joint space mass matrices for each articulation instance.
+
+        Returns:
+            torch.Tensor: A tensor of shape (count, dof_count, dof_count).
+        """
+        raise NotImplementedError
+
+    def get_dof_states_stamped(self) -> tuple[float, torch.Tensor, torch.Tensor]:
+        """
+        Get the joint positions and velocities together with the time they were read.
+
+        Views that do not know when their state was measured report the time of the call.
+
+        Returns:
+            tuple[float, torch.Tensor, torch.Tensor]: The read time on the :func:`time.monotonic` clock in seconds,
+                and the joint positions and velocities of shape (count, dof_count).
+        """
+        return time.monotonic(), self.get_dof_positions(), self.get_dof_velocities()
+
+    def get_loop_statistics(self) -> dict[str, float]:
+        """
+        Get timing statistics of the loop that polls the articulation, e.g. wake-up latency, jitter and overruns.
+
+        Views that are not driven by a periodic loop have no statistics.
+
+        Returns:
+            dict[str, float]: Statistic name to value, see :meth:`uwlab.utils.timing.LoopStatistics.summary`.
+        """
+        return {}
+
     @abstractmethod
     def get_dof_positions(self) -> torch.Tensor:
         """
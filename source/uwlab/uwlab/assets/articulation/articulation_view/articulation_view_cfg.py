@@ -26,11 +26,47 @@ class ArticulationViewCfg:
     device: str = "cpu"
 
 
+@configclass
+class DummyModeCfg:
+    """Configuration of the simulated hardware a :class:`BulletArticulationView` tracks its targets with in dummy mode.
+
+    See :class:`~uwlab.assets.articulation.articulation_view.utils.dummy_dynamics.DummyArticulationDynamics`.
+    """
+
+    actuator_time_constant: float = 0.0
+    """Time constant in seconds of the first-order lag between received and applied targets. Defaults to 0.0 (none)."""
+
+    latency: float = 0.0
+    """Delay in seconds between sending the targets and them reaching the actuators, rounded to whole polls.
+    Defaults to 0.0."""
+
+    packet_loss: float = 0.0
+    """Probability that an instance misses the targets of a poll and keeps the previous ones. Defaults to 0.0."""
+
+    substeps: int = 1
+    """Number of integration steps per poll. Defaults to 1."""
+
+    min_joint_inertia: float = 1e-4
+    """Lower bound of the joint inertia used for integration, guards joints of massless links. Defaults to 1e-4."""
+
+    seed: int | None = None
+    """Seed of the packet loss draws. Defaults to None (random)."""
+
+
 @configclass
 class BulletArticulationViewCfg(ArticulationViewCfg):
     class_type: Callable[..., BulletArticulationView] = BulletArticulationView
 
-    drive_cfg: ArticulationDriveCfg = MISSING  # type: ignore
+    drive_cfg: ArticulationDriveCfg | list[ArticulationDriveCfg] = MISSING  # type: ignore
+    """Drive of the robot, or one drive per instance when the view manages several identical robots.
+
+    The drives of all instances are polled concurrently from a thread pool. Not used in dummy mode."""
+
+    count: int = 1
+    """Number of identical robot instances managed by the view. Defaults to 1.
+
+    The kinematics of all instances are evaluated as one batch. In real mode, :attr:`drive_cfg` must hold one drive
+    per instance. The debug visualization only shows the first instance."""
 
     urdf: str = MISSING  # type: ignore
 
@@ -43,5 +79,19 @@ class BulletArticulationViewCfg(ArticulationViewCfg):
     sync mode. If the real environment are run independently, this field is not necessary."""
 
     dummy_mode: bool = False
+    """Run without hardware, tracking the targets with the simulated joints configured in :attr:`dummy_cfg`."""
+
+    dummy_cfg: DummyModeCfg = DummyModeCfg()
+    """Simulated hardware used in dummy mode."""
 
     dt: float = 0.02
+    """Period of the worker poll loop in seconds. Polls are paced on absolute deadlines, so they do not drift."""
+
+    busy_wait: float = 0.0
+    """Time in seconds before each poll deadline that the worker spins instead of sleeping. Defaults to 0.0.
+
+    A value of a few hundred microseconds removes most of the wake-up latency of the OS scheduler at the cost of
+    keeping one CPU busy for that fraction of every period."""
+
+    cpu_affinity: list[int] | None = None
+    """CPUs the worker poll loop is pinned to. Defaults to None (no pinning)."""
@@ -10,46 +10,60 @@ import threading
 import time
 import torch
 import torch.multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from uwlab.utils.timing import DeadlineScheduler, LoopStatistics
+
+from ..articulation_drive.command_channel import CommandChannel
 from . import ArticulationView
 from .utils.articulation_kinematics import BulletArticulationKinematics
+from .utils.dummy_dynamics import DummyArticulationDynamics
+from .utils.shared_data import SharedArticulationData
 
 if TYPE_CHECKING:
     from ..articulation_data import ArticulationData
     from ..articulation_drive import ArticulationDrive
-    from . import BulletArticulationViewCfg, SharedDataSchema
-
-
-def init_shared_data(count: int, ndof: int, nbodies: int) -> SharedDataSchema:
-    data: SharedDataSchema = {
-        "is_running": False,
-        "close": False,
-        "link_names": [],
-        "dof_names": [],
-        "dof_types": [],
-        "pos": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "vel": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "torque": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "pos_target": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "vel_target": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "eff_target": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "link_transforms": torch.zeros(count, nbodies, 7, device="cpu").share_memory_(),
-        "link_velocities": torch.zeros(count, nbodies, 6, device="cpu").share_memory_(),
-        "link_mass": torch.zeros(count, nbodies, device="cpu").share_memory_(),
-        "link_inertia": torch.zeros(count, nbodies, 9, device="cpu").share_memory_(),
-        "link_coms": torch.zeros(count, nbodies, 7, device="cpu").share_memory_(),
-        "mass_matrix": torch.zeros(count, ndof, ndof, device="cpu").share_memory_(),
-        "dof_stiffness": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "dof_armatures": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "dof_frictions": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "dof_damping": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "dof_limits": torch.zeros(count, ndof, 2, device="cpu").share_memory_(),
-        "dof_max_forces": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "dof_max_velocity": torch.zeros(count, ndof, device="cpu").share_memory_(),
-        "jacobians": torch.zeros(count, nbodies, 6, ndof, device="cpu").share_memory_(),
+    from . import BulletArticulationViewCfg
+
+
+# commands accepted by the worker and the shared field their payload is published to once applied
+_COMMAND_FIELDS: dict[str, str] = {
+    "set_dof_stiffnesses": "dof_stiffness",
+    "set_dof_armatures": "dof_armatures",
+    "set_dof_frictions": "dof_frictions",
+    "set_dof_dampings": "dof_damping",
+    "set_dof_limits": "dof_limits",
+}
+
+
+def init_shared_data(count: int, ndof: int, nbodies: int) -> SharedArticulationData:
+    # "state" and "properties" fields are published by the worker, "command" fields are written by the environment
+    fields: dict[str, tuple[tuple[int, ...], str]] = {
+        "pos": ((count, ndof), "state"),
+        "vel": ((count, ndof), "state"),
+        "torque": ((count, ndof), "state"),
+        "pos_target": ((count, ndof), "command"),
+        "vel_target": ((count, ndof), "command"),
+        "eff_target": ((count, ndof), "command"),
+        "link_transforms": ((count, nbodies, 7), "state"),
+        "link_velocities": ((count, nbodies, 6), "state"),
+        "link_mass": ((count, nbodies), "state"),
+        "link_inertia": ((count, nbodies, 9), "state"),
+        "link_coms": ((count, nbodies, 7), "state"),
+        "mass_matrix": ((count, ndof, ndof), "state"),
+        "dof_stiffness": ((count, ndof), "properties"),
+        "dof_armatures": ((count, ndof), "properties"),
+        "dof_frictions": ((count, ndof), "properties"),
+        "dof_damping": ((count, ndof), "properties"),
+        "dof_limits": ((count, ndof, 2), "properties"),
+        "dof_max_forces": ((count, ndof), "state"),
+        "dof_max_velocity": ((count, ndof), "state"),
+        "jacobians": ((count, nbodies, 6, ndof), "state"),
     }
-    return data
+    return SharedArticulationData(
+        fields, flags=["is_running", "close"], names=["link_names", "dof_names", "dof_types"]
+    )
 
 
 class BulletArticulationView(ArticulationView):
@@ -73,40 +87,59 @@ class BulletArticulationView(ArticulationView):
         self._isaac_joint_names = cfg.isaac_joint_names
 
         self._dummy_mode = cfg.dummy_mode
+        self._dummy_cfg = cfg.dummy_cfg
+        self._count = cfg.count
+        self._busy_wait = cfg.busy_wait
+        self._cpu_affinity = cfg.cpu_affinity
+        # recorded by the worker loop, allocated before the worker starts so both sides share the memory
+        self.loop_statistics = LoopStatistics(self._dt)
 
         if cfg.use_multiprocessing:
-            self.manager = mp.Manager()
-            self.init_event = mp.Event()
+            # the shared data is allocated by the child in shared memory and handed over once through init_queue
+            self.init_queue = mp.Queue()
             self.cmd_queue = mp.Queue()
             self.ack_queue = mp.Queue()
-            # Create a shared dictionary to communicate with the child process
-            self.shared_data: SharedDataSchema = self.manager.dict()  # type: ignore
-            self._proc = mp.Process(target=self._run, args=(self.init_event,))
+            self._proc = mp.Process(target=self._run, args=(self.init_queue,))
         else:
-            # Threading shares memory within the same process, so no need for mp.Manager
-            self.manager = None
-            self.init_event = threading.Event()
+            self.init_queue = queue.Queue()
             self.cmd_queue = queue.Queue()
             self.ack_queue = queue.Queue()
-            self.shared_data: SharedDataSchema = {}  # type: ignore
-            self._proc = threading.Thread(target=self._run, daemon=True, args=(self.init_event,))
+            self._proc = threading.Thread(target=self._run, daemon=True, args=(self.init_queue,))
+        self.command_channel = CommandChannel(self.cmd_queue, self.ack_queue)
 
         # store data that will never be retrieved from kinematic articulation
         self.drive_cfg = cfg.drive_cfg
+        self.drive_cfgs = cfg.drive_cfg if isinstance(cfg.drive_cfg, (list, tuple)) else [cfg.drive_cfg]
+        if not self._dummy_mode and len(self.drive_cfgs) != self._count:
+            raise ValueError(
+                f"BulletArticulationView manages {self._count} instance(s) but {len(self.drive_cfgs)} drive config(s)"
+                " were given. Provide one drive config per instance."
+            )
 
-        # Spawn the child process
+        # Spawn the child process and wait for its shared data
         self._proc.start()
-        self.init_event.wait()
+        self.shared_data: SharedArticulationData = self.init_queue.get()
 
-    def _run(self, init_event: threading.Event):
+    def _run(self, init_queue: queue.Queue):
         # Loop until closed
-        _kinematic = BulletArticulationKinematics(self._urdf, True, self._debug_visualize, dt=self._dt, device="cpu")
-        self.shared_data.update(init_shared_data(self.count, _kinematic.num_dof, _kinematic.num_links))
+        # the kinematics of all instances are evaluated as one batch
+        _kinematic = BulletArticulationKinematics(
+            self._urdf, True, self._debug_visualize, dt=self._dt, device="cpu", count=self.count
+        )
+        self.shared_data = init_shared_data(self.count, _kinematic.num_dof, _kinematic.num_links)
         self._populate_shared_data(_kinematic)
-        _drive: ArticulationDrive = None  # type: ignore
-        if not self._dummy_mode:
-            _drive = self.drive_cfg.class_type(cfg=self.drive_cfg)
-            _drive_joint_names = _drive.ordered_joint_names
+        _drives: list[ArticulationDrive] = []
+        _dummy: DummyArticulationDynamics | None = None
+        # hardware I/O of several instances is spread across a thread pool so blocking calls overlap
+        self._drive_pool: ThreadPoolExecutor | None = None
+        if self._dummy_mode:
+            _dummy = DummyArticulationDynamics(self._dummy_cfg, _kinematic, self._dt)
+        else:
+            _drives = [drive_cfg.class_type(cfg=drive_cfg) for drive_cfg in self.drive_cfgs]
+            if len(_drives) > 1:
+                self._drive_pool = ThreadPoolExecutor(max_workers=len(_drives), thread_name_prefix="drive")
+            # all instances are the same robot, so they share one joint ordering
+            _drive_joint_names = _drives[0].ordered_joint_names
             self._isaac_to_real_idx = [
                 self._isaac_joint_names.index(name) for name in _drive_joint_names if name in self._isaac_joint_names
             ]
@@ -123,118 +156,157 @@ class BulletArticulationView(ArticulationView):
                 _drive_joint_names.index(name) for name in self.shared_data["dof_names"] if name in _drive_joint_names
             ]
 
-        self._isaac_to_bullet_idx = [
-            self._isaac_joint_names.index(name)
-            for name in self.shared_data["dof_names"]
-            if name in self._isaac_joint_names
-        ]
-        self._bullet_to_isaac_idx = [
-            self.shared_data["dof_names"].index(name)
-            for name in self._isaac_joint_names
-            if name in self.shared_data["dof_names"]
-        ]
-
-        init_event.set()
+        init_queue.put(self.shared_data)
 
-        next_poll_time = time.time() + self._dt
+        scheduler = DeadlineScheduler(
+            self._dt, busy_wait=self._busy_wait, cpu_affinity=self._cpu_affinity, statistics=self.loop_statistics
+        )
+        scheduler.start()
         while True:
             if self.shared_data["close"]:
                 break
 
-            self._process_blocking_commands(_kinematic, _drive)
+            self._process_blocking_commands(_kinematic, _drives)
 
             if self.shared_data["is_running"]:
-                now = time.time()
-                if now >= next_poll_time:
-                    next_poll_time = now + self._dt
-                    if self._dummy_mode:
-                        self._read_write_dummy_states()
-                        _kinematic.set_dof_states(
-                            self.shared_data["pos"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["vel"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["torque"][:, self._isaac_to_bullet_idx],
-                        )
-
-                        self.shared_data["link_coms"][:] = _kinematic.get_link_coms()
-                        self.shared_data["link_transforms"][:] = _kinematic.get_link_transforms()
-                        self.shared_data["link_velocities"][:] = _kinematic.get_link_velocities()
-                    else:
-                        # 1) read pos/vel from hardware
-                        pos, vel, eff = _drive.read_dof_states()
-                        self.shared_data["pos"][:, self._real_to_isaac_idx] = pos[:, self._real_to_isaac_idx]
-                        self.shared_data["vel"][:, self._real_to_isaac_idx] = vel[:, self._real_to_isaac_idx]
-                        self.shared_data["torque"][:, self._real_to_isaac_idx] = eff[:, self._real_to_isaac_idx]
-
-                        _kinematic.set_dof_states(
-                            self.shared_data["pos"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["vel"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["torque"][:, self._isaac_to_bullet_idx],
-                        )
-
-                        self.shared_data["link_coms"][:] = _kinematic.get_link_coms()
-                        self.shared_data["link_transforms"][:] = _kinematic.get_link_transforms()
-                        self.shared_data["link_velocities"][:] = _kinematic.get_link_velocities()
-
-                        # 2) write target to hardware and kinematic
-                        _kinematic.set_dof_targets(
-                            self.shared_data["pos_target"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["vel_target"][:, self._isaac_to_bullet_idx],
-                            self.shared_data["eff_target"][:, self._isaac_to_bullet_idx],
-                        )
-                        _drive.write_dof_targets(
-                            pos_target=self.shared_data["pos_target"][:, self._isaac_to_real_idx],
-                            vel_target=self.shared_data["vel_target"][:, self._isaac_to_real_idx],
-                            eff_target=self.shared_data["eff_target"][:, self._isaac_to_real_idx],
-                        )
-                        if self._debug_visualize:
-                            _kinematic.render()
-                    # Sleep till next poll time
-                    time.sleep(max(next_poll_time - time.time(), 0))
+                scheduler.wait()
+                pos_target, vel_target, eff_target = self.shared_data.read_many(
+                    "pos_target", "vel_target", "eff_target"
+                )
+                if self._dummy_mode:
+                    # the simulated joints work in the joint order of the kinematics
+                    pos, vel, eff = _dummy.step(
+                        pos_target[:, self._isaac_to_bullet_idx],
+                        vel_target[:, self._isaac_to_bullet_idx],
+                        eff_target[:, self._isaac_to_bullet_idx],
+                    )
+                    self._publish_states(
+                        _kinematic,
+                        pos[:, self._bullet_to_isaac_idx],
+                        vel[:, self._bullet_to_isaac_idx],
+                        eff[:, self._bullet_to_isaac_idx],
+                        stamp=time.monotonic(),
+                    )
                 else:
-                    # now is less than next poll time, sleep till next poll time
-                    time.sleep(next_poll_time - now)
+                    # 1) read pos/vel from hardware
+                    pos, vel, eff = self._read_drive_states(_drives)
+                    read_time = time.monotonic()
+                    # only the worker writes the state region, so its fields can be read without the lock
+                    dof_pos = self.shared_data["pos"].clone()
+                    dof_vel = self.shared_data["vel"].clone()
+                    dof_eff = self.shared_data["torque"].clone()
+                    dof_pos[:, self._real_to_isaac_idx] = pos[:, self._real_to_isaac_idx]
+                    dof_vel[:, self._real_to_isaac_idx] = vel[:, self._real_to_isaac_idx]
+                    dof_eff[:, self._real_to_isaac_idx] = eff[:, self._real_to_isaac_idx]
+                    self._publish_states(_kinematic, dof_pos, dof_vel, dof_eff, stamp=read_time)
+
+                    # 2) write target to hardware and kinematic
+                    _kinematic.set_dof_targets(
+                        pos_target[:, self._isaac_to_bullet_idx],
+                        vel_target[:, self._isaac_to_bullet_idx],
+                        eff_target[:, self._isaac_to_bullet_idx],
+                    )
+                    self._write_drive_targets(
+                        _drives,
+                        pos_target[:, self._isaac_to_real_idx],
+                        vel_target[:, self._isaac_to_real_idx],
+                        eff_target[:, self._isaac_to_real_idx],
+                    )
+                    if self._debug_visualize:
+                        _kinematic.render()
             else:
-                # If not running, keep sleeping
-                time.sleep(self._dt)
+                # If not running, wait for commands instead of sleeping through them and restart pacing on resume
+                scheduler.reset()
+                self._process_blocking_commands(_kinematic, _drives, timeout=self._dt)
 
         # Done, disconnect hardware
-        _drive.close()
+        for _drive in _drives:
+            _drive.close()
+        if self._drive_pool is not None:
+            self._drive_pool.shutdown()
         _kinematic.close()
         print("DynamixelWorker: Child process stopped")
 
-    def _process_blocking_commands(self, _kinematic: BulletArticulationKinematics, _drive: ArticulationDrive):
-        if not self.cmd_queue.empty():
-            cmd = self.cmd_queue.get()
-            match cmd:
-                case "set_dof_stiffnesses":
-                    _kinematic.set_dof_stiffnesses(self.shared_data["dof_stiffness"][:, self._isaac_to_bullet_idx])
-                    if not self._dummy_mode:
-                        _drive.set_dof_stiffnesses(self.shared_data["dof_stiffness"][:, self._bullet_to_real_idx])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_stiffnesses"})
-                case "set_dof_armatures":
-                    _kinematic.set_dof_armatures(self.shared_data["dof_armatures"][:, self._isaac_to_bullet_idx])
-                    if not self._dummy_mode:
-                        _drive.set_dof_armatures(self.shared_data["dof_armatures"][:, self._bullet_to_real_idx])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_armatures"})
-                case "set_dof_frictions":
-                    _kinematic.set_dof_frictions(self.shared_data["dof_frictions"][:, self._isaac_to_bullet_idx])
-                    if not self._dummy_mode:
-                        _drive.set_dof_frictions(self.shared_data["dof_frictions"][:, self._bullet_to_real_idx])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_frictions"})
-                case "set_dof_dampings":
-                    _kinematic.set_dof_dampings(self.shared_data["dof_damping"][:, self._isaac_to_bullet_idx])
-                    if not self._dummy_mode:
-                        _drive.set_dof_dampings(self.shared_data["dof_damping"][:, self._bullet_to_real_idx])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_dampings"})
-                case "set_dof_limits":
-                    _kinematic.set_dof_limits(self.shared_data["dof_limits"][:, self._isaac_to_bullet_idx])
-                    if not self._dummy_mode:
-                        _drive.set_dof_limits(self.shared_data["dof_limits"][:, self._bullet_to_real_idx])
-                    self.ack_queue.put({"status": "OK", "command": "set_dof_limits"})
+    def _process_blocking_commands(
+        self, _kinematic: BulletArticulationKinematics, _drives: list[ArticulationDrive], timeout: float | None = None
+    ):
+        commands = self.command_channel.drain(timeout)
+        if not commands:
+            return
+        with self.shared_data.write("properties"):
+            for command in commands:
+                if command.name not in _COMMAND_FIELDS:
+                    self.command_channel.ack(command, "ERROR", f"Unknown command '{command.name}'")
+                    continue
+                try:
+                    # payloads hold all instances in isaac joint order, only the addressed rows are applied
+                    rows = slice(None) if command.indices is None else command.indices
+                    payload = command.payload[rows]
+                    getattr(_kinematic, command.name)(payload[:, self._isaac_to_bullet_idx], indices=rows)
+                    if _drives:
+                        instances = range(self.count) if command.indices is None else command.indices.tolist()
+                        for row, instance in enumerate(instances):
+                            getattr(_drives[instance], command.name)(payload[row : row + 1, self._isaac_to_real_idx])
+                    self.shared_data[_COMMAND_FIELDS[command.name]][rows] = payload
+                    self.command_channel.ack(command)
+                except Exception as e:
+                    self.command_channel.ack(command, "ERROR", repr(e))
+        self.command_channel.publish_acks()
+
+    def _read_drive_states(self, _drives: list[ArticulationDrive]) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Read the dof states of all instances, concurrently when there is more than one drive."""
+        if self._drive_pool is None:
+            states = [_drive.read_dof_states() for _drive in _drives]
+        else:
+            states = list(self._drive_pool.map(lambda _drive: _drive.read_dof_states(), _drives))
+        # drives report (1, num_dofs) or (num_dofs,) tensors
+        pos, vel, eff = (torch.cat([state[i].cpu().view(1, -1) for state in states]) for i in range(3))
+        return pos, vel, eff
+
+    def _write_drive_targets(
+        self,
+        _drives: list[ArticulationDrive],
+        pos_target: torch.Tensor,
+        vel_target: torch.Tensor,
+        eff_target: torch.Tensor,
+    ):
+        """Write the targets of every instance (one row each) to its drive, concurrently when there is more than one."""
+
+        def write(instance: int):
+            _drives[instance].write_dof_targets(
+                pos_target=pos_target[instance : instance + 1],
+                vel_target=vel_target[instance : instance + 1],
+                eff_target=eff_target[instance : instance + 1],
+            )
+
+        if self._drive_pool is None:
+            for instance in range(len(_drives)):
+                write(instance)
+        else:
+            # consume the iterator so exceptions raised by a drive propagate to the loop
+            list(self._drive_pool.map(write, range(len(_drives))))
+
+    def _sync_commands(self):
+        """Wait until the worker has applied every submitted command and report the ones that failed."""
+        if self.command_channel.num_pending == 0:
+            return
+        for ack in self.command_channel.wait():
+            if ack.status != "OK":
+                print(f"Warning: Child returned ack={ack}")
 
     def _populate_shared_data(self, _kinematic: BulletArticulationKinematics):
         self.shared_data["link_names"] = _kinematic.link_names
         self.shared_data["dof_names"] = _kinematic.joint_names
+        self._isaac_to_bullet_idx = [
+            self._isaac_joint_names.index(name)
+            for name in self.shared_data["dof_names"]
+            if name in self._isaac_joint_names
+        ]
+        self._bullet_to_isaac_idx = [
+            self.shared_data["dof_names"].index(name)
+            for name in self._isaac_joint_names
+            if name in self.shared_data["dof_names"]
+        ]
 
         self.shared_data["pos"][:] = _kinematic.get_dof_positions(clone=False)
         self.shared_data["vel"][:] = _kinematic.get_dof_velocities(clone=False)
@@ -243,12 +315,8 @@ class BulletArticulationView(ArticulationView):
         self.shared_data["vel_target"][:] = _kinematic.get_dof_velocity_targets(clone=False)
         # self.shared_data["eff_target"][:]
 
-        self.shared_data["link_transforms"][:] = _kinematic.get_link_transforms(clone=False)
-        self.shared_data["link_velocities"][:] = _kinematic.get_link_velocities(clone=False)
         self.shared_data["link_mass"][:] = _kinematic.get_link_masses(clone=False)
         self.shared_data["link_inertia"][:] = _kinematic.get_link_inertias(clone=False)
-        self.shared_data["link_coms"][:] = _kinematic.get_link_coms(clone=False)
-        self.shared_data["mass_matrix"][:] = _kinematic.get_mass_matrix()
         self.shared_data["dof_stiffness"][:] = _kinematic.get_dof_stiffnesses(clone=False)
         self.shared_data["dof_armatures"][:] = _kinematic.get_dof_armatures(clone=False)
         self.shared_data["dof_frictions"][:] = _kinematic.get_dof_frictions(clone=False)
@@ -256,12 +324,38 @@ class BulletArticulationView(ArticulationView):
         self.shared_data["dof_limits"][:] = _kinematic.get_dof_limits(clone=False)
         self.shared_data["dof_max_forces"][:] = _kinematic.get_dof_max_forces(clone=False)
         self.shared_data["dof_max_velocity"][:] = _kinematic.get_dof_max_velocities(clone=False)
-        self.shared_data["jacobians"][:] = _kinematic.get_jacobian()
+        # the jacobians and the mass matrix are published in the isaac joint order, same as on every poll
+        self._publish_kinematic_states(_kinematic)
 
-    def _read_write_dummy_states(self):
-        self.shared_data["pos"] = self.shared_data["pos_target"]
-        self.shared_data["vel"] = self.shared_data["vel_target"]
-        self.shared_data["torque"] = self.shared_data["eff_target"]
+    def _publish_states(
+        self,
+        _kinematic: BulletArticulationKinematics,
+        pos: torch.Tensor,
+        vel: torch.Tensor,
+        torque: torch.Tensor,
+        stamp: float,
+    ):
+        # evaluate the kinematics before entering the write section to keep the window readers wait on short
+        _kinematic.set_dof_states(
+            pos[:, self._isaac_to_bullet_idx],
+            vel[:, self._isaac_to_bullet_idx],
+            torque[:, self._isaac_to_bullet_idx],
+        )
+        with self.shared_data.write("state", stamp=stamp):
+            self.shared_data["pos"][:] = pos
+            self.shared_data["vel"][:] = vel
+            self.shared_data["torque"][:] = torque
+            self._publish_kinematic_states(_kinematic)
+
+    def _publish_kinematic_states(self, _kinematic: BulletArticulationKinematics):
+        self.shared_data["link_coms"][:] = _kinematic.get_link_coms()
+        self.shared_data["link_transforms"][:] = _kinematic.get_link_transforms()
+        self.shared_data["link_velocities"][:] = _kinematic.get_link_velocities()
+        # jacobian columns and mass matrix rows/columns follow the isaac joint order, same as the dof states
+        jacobians = _kinematic.get_jacobian(clone=False)
+        mass_matrix = _kinematic.get_mass_matrix(clone=False)
+        self.shared_data["jacobians"][:] = jacobians[..., self._bullet_to_isaac_idx]
+        self.shared_data["mass_matrix"][:] = mass_matrix[:, self._bullet_to_isaac_idx][..., self._bullet_to_isaac_idx]
 
     # Public API
     # -------------------------------------------------------------------------
@@ -270,7 +364,18 @@ class BulletArticulationView(ArticulationView):
     # Below method should not be called in the child process, namely self._run,
     # Implementation of below methods should not directly access fields used for child process, e.g:
     # _kinematic
-    # _drive
+    # _drives
+
+    def _rows(self, indices: torch.Tensor | None) -> slice | torch.Tensor:
+        """Rows of the per-instance fields addressed by ``indices``, a full slice when all instances are addressed."""
+        if indices is None or len(indices) == self.count:
+            return slice(None)
+        return indices.cpu()
+
+    def _command_indices(self, indices: torch.Tensor | None) -> torch.Tensor | None:
+        """Instance indices carried by a command, None when the command addresses all instances."""
+        rows = self._rows(indices)
+        return None if isinstance(rows, slice) else rows.clone()
 
     def play(self):
         self.shared_data["is_running"] = True
@@ -279,16 +384,13 @@ class BulletArticulationView(ArticulationView):
         self.shared_data["is_running"] = False
 
     def close(self):
+        self._sync_commands()
         self.shared_data["is_running"] = False
         self.shared_data["close"] = True
         if self._proc is not None:
             self._proc.join()
             self._proc = None
 
-        if self.manager is not None:
-            self.manager.shutdown()
-            self.manager = None
-
     @property
     def count(self) -> int:
         """
@@ -300,7 +402,7 @@ class BulletArticulationView(ArticulationView):
         Returns:
             int: The total number of articulation instances.
         """
-        return 1
+        return self._count
 
     @property
     def fixed_base(self) -> bool:
@@ -387,7 +489,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, 7),
                           each row containing [px, py, pz, qw, qx, qy, qz].
         """
-        return self.shared_data["link_transforms"][:, 0, :].clone().to(self.device)
+        return self.shared_data.read("link_transforms")[:, 0, :].to(self.device)
 
     def get_root_velocities(self) -> torch.Tensor:
         """
@@ -397,7 +499,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, 6),
                           each row containing [vx, vy, vz, wx, wy, wz].
         """
-        return self.shared_data["link_velocities"][:, 0, :].clone().to(self.device)
+        return self.shared_data.read("link_velocities")[:, 0, :].to(self.device)
 
     def get_link_accelerations(self) -> torch.Tensor:
         """
@@ -418,7 +520,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, num_bodies, 7),
                           for [px, py, pz, qw, qx, qy, qz] per link.
         """
-        return self.shared_data["link_transforms"].clone().to(self.device)
+        return self.shared_data.read("link_transforms").to(self.device)
 
     def get_link_velocities(self) -> torch.Tensor:
         """
@@ -428,7 +530,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, num_bodies, 6),
                           containing [vx, vy, vz, wx, wy, wz] per link.
         """
-        return self.shared_data["link_velocities"].clone().to(self.device)
+        return self.shared_data.read("link_velocities").to(self.device)
 
     def get_coms(self) -> torch.Tensor:
         """
@@ -442,7 +544,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: COM positions in the world or local coordinate frame
                           depending on the backend's convention.
         """
-        return self.shared_data["link_coms"].clone().to(self.device)
+        return self.shared_data.read("link_coms").to(self.device)
 
     def get_masses(self) -> torch.Tensor:
         """
@@ -452,7 +554,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, num_bodies),
                           containing the mass of each link.
         """
-        link_mass = self.shared_data["link_mass"].clone().to(self.device)
+        link_mass = self.shared_data.read("link_mass").to(self.device)
         return link_mass
 
     def get_inertias(self) -> torch.Tensor:
@@ -463,7 +565,38 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, num_bodies, 9),
                           containing the inertia matrix for each link.
         """
-        return self.shared_data["link_inertia"].to(self.device)
+        return self.shared_data.read("link_inertia").to(self.device)
+
+    def get_jacobians(self) -> torch.Tensor:
+        """
+        Get the geometric Jacobians of the links for each articulation instance, in world frame.
+
+        The Jacobians are refreshed by the kinematic worker on every poll. As in the PhysX tensor API, the root link
+        is excluded since the articulation is fixed-base.
+
+        Returns:
+            torch.Tensor: A tensor of shape (count, num_bodies - 1, 6, dof_count),
+                          rows ordered as [vx, vy, vz, wx, wy, wz].
+        """
+        return self.shared_data.read("jacobians")[:, 1:].to(self.device)
+
+    def get_generalized_mass_matrices(self) -> torch.Tensor:
+        """
+        Get the joint space mass matrices for each articulation instance, refreshed on every poll.
+
+        Returns:
+            torch.Tensor: A tensor of shape (count, dof_count, dof_count).
+        """
+        return self.shared_data.read("mass_matrix").to(self.device)
+
+    def get_loop_statistics(self) -> dict[str, float]:
+        """
+        Get timing statistics of the worker poll loop since start, recorded in shared memory by the worker.
+
+        Returns:
+            dict[str, float]: Statistic name to value, see :meth:`uwlab.utils.timing.LoopStatistics.summary`.
+        """
+        return self.loop_statistics.summary()
 
     def get_dof_positions(self) -> torch.Tensor:
         """
@@ -473,7 +606,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count)
                           with joint angles or positions.
         """
-        return self.shared_data["pos"].clone().to(self.device)
+        return self.shared_data.read("pos").to(self.device)
 
     def get_dof_velocities(self) -> torch.Tensor:
         """
@@ -483,7 +616,18 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count),
                           with joint velocity values.
         """
-        return self.shared_data["vel"].clone().to(self.device)
+        return self.shared_data.read("vel").to(self.device)
+
+    def get_dof_states_stamped(self) -> tuple[float, torch.Tensor, torch.Tensor]:
+        """
+        Get the joint positions and velocities of the same poll, with the time the worker read them from the hardware.
+
+        Returns:
+            tuple[float, torch.Tensor, torch.Tensor]: The read time on the :func:`time.monotonic` clock in seconds,
+                and the joint positions and velocities of shape (count, dof_count).
+        """
+        stamp, (pos, vel) = self.shared_data.read_stamped("pos", "vel")
+        return stamp, pos.to(self.device), vel.to(self.device)
 
     def get_dof_torques(self) -> torch.Tensor:
         """
@@ -493,7 +637,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count),
                           with joint velocity values.
         """
-        return self.shared_data["torque"].clone().to(self.device)
+        return self.shared_data.read("torque").to(self.device)
 
     def get_dof_max_velocities(self) -> torch.Tensor:
         """
@@ -503,7 +647,7 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count),
                           containing velocity limits per joint.
         """
-        return self.shared_data["dof_max_velocity"].clone().to(self.device)
+        return self.shared_data.read("dof_max_velocity").to(self.device)
 
     def get_dof_max_forces(self) -> torch.Tensor:
         """
@@ -514,7 +658,7 @@ class BulletArticulationView(ArticulationView):
                           with torque/force limits per joint.
         """
         # max force expects cpu tensor
-        return self.shared_data["dof_max_forces"].clone().to("cpu")
+        return self.shared_data.read("dof_max_forces").to("cpu")
 
     def get_dof_stiffnesses(self) -> torch.Tensor:
         """
@@ -524,7 +668,8 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count),
                           containing the stiffness for each DOF.
         """
-        return self.shared_data["dof_stiffness"].clone().to(self.device)
+        self._sync_commands()
+        return self.shared_data.read("dof_stiffness").to(self.device)
 
     def get_dof_dampings(self) -> torch.Tensor:
         """
@@ -534,7 +679,8 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count),
                           containing the damping for each DOF.
         """
-        return self.shared_data["dof_damping"].clone().to(self.device)
+        self._sync_commands()
+        return self.shared_data.read("dof_damping").to(self.device)
 
     def get_dof_armatures(self) -> torch.Tensor:
         """
@@ -546,7 +692,8 @@ class BulletArticulationView(ArticulationView):
         Returns:
             torch.Tensor: A tensor of shape (count, dof_count).
         """
-        return self.shared_data["dof_armatures"].clone().to(self.device)
+        self._sync_commands()
+        return self.shared_data.read("dof_armatures").to(self.device)
 
     def get_dof_friction_coefficients(self) -> torch.Tensor:
         """
@@ -555,7 +702,8 @@ class BulletArticulationView(ArticulationView):
         Returns:
             torch.Tensor: A tensor of shape (count, dof_count).
         """
-        return self.shared_data["dof_frictions"].clone().to(self.device)
+        self._sync_commands()
+        return self.shared_data.read("dof_frictions").to(self.device)
 
     def get_dof_limits(self) -> torch.Tensor:
         """
@@ -565,7 +713,8 @@ class BulletArticulationView(ArticulationView):
             torch.Tensor: A tensor of shape (count, dof_count, 2),
                           where the last dimension stores [lower_limit, upper_limit].
         """
-        return self.shared_data["dof_limits"].clone().to(self.device)
+        self._sync_commands()
+        return self.shared_data.read("dof_limits").to(self.device)
 
     def get_fixed_tendon_stiffnesses(self) -> torch.Tensor:
         """
@@ -639,7 +788,7 @@ class BulletArticulationView(ArticulationView):
         Set the actuation forces (torques) for the specified articulation instances.
 
         Args:
-            forces (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            forces (torch.Tensor): A tensor of shape (count, dof_count)
                                    specifying the commanded forces/torques.
             indices (torch.Tensor): A tensor of indices specifying which
                                     articulation instances to apply these forces.
@@ -656,11 +805,13 @@ class BulletArticulationView(ArticulationView):
         if the underlying controller or simulation uses position-based control.
 
         Args:
-            positions (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            positions (torch.Tensor): A tensor of shape (count, dof_count)
                                       specifying desired joint positions.
             indices (torch.Tensor): Indices of articulation instances to apply these targets.
         """
-        self.shared_data["pos_target"][:] = positions.cpu()
+        rows = self._rows(indices)
+        with self.shared_data.write("command"):
+            self.shared_data["pos_target"][rows] = positions.cpu()[rows]
 
     def set_dof_positions(self, positions: torch.Tensor, indices: torch.Tensor, threshold: float = 1e-2) -> None:
         """
@@ -668,12 +819,13 @@ class BulletArticulationView(ArticulationView):
         Usually used for resetting or overriding joint states directly.
 
         Args:
-            positions (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            positions (torch.Tensor): A tensor of shape (count, dof_count)
                                       specifying the new positions.
             indices (torch.Tensor): Indices of articulation instances to set positions for.
         """
+        rows = self._rows(indices)
         count = 0
-        while torch.sum(self.get_dof_positions() - positions).abs() > threshold:
+        while torch.sum(self.get_dof_positions()[rows] - positions[rows].to(self.device)).abs() > threshold:
             self.set_dof_position_targets(positions, indices)
             count += 1
             if count > 50:
@@ -685,7 +837,7 @@ class BulletArticulationView(ArticulationView):
         if the underlying controller or simulation uses velocity-based control.
 
         Args:
-            velocities (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            velocities (torch.Tensor): A tensor of shape (count, dof_count)
                                        specifying desired joint velocities.
             indices (torch.Tensor): Indices of articulation instances to apply these targets.
         """
@@ -695,7 +847,9 @@ class BulletArticulationView(ArticulationView):
                 " implemented"
             )
         # the interface is correct but driver doesn't support velocity control yet
-        self.shared_data["vel_target"][:] = velocities.cpu()
+        rows = self._rows(indices)
+        with self.shared_data.write("command"):
+            self.shared_data["vel_target"][rows] = velocities.cpu()[rows]
 
     def set_dof_velocities(self, velocities: torch.Tensor, indices: torch.Tensor) -> None:
         """
@@ -703,7 +857,7 @@ class BulletArticulationView(ArticulationView):
         Usually used for resetting or overriding joint states directly.
 
         Args:
-            velocities (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            velocities (torch.Tensor): A tensor of shape (count, dof_count)
                                        specifying new joint velocities.
             indices (torch.Tensor): Indices of articulation instances to set velocities for.
         """
@@ -719,7 +873,7 @@ class BulletArticulationView(ArticulationView):
         Orientation is expected in (x, y, z, w) format.
 
         Args:
-            root_poses_xyzw (torch.Tensor): A tensor of shape (len(indices), 7),
+            root_poses_xyzw (torch.Tensor): A tensor of shape (count, 7),
                                             containing [px, py, pz, qx, qy, qz, qw].
             indices (torch.Tensor): Indices of articulation instances to set transforms for.
         """
@@ -735,7 +889,7 @@ class BulletArticulationView(ArticulationView):
         Set the root velocities (linvel + angvel) for each articulation instance.
 
         Args:
-            root_velocities (torch.Tensor): A tensor of shape (len(indices), 6),
+            root_velocities (torch.Tensor): A tensor of shape (count, 6),
                                             containing [x, y, z, rx, ry, rz].
             indices (torch.Tensor): Indices of articulation instances to set transforms for.
         """
@@ -751,67 +905,53 @@ class BulletArticulationView(ArticulationView):
         Set the joint stiffness values for the specified articulation instances.
 
         Args:
-            stiffness (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            stiffness (torch.Tensor): A tensor of shape (count, dof_count)
                                       with new stiffness values.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
-        self.shared_data["dof_stiffness"][:] = stiffness.cpu()
-        self.cmd_queue.put("set_dof_stiffnesses")
-        ack = self.ack_queue.get()
-        if ack != "OK":
-            print(f"Warning: Child returned ack={ack}")
+        self.command_channel.submit("set_dof_stiffnesses", stiffness.cpu().clone(), self._command_indices(indices))
 
     def set_dof_dampings(self, damping: torch.Tensor, indices: torch.Tensor) -> None:
         """
         Set the joint damping values for the specified articulation instances.
 
         Args:
-            damping (torch.Tensor): A tensor of shape (len(indices), dof_count)
+            damping (torch.Tensor): A tensor of shape (count, dof_count)
                                     with new damping values.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
-        self.shared_data["dof_damping"][:] = damping.cpu()
-        self.cmd_queue.put("set_dof_dampings")
-        ack = self.ack_queue.get()
-        if ack != "OK":
-            print(f"Warning: Child returned ack={ack}")
+        self.command_channel.submit("set_dof_dampings", damping.cpu().clone(), self._command_indices(indices))
 
     def set_dof_armatures(self, armatures: torch.Tensor, indices: torch.Tensor) -> None:
         """
         Set the joint armature values for the specified articulation instances.
 
         Args:
-            armatures (torch.Tensor): A tensor of shape (len(indices), dof_count),
+            armatures (torch.Tensor): A tensor of shape (count, dof_count),
                                       specifying new armature values.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
-        self.shared_data["dof_armatures"][:] = armatures.cpu()
-        self.cmd_queue.put("set_dof_armatures")
-        ack = self.ack_queue.get()
-        if ack != "OK":
-            print(f"Warning: Child returned ack={ack}")
+        self.command_channel.submit("set_dof_armatures", armatures.cpu().clone(), self._command_indices(indices))
 
     def set_dof_friction_coefficients(self, friction_coefficients: torch.Tensor, indices: torch.Tensor) -> None:
         """
         Set the friction coefficients for each joint of the specified articulation instances.
 
         Args:
-            friction_coefficients (torch.Tensor): A tensor of shape (len(indices), dof_count),
+            friction_coefficients (torch.Tensor): A tensor of shape (count, dof_count),
                                                   specifying new friction values.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
-        self.shared_data["dof_frictions"][:] = friction_coefficients.cpu()
-        self.cmd_queue.put("set_dof_frictions")
-        ack = self.ack_queue.get()
-        if ack != "OK":
-            print(f"Warning: Child returned ack={ack}")
+        self.command_channel.submit(
+            "set_dof_frictions", friction_coefficients.cpu().clone(), self._command_indices(indices)
+        )
 
     def set_dof_max_velocities(self, max_velocities: torch.Tensor, indices: torch.Tensor) -> None:
         """
         Set the maximum allowed velocities for each joint in the specified articulation instances.
 
         Args:
-            max_velocities (torch.Tensor): A tensor of shape (len(indices), dof_count),
+            max_velocities (torch.Tensor): A tensor of shape (count, dof_count),
                                            specifying new velocity limits.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
@@ -827,7 +967,7 @@ class BulletArticulationView(ArticulationView):
         Set the maximum allowed forces (torques) for each joint in the specified articulation instances.
 
         Args:
-            max_forces (torch.Tensor): A tensor of shape (len(indices), dof_count),
+            max_forces (torch.Tensor): A tensor of shape (count, dof_count),
                                        specifying new force/torque limits.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
@@ -842,15 +982,11 @@ class BulletArticulationView(ArticulationView):
         Set new position limits (lower/upper) for each joint in the specified articulation instances.
 
         Args:
-            limits (torch.Tensor): A tensor of shape (len(indices), dof_count, 2),
+            limits (torch.Tensor): A tensor of shape (count, dof_count, 2),
                                    specifying [lower_limit, upper_limit] for each joint.
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
         """
-        self.shared_data["dof_limits"][:] = limits.cpu()
-        self.cmd_queue.put("set_dof_limits")
-        ack = self.ack_queue.get()
-        if ack != "OK":
-            print(f"Warning: Child returned ack={ack}")
+        self.command_channel.submit("set_dof_limits", limits.cpu().clone(), self._command_indices(indices))
 
     def apply_forces_and_torques_at_position(
         self,
@@ -864,11 +1000,11 @@ class BulletArticulationView(ArticulationView):
         Apply forces and torques to bodies at specified positions (in local or global coordinates).
 
         Args:
-            force_data (torch.Tensor): A tensor of shape (len(indices), nbodies, 3),
+            force_data (torch.Tensor): A tensor of shape (count, nbodies, 3),
                                        specifying the force to be applied.
-            torque_data (torch.Tensor): A tensor of shape (len(indices), nbodies, 3),
+            torque_data (torch.Tensor): A tensor of shape (count, nbodies, 3),
                                         specifying the torque to be applied.
-            position_data (torch.Tensor): A tensor of shape (len(indices), nbodies, 3),
+            position_data (torch.Tensor): A tensor of shape (count, nbodies, 3),
                                           specifying the point of application
                                           (in local or world coordinates).
             indices (torch.Tensor): Indices specifying which articulation instances to affect.
@@ -10,46 +10,49 @@ import pybullet as p
 
 from isaaclab.utils import math as math_utils
 
+from .kinematic_chain import KinematicChain
+
 
 class BulletArticulationKinematicsData:
-    def __init__(self, dof_dim: int, link_dim: int, device: str):
+    def __init__(self, dof_dim: int, link_dim: int, device: str, count: int = 1):
         self.dof_dim = dof_dim
         self.link_dim = link_dim
         self.device = device
+        self.count = count
         self.reset()
 
     def reset(self):
         self.link_names: list[str] = []
         self.dof_names: list[str] = []
         self.dof_types: list[str] = []
-        self.dof_indices = torch.zeros((1, self.dof_dim), device=self.device)
+        self.dof_indices = torch.zeros((self.count, self.dof_dim), device=self.device)
 
-        self.link_transforms = torch.zeros((1, self.link_dim, 7), device=self.device)
-        self.link_velocities = torch.zeros((1, self.link_dim, 6), device=self.device)
-        self.link_mass = torch.zeros((1, self.link_dim), device=self.device)
-        self.link_inertia = torch.zeros((1, self.link_dim, 9), device=self.device)
-        self.link_coms = torch.zeros((1, self.link_dim, 7), device=self.device)
+        self.link_transforms = torch.zeros((self.count, self.link_dim, 7), device=self.device)
+        self.link_velocities = torch.zeros((self.count, self.link_dim, 6), device=self.device)
+        self.link_mass = torch.zeros((self.count, self.link_dim), device=self.device)
+        self.link_inertia = torch.zeros((self.count, self.link_dim, 9), device=self.device)
+        self.link_coms = torch.zeros((self.count, self.link_dim, 7), device=self.device)
 
-        self.mass_matrix = torch.zeros((1, self.dof_dim, self.dof_dim), device=self.device)
+        self.mass_matrix = torch.zeros((self.count, self.dof_dim, self.dof_dim), device=self.device)
 
-        self.dof_positions = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_velocities = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_accelerations = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_torques = torch.zeros((1, self.dof_dim), device=self.device)
+        self.dof_positions = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_velocities = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_accelerations = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_torques = torch.zeros((self.count, self.dof_dim), device=self.device)
 
-        self.dof_position_target = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_velocity_target = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_torque_target = torch.zeros((1, self.dof_dim), device=self.device)
+        self.dof_position_target = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_velocity_target = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_torque_target = torch.zeros((self.count, self.dof_dim), device=self.device)
 
-        self.dof_stiffness = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_armatures = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_frictions = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_damping = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_limits = torch.zeros((1, self.dof_dim, 2), device=self.device)
-        self.dof_max_forces = torch.zeros((1, self.dof_dim), device=self.device)
-        self.dof_max_velocity = torch.zeros((1, self.dof_dim), device=self.device)
+        self.dof_stiffness = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_armatures = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_frictions = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_damping = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_limits = torch.zeros((self.count, self.dof_dim, 2), device=self.device)
+        self.dof_max_forces = torch.zeros((self.count, self.dof_dim), device=self.device)
+        self.dof_max_velocity = torch.zeros((self.count, self.dof_dim), device=self.device)
 
-        self.jacobians = torch.zeros((1, self.link_dim, 6, self.dof_dim), device=self.device)
+        self.jacobians = torch.zeros((self.count, self.link_dim, 6, self.dof_dim), device=self.device)
 
 
 dof_types_dict: dict[int, str] = {
@@ -62,9 +65,12 @@ dof_types_dict: dict[int, str] = {
 
 
 class BulletArticulationKinematics:
-    def __init__(self, urdf_path, is_fixed_base, debug_visualize, dt, device):
+    def __init__(self, urdf_path, is_fixed_base, debug_visualize, dt, device, count: int = 1):
         """
         Initialize PyBullet in DIRECT mode and load the URDF at urdf_path.
+
+        The state of ``count`` identical articulations is stored and evaluated as one batch, the PyBullet model is
+        only used for the static model properties and for visualizing the first instance.
         """
         # Connect in DIRECT mode (no GUI)
         self.debug_visualize = debug_visualize
@@ -82,9 +88,11 @@ class BulletArticulationKinematics:
 
         # Identify which joints are actually movable (revolute or prismatic)
         self._dof_indicies = []
+        self._all_joint_names = []
         for j in range(self._num_joints):
             info = p.getJointInfo(self.articulation, j, physicsClientId=self.client_id)
             joint_type = info[2]  # 0=REVOLUTE, 1=PRISMATIC, 4=FIXED, ...
+            self._all_joint_names.append(info[1].decode("utf-8"))
             if joint_type not in [p.JOINT_FIXED]:
                 self._dof_indicies.append(j)
 
@@ -93,15 +101,23 @@ class BulletArticulationKinematics:
         print("Total Links:", self._num_links, "Total joints:", self._num_joints, "Movable DoF:", self._num_dofs)
 
         # Initialize the state storage
-        self.articulation_view_data = BulletArticulationKinematicsData(self._num_dofs, self._num_links, device)
+        self.articulation_view_data = BulletArticulationKinematicsData(self._num_dofs, self._num_links, device, count)
         self.device = device
 
         self.populate_joint_state()
-        self.populate_link_transforms()
-        self.populate_link_velocities()
         self.populate_link_mass()
         self.populate_inertia()
 
+        # Link poses and velocities are evaluated by the tensor kinematic chain instead of per-link PyBullet queries
+        self.chain = KinematicChain(
+            urdf_path,
+            self._all_joint_names,
+            link_coms=self.articulation_view_data.link_coms[0],
+            root_transform=self._get_root_link_frame(),
+            device=device,
+        )
+        self.populate_link_states()
+
     def close(self):
         """
         Signal the rendering thread to stop and wait for it to join.
@@ -112,6 +128,10 @@ class BulletArticulationKinematics:
     def fixed_base(self):
         return self._is_fixed_base
 
+    @property
+    def count(self):
+        return self.articulation_view_data.count
+
     @property
     def num_links(self):
         return self._num_links
@@ -276,53 +296,23 @@ class BulletArticulationKinematics:
         data = self.articulation_view_data.dof_armatures[:, joint_indices]
         return data.clone() if clone else data
 
-    def get_mass_matrix(self) -> torch.Tensor:
+    def get_mass_matrix(self, clone: bool = True) -> torch.Tensor:
         """
-        Return the mass matrix for the current state.
+        Return the mass matrix of shape (count, num_dofs, num_dofs) for the current state.
         """
-        # 1) Gather the current joint positions from PyBullet
-        joint_positions = self.get_dof_positions()
-
-        # 2) Compute the mass matrix
-        mass_matrix = p.calculateMassMatrix(
-            bodyUniqueId=self.articulation, objPositions=joint_positions[0].tolist(), physicsClientId=self.client_id
-        )
-
-        # 3) Convert the mass matrix to a torch tensor
-        mass_matrix = torch.tensor(mass_matrix, device=self.device)
-
-        return mass_matrix
+        data = self.articulation_view_data.mass_matrix
+        return data.clone() if clone else data
 
-    def get_jacobian(self) -> torch.Tensor:
+    def get_jacobian(self, clone: bool = True) -> torch.Tensor:
         """
-        Return the Jacobian for each link in shape (num_links, 6, num_joints).
+        Return the Jacobian for each link in shape (count, num_links, 6, num_dofs) for the current state.
 
         - num_links
         - 6 = [dPos/dq (3 rows), dRot/dq (3 rows)]
-        - num_joints = total joints
+        - num_dofs = movable joints
         """
-        # 1) Gather the current joint positions from PyBullet
-        joint_positions = self.get_dof_positions()
-
-        # 2) For each link, calculate the Jacobian
-        jacobians = torch.zeros((1, self._num_links, 6, self._num_dofs), device=self.device)
-        for link_idx in range(0, self._num_links):
-            linJ, angJ = p.calculateJacobian(
-                bodyUniqueId=self.articulation,
-                linkIndex=link_idx - 1,
-                localPosition=[0, 0, 0],
-                objPositions=joint_positions[0].tolist(),
-                objVelocities=torch.zeros_like(joint_positions)[0].tolist(),
-                objAccelerations=torch.zeros_like(joint_positions)[0].tolist(),
-                physicsClientId=self.client_id,
-            )
-            # linJ, angJ are (3, num_joints)
-            linJ = torch.tensor(linJ, device=self.device)
-            angJ = torch.tensor(angJ, device=self.device)
-            jacobians[0, link_idx, :3, :] = linJ
-            jacobians[0, link_idx, 3:, :] = angJ
-
-        return jacobians
+        data = self.articulation_view_data.jacobians
+        return data.clone() if clone else data
 
     def set_masses(
         self,
@@ -337,9 +327,9 @@ class BulletArticulationKinematics:
         """
         # Transfer the data from the user-supplied tensor to our internal state
         # (in case you want to keep an internal copy).
-        self.articulation_view_data.link_mass[0, link_indices] = masses.to(self.device)
+        self.articulation_view_data.link_mass[indices, link_indices] = masses.to(self.device)
 
-        # Actually call p.changeDynamics to update the mass in Bullet
+        # Actually call p.changeDynamics to update the mass in Bullet, which mirrors the first instance
         if isinstance(link_indices, slice):
             effective_indices = range(self._num_links)[link_indices]
         elif isinstance(link_indices, torch.Tensor):
@@ -347,11 +337,12 @@ class BulletArticulationKinematics:
         else:
             effective_indices = link_indices
 
-        for i, link_idx in enumerate(effective_indices):
-            mass_value = masses[i].item() if len(masses.shape) > 0 else masses.item()
+        for link_idx in effective_indices:
+            mass_value = self.articulation_view_data.link_mass[0, link_idx].item()
             p.changeDynamics(
                 bodyUniqueId=self.articulation, linkIndex=link_idx, mass=mass_value, physicsClientId=self.client_id
             )
+        self.populate_link_states()
 
     def set_root_velocities(
         self,
@@ -377,23 +368,7 @@ class BulletArticulationKinematics:
         with torch.inference_mode(mode=True):
             # Also store internally
             self.articulation_view_data.dof_positions[indices, joint_indices] = positions.to(self.device)
-
-            if isinstance(joint_indices, slice):
-                effective_indices = self._dof_indicies[joint_indices]
-            elif isinstance(joint_indices, torch.Tensor):
-                effective_indices = [self._dof_indicies[i] for i in joint_indices.tolist()]
-            else:
-                effective_indices = [self._dof_indicies[i] for i in joint_indices]
-            # For each movable dof
-            for idx, j_id in enumerate(effective_indices):
-                p.resetJointState(
-                    bodyUniqueId=self.articulation,
-                    jointIndex=j_id,
-                    targetValue=positions[0][idx].item(),
-                    targetVelocity=0.0,
-                    physicsClientId=self.client_id,
-                )
-            self.populate_link_transforms()
+            self.populate_link_states()
 
     def set_dof_position_targets(
         self,
@@ -409,25 +384,9 @@ class BulletArticulationKinematics:
         indices: Union[List[int], torch.Tensor, slice] = slice(None),
         joint_indices: Union[List[int], torch.Tensor, slice] = slice(None),
     ):
-        self.articulation_view_data.dof_velocities[indices, joint_indices] = velocities.to(self.device)
-
-        if isinstance(joint_indices, slice):
-            effective_indices = self._dof_indicies[joint_indices]
-        if isinstance(joint_indices, torch.Tensor):
-            effective_indices = [self._dof_indicies[i] for i in joint_indices.tolist()]
-
-        for idx, j_id in enumerate(effective_indices):
-            # get current joint position so we don't overwrite it
-            cur_state = p.getJointState(self.articulation, j_id, physicsClientId=self.client_id)
-            cur_pos = cur_state[0]
-            p.resetJointState(
-                bodyUniqueId=self.articulation,
-                jointIndex=j_id,
-                targetValue=cur_pos,
-                targetVelocity=velocities[0][idx].item(),
-                physicsClientId=self.client_id,
-            )
-        self.populate_link_velocities()
+        with torch.inference_mode(mode=True):
+            self.articulation_view_data.dof_velocities[indices, joint_indices] = velocities.to(self.device)
+            self.populate_link_states()
 
     def set_dof_velocity_targets(
         self,
@@ -453,9 +412,12 @@ class BulletArticulationKinematics:
         indices: Union[List[int], torch.Tensor, slice] = slice(None),
         joint_indices: Union[List[int], torch.Tensor, slice] = slice(None),
     ):
-        self.set_dof_positions(positions, indices, joint_indices)
-        self.set_dof_velocities(velocities, indices, joint_indices)
-        self.set_dof_torques(efforts, indices, joint_indices)
+        with torch.inference_mode(mode=True):
+            self.articulation_view_data.dof_positions[indices, joint_indices] = positions.to(self.device)
+            self.articulation_view_data.dof_velocities[indices, joint_indices] = velocities.to(self.device)
+            self.articulation_view_data.dof_torques[indices, joint_indices] = efforts.to(self.device)
+            # evaluate the kinematics once for the new state instead of once per setter
+            self.populate_link_states()
 
     def set_dof_stiffnesses(
         self,
@@ -490,16 +452,11 @@ class BulletArticulationKinematics:
         self.articulation_view_data.dof_frictions[indices, joint_indices] = frictions.to(self.device)
 
     def forward_kinematics(self, positions: torch.Tensor) -> torch.Tensor:
-        self.current_joint_positions = self.articulation_view_data.dof_positions.clone()
-        # 1) Set the joint positions in PyBullet
-        self.set_dof_positions(positions)
-
-        # 2) Get the link transforms
-        link_transforms = self.get_link_transforms()
-
-        # 3) Reset the joint positions to the original state
-        self.set_dof_positions(self.current_joint_positions)
-
+        """
+        Return the link transforms of shape (N, num_links, 7) for N joint configurations of shape (N, num_dofs),
+        without modifying the stored articulation state.
+        """
+        link_transforms, _ = self.chain.forward_kinematics(positions.to(self.device))
         return link_transforms
 
     def set_dof_targets(self, positions, velocities, torques):
@@ -543,51 +500,38 @@ class BulletArticulationKinematics:
         base, _ = p.getBodyInfo(self.articulation, physicsClientId=self.client_id)
         self.articulation_view_data.link_names = [base.decode("utf-8")] + link_names
 
-    def populate_link_transforms(self):
-        link_world_pose = torch.zeros_like(self.articulation_view_data.link_transforms)
-        # populate the base link
-        base_pose = p.getBasePositionAndOrientation(self.articulation, physicsClientId=self.client_id)
-        pos = base_pose[0]
-        quat = base_pose[1]  # (x,y,z,w)
-        self.articulation_view_data.link_transforms[:, 0, :3] = torch.tensor(pos, device=self.device)
-        self.articulation_view_data.link_transforms[:, 0, 3:] = torch.tensor(quat, device=self.device)
-
-        for link_idx in range(1, self._num_links):
-            link_state = p.getLinkState(
-                self.articulation,
-                link_idx - 1,
-                computeLinkVelocity=True,
-                computeForwardKinematics=True,
-                physicsClientId=self.client_id,
-            )
-            link_world_position: list[float] = link_state[0]
-            link_world_orientation: list[float] = link_state[1]  # (x,y,z,w)
-
-            link_world_pose[:, link_idx, :3] = torch.tensor(link_world_position)
-            link_world_pose[:, link_idx, 3:] = torch.tensor(link_world_orientation)
-
-        self.articulation_view_data.link_transforms = link_world_pose.to(self.device)
-
-    def populate_link_velocities(self):
-        link_world_velocity = torch.zeros_like(self.articulation_view_data.link_velocities)
-
-        lin_vel, ang_vel = p.getBaseVelocity(self.articulation, physicsClientId=self.client_id)
-        link_world_velocity[:, 0, :3] = torch.tensor(lin_vel)
-        link_world_velocity[:, 0, 3:] = torch.tensor(ang_vel)
-        for link_idx in range(1, self._num_links):
-            link_state = p.getLinkState(
-                self.articulation,
-                link_idx - 1,
-                computeLinkVelocity=True,
-                computeForwardKinematics=True,
+    def populate_link_states(self):
+        data = self.articulation_view_data
+        link_transforms, link_velocities, jacobians, mass_matrix = self.chain.evaluate(
+            data.dof_positions, data.dof_velocities, data.link_mass, data.link_inertia
+        )
+        data.link_transforms[:] = link_transforms
+        data.link_velocities[:] = link_velocities
+        data.jacobians[:] = jacobians
+        data.mass_matrix[:] = mass_matrix
+        if self.debug_visualize:
+            self._sync_bullet_joint_states()
+
+    def _sync_bullet_joint_states(self):
+        """Mirror the stored dof state of the first instance into PyBullet, only needed for the debug visualization."""
+        positions = self.articulation_view_data.dof_positions[0].tolist()
+        velocities = self.articulation_view_data.dof_velocities[0].tolist()
+        for idx, j_id in enumerate(self._dof_indicies):
+            p.resetJointState(
+                bodyUniqueId=self.articulation,
+                jointIndex=j_id,
+                targetValue=positions[idx],
+                targetVelocity=velocities[idx],
                 physicsClientId=self.client_id,
             )
-            world_link_linear_velocity: list[float] = link_state[6]
-            world_link_angular_velocity: list[float] = link_state[7]
-            link_world_velocity[:, link_idx, :3] = torch.tensor(world_link_linear_velocity)
-            link_world_velocity[:, link_idx, 3:] = torch.tensor(world_link_angular_velocity)
 
-        self.articulation_view_data.link_velocities = link_world_velocity.to(self.device)
+    def _get_root_link_frame(self) -> torch.Tensor:
+        """World pose of the root link frame, PyBullet reports the base pose at its center of mass."""
+        base_pos, base_quat = p.getBasePositionAndOrientation(self.articulation, physicsClientId=self.client_id)
+        dyn_info = p.getDynamicsInfo(self.articulation, -1, physicsClientId=self.client_id)
+        inv_pos, inv_quat = p.invertTransform(dyn_info[3], dyn_info[4])
+        pos, quat = p.multiplyTransforms(base_pos, base_quat, inv_pos, inv_quat)
+        return torch.tensor([*pos, *quat], device=self.device)
 
     def populate_link_mass(self):
         dyn_info = p.getDynamicsInfo(self.articulation, -1, physicsClientId=self.client_id)
@@ -599,7 +543,7 @@ class BulletArticulationKinematics:
             self.articulation_view_data.link_mass[:, link_idx] = dyn_info[0]
 
     def populate_inertia(self):
-        # Initialize output: (batch=1, num_links, 9)
+        # Initialize output: (count, num_links, 9)
         inertias = torch.zeros_like(self.articulation_view_data.link_inertia)
         coms = torch.zeros_like(self.articulation_view_data.link_coms)
         for link_idx in range(0, self._num_links):
@@ -626,7 +570,7 @@ class BulletArticulationKinematics:
             Ifull = R @ Idiag @ R.transpose(0, 1)  # shape (3,3)
 
             # 4) Flatten row-major into a length-9 vector
-            inertias[0, link_idx, :] = Ifull.reshape(-1)
+            inertias[:, link_idx, :] = Ifull.reshape(-1)
             coms[:, link_idx, :3] = local_inertial_pos
             coms[:, link_idx, 3:] = local_inertia_quat
 
@@ -0,0 +1,121 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import math
+import torch
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..articulation_view_cfg import DummyModeCfg
+    from .articulation_kinematics import BulletArticulationKinematics
+
+
+class DummyArticulationDynamics:
+    """Joint space stand-in for the hardware of a :class:`BulletArticulationView` in dummy mode.
+
+    Every poll, the targets of all instances pass through the simulated link and actuators:
+
+    1. Packet loss: with probability :attr:`DummyModeCfg.packet_loss`, an instance does not receive the new targets
+       and keeps tracking the last ones it received.
+    2. Latency: received targets take effect :attr:`DummyModeCfg.latency` seconds (rounded to polls) later.
+    3. Actuator lag: the effective targets follow the received ones with a first-order lag of time constant
+       :attr:`DummyModeCfg.actuator_time_constant`.
+    4. PD tracking: joint torques come from the stiffness and damping currently set on the view plus the effort
+       target, clipped to the maximum joint forces. The joints are integrated with implicit PD (as PhysX does), using
+       the diagonal of the joint space mass matrix plus armature as joint inertia, so stiff gains stay stable at
+       large poll periods. Gravity and coupling between joints are ignored.
+    5. Limits: joint velocities are clipped to the maximum joint velocities and positions to the joint limits.
+
+    All quantities are batched over the instances and ordered like the joints of the kinematics.
+    """
+
+    def __init__(self, cfg: DummyModeCfg, kinematic: BulletArticulationKinematics, dt: float):
+        """Initialize the simulated state from the current state of the kinematics.
+
+        Args:
+            cfg: The dummy mode configuration.
+            kinematic: The kinematics holding the joint properties and the mass matrix.
+            dt: Poll period in seconds.
+        """
+        self.cfg = cfg
+        self.dt = dt
+        self.kinematic = kinematic
+        count, num_dofs = kinematic.count, kinematic.num_dof
+        device = kinematic.device
+
+        self._generator = torch.Generator(device=device)
+        if cfg.seed is not None:
+            self._generator.manual_seed(cfg.seed)
+        else:
+            self._generator.seed()
+
+        self.dof_pos = kinematic.get_dof_positions()
+        self.dof_vel = kinematic.get_dof_velocities()
+        self.dof_eff = torch.zeros((count, num_dofs), device=device)
+        # targets as last received by each instance and as currently applied by its actuators
+        self._received = torch.stack((self.dof_pos, torch.zeros_like(self.dof_pos), torch.zeros_like(self.dof_pos)))
+        self._applied = self._received.clone()
+        # ring buffer of received targets, delaying them by the configured latency
+        self._delay = max(int(round(cfg.latency / dt)), 0)
+        self._pipeline = self._received.unsqueeze(0).repeat(self._delay + 1, 1, 1, 1)
+        self._head = 0
+
+    def step(
+        self, pos_target: torch.Tensor, vel_target: torch.Tensor, eff_target: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Advance all instances by one poll period.
+
+        Args:
+            pos_target: Joint position targets of shape (count, num_dofs).
+            vel_target: Joint velocity targets of shape (count, num_dofs).
+            eff_target: Joint effort targets of shape (count, num_dofs).
+
+        Returns:
+            The joint positions, velocities and efforts of shape (count, num_dofs).
+        """
+        targets = torch.stack((pos_target, vel_target, eff_target)).to(self.dof_pos)
+        # 1) packet loss, per instance
+        if self.cfg.packet_loss > 0.0:
+            draws = torch.rand(targets.shape[1], generator=self._generator, device=targets.device)
+            lost = draws < self.cfg.packet_loss
+            targets[:, lost] = self._received[:, lost]
+        self._received[:] = targets
+        # 2) latency
+        self._pipeline[self._head] = targets
+        self._head = (self._head + 1) % self._pipeline.shape[0]
+        delayed = self._pipeline[self._head]
+
+        data = self.kinematic.articulation_view_data
+        stiffness, damping = data.dof_stiffness, data.dof_damping
+        inertia = torch.diagonal(data.mass_matrix, dim1=-2, dim2=-1) + data.dof_armatures
+        inertia = inertia.clamp_min(self.cfg.min_joint_inertia)
+        max_force, max_vel = data.dof_max_forces, data.dof_max_velocity
+        lower, upper = data.dof_limits[..., 0], data.dof_limits[..., 1]
+        h = self.dt / self.cfg.substeps
+        # 3) first-order lag, discretized so that it is exact for targets held over a substep
+        time_constant = self.cfg.actuator_time_constant
+        alpha = 1.0 if time_constant <= 0.0 else 1.0 - math.exp(-h / time_constant)
+        for _ in range(self.cfg.substeps):
+            self._applied += alpha * (delayed - self._applied)
+            q_target, qd_target, tau_ff = self._applied
+            # 4) implicit PD: the spring acts on the position at the end of the substep
+            tau = stiffness * (q_target - self.dof_pos - h * self.dof_vel) + damping * (qd_target - self.dof_vel)
+            tau = tau + tau_ff
+            # a zero force limit means unlimited, as reported by PyBullet for joints without an effort limit
+            tau = torch.where(max_force > 0, torch.clamp(tau, -max_force, max_force), tau)
+            qdd = tau / (inertia + damping * h + stiffness * h * h)
+            # 5) velocity and position limits
+            self.dof_vel += h * qdd
+            self.dof_vel[:] = torch.where(max_vel > 0, torch.clamp(self.dof_vel, -max_vel, max_vel), self.dof_vel)
+            self.dof_pos += h * self.dof_vel
+            bounded = upper > lower
+            clamped = torch.clamp(self.dof_pos, lower, upper)
+            at_limit = bounded & (clamped != self.dof_pos)
+            self.dof_pos[:] = torch.where(bounded, clamped, self.dof_pos)
+            self.dof_vel[at_limit] = 0.0
+            self.dof_eff[:] = tau
+        return self.dof_pos.clone(), self.dof_vel.clone(), self.dof_eff.clone()
@@ -0,0 +1,347 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import math
+import torch
+import xml.etree.ElementTree as ET
+
+from isaaclab.utils import math as math_utils
+
+JOINT_FIXED = 0
+JOINT_REVOLUTE = 1
+JOINT_PRISMATIC = 2
+
+_urdf_joint_types: dict[str, int] = {
+    "fixed": JOINT_FIXED,
+    "revolute": JOINT_REVOLUTE,
+    "continuous": JOINT_REVOLUTE,
+    "prismatic": JOINT_PRISMATIC,
+}
+
+
+def _parse_vector(text: str | None, default: tuple[float, float, float]) -> list[float]:
+    if text is None:
+        return list(default)
+    return [float(v) for v in text.split()]
+
+
+def _matrix_from_rpy(rpy: list[float]) -> list[list[float]]:
+    """URDF fixed-axis roll-pitch-yaw, i.e. R = Rz(yaw) @ Ry(pitch) @ Rx(roll)."""
+    cr, sr = math.cos(rpy[0]), math.sin(rpy[0])
+    cp, sp = math.cos(rpy[1]), math.sin(rpy[1])
+    cy, sy = math.cos(rpy[2]), math.sin(rpy[2])
+    return [
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr],
+    ]
+
+
+class KinematicChain:
+    """Pure tensor forward kinematics for a tree-structured articulation.
+
+    The joint tree is parsed from the URDF once at construction time and flattened into index tensors, so that the
+    poses and velocities of every link can be evaluated for a batch of joint configurations in a single call on any
+    torch device. Links that share a depth in the tree are processed together, which makes the number of python
+    iterations equal to the depth of the tree rather than the number of links.
+
+    The link ordering follows the PyBullet convention: link 0 is the root link and link ``i`` is the child link of the
+    ``i - 1`` th joint in :attr:`joint_names`. Reported link frames are the link center-of-mass frames, matching
+    what :func:`pybullet.getLinkState` returns, with quaternions in (x, y, z, w) order.
+    """
+
+    def __init__(
+        self,
+        urdf_path: str,
+        joint_names: list[str],
+        link_coms: torch.Tensor,
+        root_transform: torch.Tensor | None = None,
+        device: str = "cpu",
+    ):
+        """Build the chain from the URDF at ``urdf_path``.
+
+        Args:
+            urdf_path: Path to the URDF describing the articulation.
+            joint_names: Names of all joints (fixed and movable) in link order, i.e. joint ``i`` drives link ``i + 1``.
+            link_coms: Center-of-mass frame of each link relative to its link frame, shape (num_links, 7) as
+                [px, py, pz, qx, qy, qz, qw].
+            root_transform: World pose of the root link frame, shape (7,) as [px, py, pz, qx, qy, qz, qw].
+                Defaults to the identity.
+            device: Device on which the kinematic tensors are stored.
+        """
+        self.device = device
+        self._joint_names = list(joint_names)
+        self._num_links = len(joint_names) + 1
+
+        robot = ET.parse(urdf_path).getroot()
+        urdf_joints = {joint.get("name"): joint for joint in robot.findall("joint")}
+        child_links = {joint.find("child").get("link") for joint in urdf_joints.values()}  # type: ignore
+        root_links = [link.get("name") for link in robot.findall("link") if link.get("name") not in child_links]
+        if len(root_links) != 1:
+            raise ValueError(f"Expected exactly one root link in '{urdf_path}', found: {root_links}.")
+
+        link_index: dict[str, int] = {root_links[0]: 0}
+        parents = [-1]
+        joint_types = [JOINT_FIXED]
+        origin_pos = [[0.0, 0.0, 0.0]]
+        origin_rot = [[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]]
+        axes = [[0.0, 0.0, 0.0]]
+        for i, name in enumerate(self._joint_names):
+            if name not in urdf_joints:
+                raise ValueError(f"Joint '{name}' not found in '{urdf_path}'.")
+            joint = urdf_joints[name]
+            joint_type = joint.get("type")
+            if joint_type not in _urdf_joint_types:
+                raise ValueError(f"Joint '{name}' has unsupported type '{joint_type}' for tensor kinematics.")
+            parent_link = joint.find("parent").get("link")  # type: ignore
+            if parent_link not in link_index:
+                raise ValueError(f"Parent link '{parent_link}' of joint '{name}' appears after its child.")
+            link_index[joint.find("child").get("link")] = i + 1  # type: ignore
+            origin = joint.find("origin")
+            xyz = _parse_vector(origin.get("xyz") if origin is not None else None, (0.0, 0.0, 0.0))
+            rpy = _parse_vector(origin.get("rpy") if origin is not None else None, (0.0, 0.0, 0.0))
+            axis = joint.find("axis")
+            axis_xyz = _parse_vector(axis.get("xyz") if axis is not None else None, (1.0, 0.0, 0.0))
+            norm = math.sqrt(sum(a * a for a in axis_xyz)) or 1.0
+
+            parents.append(link_index[parent_link])
+            joint_types.append(_urdf_joint_types[joint_type])
+            origin_pos.append(xyz)
+            origin_rot.append(_matrix_from_rpy(rpy))
+            axes.append([a / norm for a in axis_xyz])
+
+        # per-link joint description, entry 0 (root) is a placeholder
+        self.parents = torch.tensor(parents, dtype=torch.long, device=device)
+        self.joint_types = torch.tensor(joint_types, dtype=torch.long, device=device)
+        self.origin_pos = torch.tensor(origin_pos, dtype=torch.float32, device=device)
+        self.origin_rot = torch.tensor(origin_rot, dtype=torch.float32, device=device)
+        self.axes = torch.tensor(axes, dtype=torch.float32, device=device)
+        self.is_revolute = (self.joint_types == JOINT_REVOLUTE).float()
+        self.is_prismatic = (self.joint_types == JOINT_PRISMATIC).float()
+        # movable joints are the degrees of freedom, ordered by joint index
+        self.dof_link_indices = torch.nonzero(self.joint_types != JOINT_FIXED).squeeze(-1)
+        self._num_dofs = self.dof_link_indices.numel()
+        # gather index from the padded dof vector into per-link joint values, fixed joints read the zero padding
+        self.link_dof_indices = torch.full((self._num_links,), self._num_dofs, dtype=torch.long, device=device)
+        self.link_dof_indices[self.dof_link_indices] = torch.arange(self._num_dofs, device=device)
+        # skew matrices of the joint axes for Rodrigues' rotation formula
+        self._axes_skew = math_utils.skew_symmetric_matrix(self.axes)
+        self._axes_skew_sq = self._axes_skew @ self._axes_skew
+
+        # group links by depth so that every level is evaluated in one batched operation
+        depth = [0] * self._num_links
+        for i in range(1, self._num_links):
+            depth[i] = depth[parents[i]] + 1
+        self.levels: list[tuple[torch.Tensor, torch.Tensor]] = []
+        for d in range(1, max(depth) + 1):
+            links = [i for i in range(self._num_links) if depth[i] == d]
+            self.levels.append((
+                torch.tensor(links, dtype=torch.long, device=device),
+                torch.tensor([parents[i] for i in links], dtype=torch.long, device=device),
+            ))
+        # support[k, d] is 1 if the d-th dof lies on the path from the root to link k, i.e. if it moves link k
+        support = torch.zeros((self._num_links, self._num_links), dtype=torch.float32)
+        for i in range(1, self._num_links):
+            j = i
+            while j > 0:
+                support[i, j] = 1.0
+                j = parents[j]
+        self._dof_support = support.to(device)[:, self.dof_link_indices]
+
+        self.set_link_coms(link_coms)
+        if root_transform is None:
+            root_transform = torch.tensor([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+        self.set_root_transform(root_transform)
+
+    @property
+    def num_links(self) -> int:
+        return self._num_links
+
+    @property
+    def num_dofs(self) -> int:
+        return self._num_dofs
+
+    @property
+    def joint_names(self) -> list[str]:
+        return self._joint_names.copy()
+
+    def set_link_coms(self, link_coms: torch.Tensor):
+        """Set the center-of-mass frames of all links, shape (num_links, 7) in link frames with (x, y, z, w)."""
+        link_coms = link_coms.reshape(self._num_links, 7).to(self.device, torch.float32)
+        self.com_pos = link_coms[:, :3].clone()
+        self.com_rot = math_utils.matrix_from_quat(math_utils.convert_quat(link_coms[:, 3:], to="wxyz"))
+
+    def set_root_transform(self, root_transform: torch.Tensor):
+        """Set the default world pose of the root link frame, shape (7,) with (x, y, z, w) quaternion."""
+        root_transform = root_transform.reshape(7).to(self.device, torch.float32)
+        self.root_pos = root_transform[:3].clone()
+        self.root_rot = math_utils.matrix_from_quat(math_utils.convert_quat(root_transform[3:], to="wxyz"))
+
+    def link_frames(self, joint_pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Compute the world rotation and position of every link frame (the URDF link frames, not the COM frames).
+
+        Args:
+            joint_pos: Joint positions of shape (N, num_dofs).
+
+        Returns:
+            A tuple of the link rotation matrices, shape (N, num_links, 3, 3), and the link origins,
+            shape (N, num_links, 3).
+        """
+        n = joint_pos.shape[0]
+        q = self._link_joint_values(joint_pos)
+        rot = torch.empty((n, self._num_links, 3, 3), dtype=torch.float32, device=self.device)
+        pos = torch.empty((n, self._num_links, 3), dtype=torch.float32, device=self.device)
+        rot[:, 0] = self.root_rot
+        pos[:, 0] = self.root_pos
+        for links, parents in self.levels:
+            parent_rot = rot[:, parents]
+            joint_rot = parent_rot @ self.origin_rot[links]
+            joint_pos_w = pos[:, parents] + (parent_rot @ self.origin_pos[links].unsqueeze(-1)).squeeze(-1)
+            # Rodrigues' formula, the angle is zero for prismatic and fixed joints
+            angle = (q[:, links] * self.is_revolute[links]).unsqueeze(-1).unsqueeze(-1)
+            motion_rot = torch.eye(3, device=self.device) + torch.sin(angle) * self._axes_skew[links]
+            motion_rot = motion_rot + (1.0 - torch.cos(angle)) * self._axes_skew_sq[links]
+            displacement = self.axes[links] * (q[:, links] * self.is_prismatic[links]).unsqueeze(-1)
+            rot[:, links] = joint_rot @ motion_rot
+            pos[:, links] = joint_pos_w + (joint_rot @ displacement.unsqueeze(-1)).squeeze(-1)
+        return rot, pos
+
+    def forward_kinematics(
+        self, joint_pos: torch.Tensor, joint_vel: torch.Tensor | None = None, root_velocity: torch.Tensor | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Compute the world pose and velocity of every link center-of-mass frame.
+
+        Args:
+            joint_pos: Joint positions of shape (N, num_dofs).
+            joint_vel: Joint velocities of shape (N, num_dofs). Defaults to zero.
+            root_velocity: World velocity of the root link frame, shape (N, 6) as [vx, vy, vz, wx, wy, wz].
+                Defaults to zero.
+
+        Returns:
+            A tuple of the link transforms, shape (N, num_links, 7) as [px, py, pz, qx, qy, qz, qw], and the link
+            velocities, shape (N, num_links, 6) as [vx, vy, vz, wx, wy, wz].
+        """
+        joint_pos = joint_pos.to(self.device, torch.float32)
+        n = joint_pos.shape[0]
+        rot, pos = self.link_frames(joint_pos)
+        com_pos, transforms = self._com_transforms(rot, pos)
+
+        lin_vel = torch.zeros((n, self._num_links, 3), dtype=torch.float32, device=self.device)
+        ang_vel = torch.zeros((n, self._num_links, 3), dtype=torch.float32, device=self.device)
+        if root_velocity is not None:
+            lin_vel[:, 0] = root_velocity[:, :3].to(self.device)
+            ang_vel[:, 0] = root_velocity[:, 3:].to(self.device)
+        if joint_vel is not None:
+            qd = self._link_joint_values(joint_vel.to(self.device, torch.float32))
+            for links, parents in self.levels:
+                # the joint axis is invariant under its own rotation, so the child frame expresses it in world
+                axis_w = (rot[:, links] @ self.axes[links].unsqueeze(-1)).squeeze(-1)
+                parent_ang_vel = ang_vel[:, parents]
+                ang_vel[:, links] = parent_ang_vel + axis_w * (qd[:, links] * self.is_revolute[links]).unsqueeze(-1)
+                lin_vel[:, links] = (
+                    lin_vel[:, parents]
+                    + torch.cross(parent_ang_vel, pos[:, links] - pos[:, parents], dim=-1)
+                    + axis_w * (qd[:, links] * self.is_prismatic[links]).unsqueeze(-1)
+                )
+        elif root_velocity is not None:
+            ang_vel[:] = ang_vel[:, :1]
+            lin_vel[:] = lin_vel[:, :1] + torch.cross(ang_vel, pos - pos[:, :1], dim=-1)
+
+        velocities = torch.empty((n, self._num_links, 6), dtype=torch.float32, device=self.device)
+        velocities[..., :3] = lin_vel + torch.cross(ang_vel, com_pos - pos, dim=-1)
+        velocities[..., 3:] = ang_vel
+        return transforms, velocities
+
+    def jacobians(self, joint_pos: torch.Tensor) -> torch.Tensor:
+        """Compute the geometric Jacobian of every link center-of-mass frame in the world frame.
+
+        Args:
+            joint_pos: Joint positions of shape (N, num_dofs).
+
+        Returns:
+            The Jacobians of shape (N, num_links, 6, num_dofs), rows ordered as [linear (3), angular (3)].
+        """
+        rot, pos = self.link_frames(joint_pos.to(self.device, torch.float32))
+        com_pos = pos + (rot @ self.com_pos.unsqueeze(-1)).squeeze(-1)
+        return self._jacobians(rot, pos, com_pos)
+
+    def mass_matrix(
+        self, joint_pos: torch.Tensor, link_masses: torch.Tensor, link_inertias: torch.Tensor
+    ) -> torch.Tensor:
+        """Compute the joint space mass matrix.
+
+        Args:
+            joint_pos: Joint positions of shape (N, num_dofs).
+            link_masses: Link masses of shape (N, num_links) or (1, num_links).
+            link_inertias: Link inertias about the center of mass, expressed in the link frame, shape
+                (N, num_links, 9) or (1, num_links, 9).
+
+        Returns:
+            The mass matrices of shape (N, num_dofs, num_dofs).
+        """
+        rot, pos = self.link_frames(joint_pos.to(self.device, torch.float32))
+        com_pos = pos + (rot @ self.com_pos.unsqueeze(-1)).squeeze(-1)
+        return self._mass_matrix(rot, self._jacobians(rot, pos, com_pos), link_masses, link_inertias)
+
+    def evaluate(
+        self,
+        joint_pos: torch.Tensor,
+        joint_vel: torch.Tensor,
+        link_masses: torch.Tensor,
+        link_inertias: torch.Tensor,
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Compute link transforms, link velocities, Jacobians and the mass matrix sharing a single kinematic pass.
+
+        The root link is assumed to be at rest, as it is for fixed-base articulations. See :meth:`forward_kinematics`,
+        :meth:`jacobians` and :meth:`mass_matrix` for the arguments and the shapes of the returned tensors.
+        """
+        rot, pos = self.link_frames(joint_pos.to(self.device, torch.float32))
+        com_pos, transforms = self._com_transforms(rot, pos)
+        jacobians = self._jacobians(rot, pos, com_pos)
+        qd = joint_vel.to(self.device, torch.float32)
+        velocities = (jacobians @ qd.unsqueeze(1).unsqueeze(-1)).squeeze(-1)
+        mass_matrix = self._mass_matrix(rot, jacobians, link_masses, link_inertias)
+        return transforms, velocities, jacobians, mass_matrix
+
+    def _com_transforms(self, rot: torch.Tensor, pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Center-of-mass positions (N, num_links, 3) and poses (N, num_links, 7) from the link frames."""
+        com_rot = rot @ self.com_rot
+        com_pos = pos + (rot @ self.com_pos.unsqueeze(-1)).squeeze(-1)
+        transforms = torch.empty((*pos.shape[:2], 7), dtype=torch.float32, device=self.device)
+        transforms[..., :3] = com_pos
+        transforms[..., 3:] = math_utils.convert_quat(math_utils.quat_from_matrix(com_rot), to="xyzw")
+        return com_pos, transforms
+
+    def _jacobians(self, rot: torch.Tensor, pos: torch.Tensor, com_pos: torch.Tensor) -> torch.Tensor:
+        dofs = self.dof_link_indices
+        # joint axes and joint origins in world, the child link frame sits on its joint
+        axis_w = (rot[:, dofs] @ self.axes[dofs].unsqueeze(-1)).squeeze(-1)
+        lever = com_pos.unsqueeze(2) - pos[:, dofs].unsqueeze(1)
+        axis_w = axis_w.unsqueeze(1).expand_as(lever)
+        is_revolute = self.is_revolute[dofs].unsqueeze(-1)
+        lin = torch.cross(axis_w, lever, dim=-1) * is_revolute + axis_w * self.is_prismatic[dofs].unsqueeze(-1)
+        ang = axis_w * is_revolute
+        support = self._dof_support.unsqueeze(-1)
+        return torch.cat((lin * support, ang * support), dim=-1).transpose(-1, -2)
+
+    def _mass_matrix(
+        self, rot: torch.Tensor, jacobians: torch.Tensor, link_masses: torch.Tensor, link_inertias: torch.Tensor
+    ) -> torch.Tensor:
+        n = jacobians.shape[0]
+        masses = link_masses.to(self.device, torch.float32).reshape(-1, self._num_links).expand(n, -1)
+        inertias = link_inertias.to(self.device, torch.float32).reshape(-1, self._num_links, 3, 3)
+        inertias_w = rot @ inertias.expand(n, -1, -1, -1) @ rot.transpose(-1, -2)
+        jac_lin, jac_ang = jacobians[:, :, :3], jacobians[:, :, 3:]
+        # M = sum over links of m J_v^T J_v + J_w^T I_w J_w, the composite-rigid-body result in closed form
+        return torch.einsum("nl,nlid,nlie->nde", masses, jac_lin, jac_lin) + torch.einsum(
+            "nlid,nlij,nlje->nde", jac_ang, inertias_w, jac_ang
+        )
+
+    def _link_joint_values(self, dof_values: torch.Tensor) -> torch.Tensor:
+        """Scatter per-dof values (N, num_dofs) into per-link joint values (N, num_links), zero for fixed joints."""
+        padded = torch.cat((dof_values, dof_values.new_zeros((dof_values.shape[0], 1))), dim=1)
+        return padded[:, self.link_dof_indices]
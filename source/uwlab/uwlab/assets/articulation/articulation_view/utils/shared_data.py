@@ -0,0 +1,162 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import math
+import time
+import torch
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class SharedArticulationData:
+    """Articulation data shared between an articulation view and its worker through one shared-memory block.
+
+    All tensor fields live in a single preallocated float32 block in shared memory and are exposed as views into it,
+    so reading or writing a field never goes through an IPC proxy and never pickles a tensor. The block is handed to
+    the other process once (e.g. through a :class:`torch.multiprocessing.Queue`), after which both sides operate on
+    the same memory.
+
+    Every field belongs to a region with exactly one writer, e.g. ``"state"`` (written by the worker) and
+    ``"command"`` (written by the environment). Each region is guarded by a sequence lock: the writer makes the
+    sequence number odd while it writes (:meth:`write`) and readers retry until they copied the fields without the
+    sequence number changing (:meth:`read`, :meth:`read_many`). Readers therefore always observe a complete publish,
+    e.g. joint positions and link transforms of the same poll.
+
+    Each region also carries a float64 stamp set by its writer, e.g. the time at which the published state was read
+    from the hardware (:meth:`read_stamped`).
+
+    Boolean flags (``is_running``, ``close``) are stored in a small shared tensor as well. Name lists are plain python
+    lists that must be filled in before the buffer is handed to the other process; they are static afterwards.
+
+    Fields are accessed with the same ``data[key]`` syntax as the dictionary this class replaces. Assigning a tensor
+    to a field copies into the shared view instead of rebinding it.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, tuple[tuple[int, ...], str]],
+        flags: list[str],
+        names: list[str],
+    ):
+        """Allocate the shared block.
+
+        Args:
+            fields: Mapping from field name to ``(shape, region)``.
+            flags: Names of boolean flags.
+            names: Names of the name-list entries.
+        """
+        self._fields = dict(fields)
+        self._regions = sorted({region for _, region in self._fields.values()})
+        self._flag_names = list(flags)
+        total = sum(math.prod(shape) for shape, _ in self._fields.values())
+        self._block = torch.zeros(total, dtype=torch.float32).share_memory_()
+        self._seq = torch.zeros(len(self._regions), dtype=torch.int64).share_memory_()
+        self._stamps = torch.zeros(len(self._regions), dtype=torch.float64).share_memory_()
+        self._flags = torch.zeros(len(self._flag_names), dtype=torch.int32).share_memory_()
+        self._names: dict[str, list[str]] = {name: [] for name in names}
+        self._build_views()
+
+    def _build_views(self):
+        self._views: dict[str, torch.Tensor] = {}
+        self._field_region: dict[str, int] = {}
+        offset = 0
+        for key, (shape, region) in self._fields.items():
+            numel = math.prod(shape)
+            self._views[key] = self._block[offset : offset + numel].view(shape)
+            self._field_region[key] = self._regions.index(region)
+            offset += numel
+
+    def __getstate__(self):
+        # tensors are reduced to shared-memory handles by the torch multiprocessing pickler
+        return {
+            "fields": self._fields,
+            "regions": self._regions,
+            "flag_names": self._flag_names,
+            "block": self._block,
+            "seq": self._seq,
+            "stamps": self._stamps,
+            "flags": self._flags,
+            "names": self._names,
+        }
+
+    def __setstate__(self, state):
+        self._fields = state["fields"]
+        self._regions = state["regions"]
+        self._flag_names = state["flag_names"]
+        self._block = state["block"]
+        self._seq = state["seq"]
+        self._stamps = state["stamps"]
+        self._flags = state["flags"]
+        self._names = state["names"]
+        self._build_views()
+
+    """
+    Dictionary-like access.
+    """
+
+    def __getitem__(self, key: str):
+        if key in self._views:
+            return self._views[key]
+        if key in self._names:
+            return self._names[key]
+        return bool(self._flags[self._flag_names.index(key)])
+
+    def __setitem__(self, key: str, value):
+        if key in self._views:
+            self._views[key].copy_(value)
+        elif key in self._names:
+            self._names[key] = list(value)
+        else:
+            self._flags[self._flag_names.index(key)] = int(bool(value))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._views or key in self._names or key in self._flag_names
+
+    def keys(self) -> list[str]:
+        return list(self._views) + list(self._names) + self._flag_names
+
+    """
+    Consistent access.
+    """
+
+    @contextmanager
+    def write(self, region: str, stamp: float | None = None) -> Iterator[SharedArticulationData]:
+        """Context in which the single writer of ``region`` updates its fields in place, and optionally its stamp."""
+        index = self._regions.index(region)
+        seq = self._seq[index]
+        seq += 1
+        try:
+            if stamp is not None:
+                self._stamps[index] = stamp
+            yield self
+        finally:
+            seq += 1
+
+    def read(self, key: str) -> torch.Tensor:
+        """Return a copy of field ``key`` that is not torn by a concurrent writer."""
+        return self.read_many(key)[0]
+
+    def read_many(self, *keys: str) -> tuple[torch.Tensor, ...]:
+        """Return copies of the fields ``keys`` that all belong to the same completed publish."""
+        return self.read_stamped(*keys)[1]
+
+    def read_stamped(self, *keys: str) -> tuple[float, tuple[torch.Tensor, ...]]:
+        """Return the stamp of the publish and copies of the fields ``keys`` that all belong to it.
+
+        If the fields span several regions, the oldest stamp of these regions is returned.
+        """
+        regions = sorted({self._field_region[key] for key in keys})
+        while True:
+            start = self._seq[regions]
+            if torch.any(start % 2 == 1):
+                # a publish is in progress, yield so that a writer thread of this process can finish it
+                time.sleep(0)
+                continue
+            values = tuple(self._views[key].clone() for key in keys)
+            stamp = self._stamps[regions].min().item()
+            if torch.equal(self._seq[regions], start):
+                return stamp, values
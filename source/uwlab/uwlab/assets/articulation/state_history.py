@@ -0,0 +1,117 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import bisect
+import torch
+
+
+class JointStateHistory:
+    """Fixed-size ring buffer of timestamped joint states.
+
+    Every sample carries the time at which it was read from the hardware, on the :func:`time.monotonic` clock. The
+    history can be sampled at any time: between two samples the joint states are interpolated linearly, after the
+    newest sample the joint positions are extrapolated with the newest joint velocities, for at most
+    ``max_extrapolation`` seconds. This allows observations to describe the robot at the time the next action is
+    applied, instead of at the time of the last read.
+
+    The timestamps are kept on the host, so sampling the history never waits for the device.
+    """
+
+    def __init__(self, capacity: int, num_instances: int, num_joints: int, device: str, max_extrapolation: float = 0.1):
+        """Allocate the history.
+
+        Args:
+            capacity: Number of samples kept.
+            num_instances: Number of articulation instances.
+            num_joints: Number of joints of the articulation.
+            device: Device of the joint states.
+            max_extrapolation: Longest time in seconds the joint positions are extrapolated past the newest sample.
+                Defaults to 0.1.
+
+        Raises:
+            ValueError: If the capacity is smaller than 1.
+        """
+        if capacity < 1:
+            raise ValueError(f"The capacity of the joint state history must be at least 1, got {capacity}.")
+        self.capacity = capacity
+        self.max_extrapolation = max_extrapolation
+        self._pos = torch.zeros(capacity, num_instances, num_joints, device=device)
+        self._vel = torch.zeros(capacity, num_instances, num_joints, device=device)
+        # timestamps of the samples from oldest to newest, and the slots holding them
+        self._stamps: list[float] = []
+        self._slots: list[int] = []
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    @property
+    def latest_stamp(self) -> float | None:
+        """Read time of the newest sample, None if the history is empty."""
+        return self._stamps[-1] if self._stamps else None
+
+    @property
+    def oldest_stamp(self) -> float | None:
+        """Read time of the oldest sample, None if the history is empty."""
+        return self._stamps[0] if self._stamps else None
+
+    def append(self, stamp: float, joint_pos: torch.Tensor, joint_vel: torch.Tensor) -> bool:
+        """Add a sample, overwriting the oldest one if the history is full.
+
+        Samples not newer than the newest sample are ignored, e.g. when the same hardware read is polled twice.
+
+        Returns:
+            Whether the sample was added.
+        """
+        if self._stamps and stamp <= self._stamps[-1]:
+            return False
+        slot = self._next_slot
+        self._pos[slot] = joint_pos
+        self._vel[slot] = joint_vel
+        if len(self._stamps) == self.capacity:
+            self._stamps.pop(0)
+            self._slots.pop(0)
+        self._stamps.append(stamp)
+        self._slots.append(slot)
+        self._next_slot = (slot + 1) % self.capacity
+        return True
+
+    def reset(self):
+        """Drop all samples."""
+        self._stamps.clear()
+        self._slots.clear()
+        self._next_slot = 0
+
+    def sample(self, stamp: float) -> tuple[torch.Tensor, torch.Tensor]:
+        """Joint positions and velocities at time ``stamp``.
+
+        Times before the oldest sample return the oldest sample.
+
+        Returns:
+            The joint positions and velocities, of shape (num_instances, num_joints).
+
+        Raises:
+            RuntimeError: If the history is empty.
+        """
+        if not self._stamps:
+            raise RuntimeError("Cannot sample an empty joint state history.")
+        index = bisect.bisect_right(self._stamps, stamp)
+        if index == 0:
+            slot = self._slots[0]
+            return self._pos[slot].clone(), self._vel[slot].clone()
+        if index == len(self._stamps):
+            # extrapolate the positions from the newest sample
+            slot = self._slots[-1]
+            elapsed = min(stamp - self._stamps[-1], self.max_extrapolation)
+            return self._pos[slot] + self._vel[slot] * elapsed, self._vel[slot].clone()
+        # interpolate between the samples around the time
+        before, after = self._slots[index - 1], self._slots[index]
+        weight = (stamp - self._stamps[index - 1]) / (self._stamps[index] - self._stamps[index - 1])
+        return (
+            torch.lerp(self._pos[before], self._pos[after], weight),
+            torch.lerp(self._vel[before], self._vel[after], weight),
+        )
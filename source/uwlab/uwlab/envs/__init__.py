@@ -28,6 +28,6 @@ Based on these workflows, there are the following environment classes for single
 """
 
 from .data_manager_based_rl import DataManagerBasedRLEnv
-from .data_manager_based_rl_cfg import DataManagerBasedRLEnvCfg
+from .data_manager_based_rl_cfg import DataManagerBasedRLEnvCfg, FusedTermsCfg, ProfilerCfg
 from .real_rl_env import RealRLEnv
 from .real_rl_env_cfg import RealRLEnvCfg
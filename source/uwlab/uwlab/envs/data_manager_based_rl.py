@@ -10,18 +10,25 @@
 
 from __future__ import annotations
 
+import contextlib
 import torch
 from collections.abc import Sequence
 
+import omni.log
+
 from isaaclab.envs import ManagerBasedEnvCfg, ManagerBasedRLEnv
 from isaaclab.envs.manager_based_env import VecEnvObs
 from isaaclab.managers import EventManager
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.markers.config import FRAME_MARKER_CFG
 from isaaclab.utils.timer import Timer
+from uwlab.assets import UniversalArticulation
 from uwlab.scene import InteractiveScene
+from uwlab.utils.cuda_graph import CudaGraphCallable
+from uwlab.utils.timing import StepProfiler
 
 from ..managers.data_manager import DataManager
+from ..managers.fused_terms import FusedTermEvaluator
 from .data_manager_based_rl_cfg import DataManagerBasedRLEnvCfg
 
 VecEnvStepReturn = tuple[VecEnvObs, torch.Tensor, torch.Tensor, torch.Tensor, dict]
@@ -172,6 +179,8 @@ class DataManagerBasedRLEnv(ManagerBasedRLEnv):
         # initialize data and constants
         # -- counter for curriculum
         self.common_step_counter = 0
+        # -- step of the last log of the data infos
+        self._last_data_info_log = -self.cfg.data_info_log_interval
         # -- init buffers
         self.episode_length_buf = torch.zeros(self.num_envs, device=self.device, dtype=torch.long)
         # -- set the framerate of the gym video recorder wrapper so that the playback speed of the produced video matches the simulation
@@ -228,7 +237,10 @@ class DataManagerBasedRLEnv(ManagerBasedRLEnv):
             A tuple containing the observations, rewards, resets (terminated and truncated) and extras.
         """
         # process actions
-        self.action_manager.process_action(action)
+        with self._profile("action_process"):
+            self.action_manager.process_action(action)
+            if self._substep_graph is not None:
+                self._bind_graph_processed_actions()
 
         self.recorder_manager.record_pre_step()
 
@@ -239,31 +251,46 @@ class DataManagerBasedRLEnv(ManagerBasedRLEnv):
         for _ in range(self.cfg.decimation):
             self._sim_step_counter += 1
             # set actions into buffers
-            self.action_manager.apply_action()
+            if self._substep_graph is not None:
+                # the graph also runs the actuator models of the universal articulations
+                for articulation in self._graph_articulations:
+                    articulation._update_static_joint_state()
+                with self._profile("substep_graph"):
+                    self._substep_graph()
+            else:
+                with self._profile("action_apply"):
+                    self.action_manager.apply_action()
             # set actions into simulator
-            self.scene.write_data_to_sim()
+            with self._profile("scene_write"):
+                self.scene.write_data_to_sim()
             # simulate
-            self.sim.step(render=False)
+            with self._profile("sim_step"):
+                self.sim.step(render=False)
             # render between steps only if the GUI or an RTX sensor needs it
             # note: we assume the render interval to be the shortest accepted rendering interval.
             #    If a camera needs rendering at a faster frequency, this will lead to unexpected behavior.
             if self._sim_step_counter % self.cfg.sim.render_interval == 0 and is_rendering:
-                self.sim.render()
+                with self._profile("render"):
+                    self.sim.render()
             # update buffers at sim dt
-            self.scene.update(dt=self.physics_dt)
+            with self._profile("scene_update"):
+                self.scene.update(dt=self.physics_dt)
 
         if hasattr(self, "data_manager"):
-            self.data_manager.compute()
+            with self._profile("data"):
+                self.data_manager.compute(dt=self.step_dt)
         # post-step:
         # -- update env counters (used for curriculum generation)
         self.episode_length_buf += 1  # step in current episode (per env)
         self.common_step_counter += 1  # total step (common for all envs)
         # -- check terminations
-        self.reset_buf = self.termination_manager.compute()
+        with self._profile("termination"):
+            self.reset_buf = self.termination_manager.compute()
         self.reset_terminated = self.termination_manager.terminated
         self.reset_time_outs = self.termination_manager.time_outs
         # -- reward computation
-        self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+        with self._profile("reward"):
+            self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
 
         if len(self.recorder_manager.active_terms) > 0:
             # update observations for recording if needed
@@ -271,31 +298,38 @@ class DataManagerBasedRLEnv(ManagerBasedRLEnv):
             self.recorder_manager.record_post_step()
 
         # -- reset envs that terminated/timed-out and log the episode information
-        reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
-        if len(reset_env_ids) > 0:
-            # trigger recorder terms for pre-reset calls
-            self.recorder_manager.record_pre_reset(reset_env_ids)
+        with self._profile("reset"):
+            reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
+            if len(reset_env_ids) > 0:
+                # trigger recorder terms for pre-reset calls
+                self.recorder_manager.record_pre_reset(reset_env_ids)
 
-            self._reset_idx(reset_env_ids)
-            # update articulation kinematics
-            self.scene.write_data_to_sim()
-            self.sim.forward()
+                self._reset_idx(reset_env_ids)
+                # update articulation kinematics, the commands of the other environments are already in the sim
+                self.scene.write_data_to_sim(reset_env_ids)
+                self.sim.forward()
 
-            # if sensors are added to the scene, make sure we render to reflect changes in reset
-            if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
-                self.sim.render()
+                # if sensors are added to the scene, make sure we render to reflect changes in reset
+                if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
+                    self.sim.render()
 
-            # trigger recorder terms for post-reset calls
-            self.recorder_manager.record_post_reset(reset_env_ids)
+                # trigger recorder terms for post-reset calls
+                self.recorder_manager.record_post_reset(reset_env_ids)
 
         # -- update command
-        self.command_manager.compute(dt=self.step_dt)
+        with self._profile("command"):
+            self.command_manager.compute(dt=self.step_dt)
         # -- step interval events
         if "interval" in self.event_manager.available_modes:
-            self.event_manager.apply(mode="interval", dt=self.step_dt)
+            with self._profile("event"):
+                self.event_manager.apply(mode="interval", dt=self.step_dt)
         # -- compute observations
         # note: done after reset to get the correct observations for reset envs
-        self.obs_buf = self.observation_manager.compute()
+        with self._profile("observation"):
+            self.obs_buf = self.observation_manager.compute()
+
+        if self.profiler is not None:
+            self._close_profiler_step()
 
         # return observations, rewards, resets and extras
         return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
@@ -305,11 +339,154 @@ class DataManagerBasedRLEnv(ManagerBasedRLEnv):
             self.data_manager: DataManager = DataManager(self.cfg.data, self)
             print("[INFO] Data Manager: ", self.data_manager)
         super().load_managers()
+        self._substep_graph: CudaGraphCallable | None = None
+        if self.cfg.capture_substep:
+            self._prepare_substep_graph()
+        if self.cfg.fused_terms is not None:
+            self._fuse_manager_terms()
+        # create the profiler after the managers, as it instruments their terms
+        self.profiler: StepProfiler | None = None
+        if self.cfg.profiler is not None:
+            self.profiler = StepProfiler(window=self.cfg.profiler.window, cuda_sync=self.cfg.profiler.cuda_sync)
+            self._instrument_manager_terms()
 
     def _reset_idx(self, env_ids: Sequence[int]):
+        infos = {}
+        if getattr(self, "data_manager", None) is not None:
+            # the infos are accumulated on the device and only read on the logging cadence
+            flush = self.common_step_counter - self._last_data_info_log >= self.cfg.data_info_log_interval
+            infos = self.data_manager.reset(env_ids, flush=flush)
+            if flush:
+                self._last_data_info_log = self.common_step_counter
+        super()._reset_idx(env_ids)
+        # the log is recreated by the base class, so the data infos are added afterwards
+        self.extras["log"].update(infos)
+
+    """
+    Helper functions - CUDA graphs.
+    """
+
+    def _prepare_substep_graph(self):
+        """Sets up the CUDA graph of the action application and actuator models of a physics substep."""
+        if "cuda" not in self.device:
+            omni.log.warn("Capturing the substep requires a CUDA device, running it eagerly.")
+            return
+        self._graph_articulations: list[UniversalArticulation] = [
+            articulation
+            for articulation in self.scene.articulations.values()
+            if isinstance(articulation, UniversalArticulation)
+        ]
+        for articulation in self._graph_articulations:
+            articulation._actuator_model_captured = True
+        # the action terms rebind their processed actions in every call of process_actions, while the graph has to
+        # read them at a fixed address, so they are copied into persistent buffers before the substeps
+        self._graph_processed_actions: dict[str, torch.Tensor] = {}
+        self._bind_graph_processed_actions()
+        self._substep_graph = CudaGraphCallable(
+            self._captured_substep, inputs=self._substep_graph_inputs, name="substep"
+        )
+
+    def _captured_substep(self):
+        self.action_manager.apply_action()
+        for articulation in self._graph_articulations:
+            articulation._apply_actuator_model_static()
+
+    def _bind_graph_processed_actions(self):
+        """Copies the processed actions of the action terms into the persistent buffers read by the substep graph.
+
+        The buffers are bound as the processed actions of the terms, so :meth:`apply_actions` reads them. A buffer is
+        only reallocated if the shape or type of the processed actions changes, which captures the graph again.
+        """
+        for name, term in self.action_manager._terms.items():
+            processed_actions = getattr(term, "_processed_actions", None)
+            if not isinstance(processed_actions, torch.Tensor):
+                continue
+            buffer = self._graph_processed_actions.get(name)
+            if processed_actions is buffer:
+                continue
+            if buffer is None or buffer.shape != processed_actions.shape or buffer.dtype != processed_actions.dtype:
+                buffer = self._graph_processed_actions[name] = processed_actions.clone()
+            else:
+                buffer.copy_(processed_actions)
+            term._processed_actions = buffer
+
+    def _substep_graph_inputs(self) -> list[torch.Tensor]:
+        """Buffers the substep graph reads and writes, it is captured again if any of them is reallocated."""
+        tensors = [self.action_manager.action]
+        for term in self.action_manager._terms.values():
+            tensors += [term.raw_actions, term.processed_actions]
+        for articulation in self._graph_articulations:
+            data = articulation.data
+            tensors += [data.joint_pos_target, data.joint_vel_target, data.joint_effort_target]
+            tensors += [
+                articulation._joint_pos_target_sim,
+                articulation._joint_vel_target_sim,
+                articulation._joint_effort_target_sim,
+            ]
+        return tensors
+
+    """
+    Helper functions - Fused terms.
+    """
+
+    def _fuse_manager_terms(self):
+        """Replaces the reward and observation terms with fused, compiled evaluations."""
+        fused_cfg = self.cfg.fused_terms
+        evaluators: list[FusedTermEvaluator] = []
+        if fused_cfg.rewards:
+            # terms with zero weight are skipped by the reward manager, and stay unfused
+            term_cfgs = [term_cfg for term_cfg in self.reward_manager._term_cfgs if term_cfg.weight != 0.0]
+            evaluators.append(FusedTermEvaluator(self, term_cfgs, mode=fused_cfg.mode))
+        if fused_cfg.observations:
+            for term_cfgs in self.observation_manager._group_obs_term_cfgs.values():
+                evaluators.append(FusedTermEvaluator(self, term_cfgs, mode=fused_cfg.mode))
+        for evaluator in evaluators:
+            if evaluator.num_terms > 0:
+                evaluator.install()
+
+    """
+    Helper functions - Profiling.
+    """
+
+    def _profile(self, name: str) -> contextlib.AbstractContextManager:
+        """Times the enclosed phase of the step if profiling is enabled."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.scope(name)
+
+    def _instrument_manager_terms(self):
+        """Wraps the terms of all managers so that the profiler times every term within its phase."""
+        profiler = self.profiler
+        # function and class based terms, timed through their configuration
+        term_cfgs = [
+            *zip(self.reward_manager._term_names, self.reward_manager._term_cfgs),
+            *zip(self.termination_manager._term_names, self.termination_manager._term_cfgs),
+        ]
+        for mode, names in self.event_manager._mode_term_names.items():
+            term_cfgs += zip(names, self.event_manager._mode_term_cfgs[mode])
+        for group, names in self.observation_manager._group_obs_term_names.items():
+            group_cfgs = self.observation_manager._group_obs_term_cfgs[group]
+            term_cfgs += zip([f"{group}/{name}" for name in names], group_cfgs)
+        for name, term_cfg in term_cfgs:
+            term_cfg.func = profiler.wrap(name, term_cfg.func)
+        # object based terms, timed through their methods
+        for name, term in self.action_manager._terms.items():
+            term.process_actions = profiler.wrap(name, term.process_actions)
+            term.apply_actions = profiler.wrap(name, term.apply_actions)
+        for name, term in self.command_manager._terms.items():
+            term.compute = profiler.wrap(name, term.compute)
         if getattr(self, "data_manager", None) is not None:
-            self.data_manager.reset(env_ids)
-        return super()._reset_idx(env_ids)
+            # data terms are computed on first access, so they show up under the phase that reads them first
+            for name, term in self.data_manager._terms.items():
+                term.compute = profiler.wrap(f"data:{name}", term.compute)
+
+    def _close_profiler_step(self):
+        self.profiler.step()
+        log_interval = self.cfg.profiler.log_interval
+        if log_interval > 0 and self.profiler.num_steps % log_interval == 0:
+            print(self.profiler.table())
+            if self.cfg.profiler.trace_path is not None:
+                self.profiler.export_chrome_trace(self.cfg.profiler.trace_path)
 
     def close(self):
         for key, val in self.extensions.items():
@@ -14,6 +14,72 @@ from isaaclab.envs.manager_based_rl_env_cfg import ManagerBasedRLEnvCfg
 from isaaclab.utils import configclass
 
 
+@configclass
+class ProfilerCfg:
+    """Configuration of the step profiler of :class:`DataManagerBasedRLEnv`."""
+
+    window: int = 100
+    """Number of steps the timings are aggregated over. Defaults to 100."""
+
+    cuda_sync: bool = True
+    """Whether to synchronize CUDA around every phase and term to measure its device time. Defaults to True.
+
+    This stalls the device at every boundary and slows down the step, disable it to only measure host time.
+    """
+
+    log_interval: int = 0
+    """Number of steps between printing the profile table. Defaults to 0 (never)."""
+
+    trace_path: str | None = None
+    """Path of the chrome trace JSON written every :attr:`log_interval` steps. Defaults to None (no trace)."""
+
+
+@configclass
+class FusedTermsCfg:
+    """Configuration of the fused evaluation of manager terms, see :class:`~uwlab.managers.FusedTermEvaluator`."""
+
+    rewards: bool = True
+    """Whether to fuse the reward terms with non-zero weight. Defaults to True."""
+
+    observations: bool = True
+    """Whether to fuse the terms of every observation group. Defaults to True."""
+
+    mode: str = "default"
+    """Compilation mode of :func:`torch.compile`. Defaults to "default".
+
+    Use "reduce-overhead" to also replay the fused terms as CUDA graphs.
+    """
+
+
 @configclass
 class DataManagerBasedRLEnvCfg(ManagerBasedRLEnvCfg):
     data: object | None = None
+
+    capture_substep: bool = False
+    """Whether to replay the action application and actuator models of every physics substep as a CUDA graph.
+    Defaults to False.
+
+    This removes the kernel launch overhead of the decimation loop. It requires a CUDA device, and action terms and
+    actuator models that keep their tensors at fixed addresses and have no host side state changing between
+    substeps (e.g. the delayed actuators advance a Python side index, and must not be captured). The processed
+    actions of the action terms, which are usually reallocated on every step, are copied into persistent buffers
+    before the substeps. If capturing fails, the substep runs eagerly.
+    """
+
+    data_info_log_interval: int = 1
+    """Minimum number of environment steps between two logs of the infos of the data terms. Defaults to 1.
+
+    The infos of the reset environments are accumulated on the device and only read when they are logged, as the
+    statistics over the environments reset since the previous log. With the default, the infos are logged on every
+    reset, as the mean over the environments reset in that step.
+
+    A larger interval reduces how often the infos are read from the device, but only some of the logged episode
+    infos then contain the keys of the data infos. It requires a logger that merges the keys of all episode infos
+    of an iteration, e.g. the :class:`OnPolicyRunner` of ``uwlab_rl`` only logs the keys of the first one.
+    """
+
+    fused_terms: FusedTermsCfg | None = None
+    """Compile the reward and observation terms into fused functions. Defaults to None (terms run one by one)."""
+
+    profiler: ProfilerCfg | None = None
+    """Step profiler timing every phase of the step and every manager term. Defaults to None (disabled)."""
@@ -3,9 +3,16 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from __future__ import annotations
+
 import torch
+from typing import TYPE_CHECKING
 
 from isaaclab.envs import ManagerBasedRLEnv
+from isaaclab.managers import SceneEntityCfg
+
+if TYPE_CHECKING:
+    from uwlab.assets import UniversalArticulation
 
 
 def life_spent(env: ManagerBasedRLEnv) -> torch.Tensor:
@@ -14,3 +21,42 @@ def life_spent(env: ManagerBasedRLEnv) -> torch.Tensor:
     else:
         life_spent = torch.zeros(env.num_envs, device=env.device, dtype=torch.float)
     return life_spent.view(-1, 1)
+
+
+def _joint_state_at_action_time(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg) -> tuple[torch.Tensor, torch.Tensor]:
+    """Joint positions and velocities of the asset at the time the next action is applied.
+
+    Falls back to the latest joint states if the asset keeps no state history or the environment does not predict
+    the action apply time (e.g. in simulation).
+    """
+    asset: UniversalArticulation = env.scene[asset_cfg.name]
+    history = getattr(asset, "state_history", None)
+    if history is None or len(history) == 0 or not hasattr(env, "action_apply_time"):
+        return asset.data.joint_pos, asset.data.joint_vel
+    return history.sample(env.action_apply_time)
+
+
+def joint_pos_rel_at_action_time(
+    env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """The joint positions of the asset w.r.t. the default joint positions, at the time the next action is applied.
+
+    The positions are interpolated or extrapolated from the timestamped state history of the asset, see
+    :attr:`uwlab.assets.ArticulationCfg.state_history_length`.
+    """
+    asset: UniversalArticulation = env.scene[asset_cfg.name]
+    joint_pos, _ = _joint_state_at_action_time(env, asset_cfg)
+    return joint_pos[:, asset_cfg.joint_ids] - asset.data.default_joint_pos[:, asset_cfg.joint_ids]
+
+
+def joint_vel_rel_at_action_time(
+    env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """The joint velocities of the asset w.r.t. the default joint velocities, at the time the next action is applied.
+
+    The velocities are interpolated from the timestamped state history of the asset, see
+    :attr:`uwlab.assets.ArticulationCfg.state_history_length`.
+    """
+    asset: UniversalArticulation = env.scene[asset_cfg.name]
+    _, joint_vel = _joint_state_at_action_time(env, asset_cfg)
+    return joint_vel[:, asset_cfg.joint_ids] - asset.data.default_joint_vel[:, asset_cfg.joint_ids]
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import math
 import numpy as np
+import time
 import torch
 from typing import TYPE_CHECKING, Any, ClassVar, Sequence
 
@@ -74,6 +75,18 @@ class RealRLEnv(ManagerBasedRLEnv):
 
         self._sim_step_counter = 0
 
+        # -- sense to act latency
+        # note: the time of the last observation and the read time of the oldest joint state it was computed from
+        self._observation_time: float | None = None
+        self._observed_stamp: float | None = None
+        self.policy_latency = 0.0
+        """Smoothed time in seconds from computing the observations to applying the resulting action."""
+        self.sense_to_act_latency = 0.0
+        """Time in seconds from reading the joint states to applying the action computed from them, last step."""
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self._latency_count = 0
+
         # allocate dictionary to store metrics
         self.extras = {}
 
@@ -112,6 +125,15 @@ class RealRLEnv(ManagerBasedRLEnv):
     def step_dt(self) -> float:
         return self.cfg.scene.dt
 
+    @property
+    def action_apply_time(self) -> float:
+        """Expected time on the :func:`time.monotonic` clock at which the next action is applied, in seconds.
+
+        Observation terms can sample the :attr:`~uwlab.assets.UniversalArticulation.state_history` of the
+        articulations at this time to compensate the latency between reading the robot and acting on it.
+        """
+        return time.monotonic() + self.policy_latency
+
     """
     Operations - Setup.
     """
@@ -158,7 +180,9 @@ class RealRLEnv(ManagerBasedRLEnv):
         self.recorder_manager.record_pre_step()
 
         # perform physics stepping
-        for _ in range(self.cfg.decimation):
+        for substep in range(self.cfg.decimation):
+            if substep == 0:
+                self._record_action_latency()
             self._sim_step_counter += 1
             # set actions into buffers
             self.action_manager.apply_action()
@@ -204,6 +228,7 @@ class RealRLEnv(ManagerBasedRLEnv):
         # -- compute observations
         # note: done after reset to get the correct observations for reset envs
         self.obs_buf = self.observation_manager.compute()
+        self._record_observation_time()
 
         # return observations, rewards, resets and extras
         return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
@@ -229,6 +254,7 @@ class RealRLEnv(ManagerBasedRLEnv):
 
         # compute observations
         self.obs_buf = self.observation_manager.compute()
+        self._record_observation_time()
 
         self.extras = dict()
 
@@ -238,6 +264,7 @@ class RealRLEnv(ManagerBasedRLEnv):
         return torch_utils.set_seed(seed)
 
     def close(self) -> None:
+        self.scene.close()
         del self.command_manager
         del self.reward_manager
         del self.termination_manager
@@ -245,6 +272,37 @@ class RealRLEnv(ManagerBasedRLEnv):
         del self.observation_manager
         del self.event_manager
 
+    def _record_observation_time(self):
+        """Store when the observations were computed and when the oldest joint state they used was read."""
+        self._observation_time = time.monotonic()
+        stamps = [
+            articulation.state_history.latest_stamp
+            for articulation in self.scene.articulations.values()
+            if articulation.state_history is not None and len(articulation.state_history) > 0
+        ]
+        if stamps:
+            self._observed_stamp = min(stamps)
+        elif self.scene.snapshot is not None:
+            self._observed_stamp = min(self.scene.snapshot.read_times.values(), default=self.scene.snapshot.timestamp)
+        else:
+            self._observed_stamp = self._observation_time
+
+    def _record_action_latency(self):
+        """Measure the latencies of the action about to be applied."""
+        if self._observation_time is None:
+            return
+        apply_time = time.monotonic()
+        policy_latency = apply_time - self._observation_time
+        # smooth the policy latency, it predicts the apply time of the next action
+        if self._latency_count == 0 and self.policy_latency == 0.0:
+            self.policy_latency = policy_latency
+        else:
+            self.policy_latency += 0.1 * (policy_latency - self.policy_latency)
+        self.sense_to_act_latency = apply_time - self._observed_stamp
+        self._latency_sum += self.sense_to_act_latency
+        self._latency_max = max(self._latency_max, self.sense_to_act_latency)
+        self._latency_count += 1
+
     def _configure_gym_env_spaces(self):
         super()._configure_gym_env_spaces()
 
@@ -287,6 +345,15 @@ class RealRLEnv(ManagerBasedRLEnv):
         # -- termination manager
         info = self.termination_manager.reset(env_ids)
         self.extras["log"].update(info)
+        # -- timing of the hardware poll loops
+        for key, value in self.scene.get_loop_statistics().items():
+            self.extras["log"][f"Timing/{key}"] = value
+        # -- sense to act latency since the last reset
+        if self._latency_count > 0:
+            self.extras["log"]["Timing/sense_to_act_latency_mean"] = self._latency_sum / self._latency_count
+            self.extras["log"]["Timing/sense_to_act_latency_max"] = self._latency_max
+            self.extras["log"]["Timing/policy_latency"] = self.policy_latency
+            self._latency_sum, self._latency_max, self._latency_count = 0.0, 0.0, 0
 
         # reset the episode length buffer
         self.episode_length_buf[env_ids] = 0
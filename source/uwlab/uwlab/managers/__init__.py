@@ -9,4 +9,5 @@ Data manager is written to handle task oriented data structure needed for effici
 """
 
 from .data_manager import DataManager, DataTerm
+from .fused_terms import FusedTerm, FusedTermEvaluator
 from .manager_term_cfg import DataTermCfg
@@ -115,14 +115,15 @@ class DataTerm(ManagerTermBase):
         # return success
         return True
 
-    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, float]:
+    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, torch.Tensor]:
         """Reset the data manager and log infos.
 
         Args:
             env_ids: The list of environment IDs to reset. Defaults to None.
 
         Returns:
-            A dictionary containing the information to log under the "{name}" key.
+            A dictionary with the values of every info in the reset environments, as tensors of shape
+            (num_reset_envs,) on the device. The data manager accumulates them into :class:`InfoStatistics`.
         """
         # resolve the environment IDs
         if env_ids is None:
@@ -131,8 +132,8 @@ class DataTerm(ManagerTermBase):
         # add logging infos
         extras = {}
         for info_name, info_value in self.infos.items():
-            # compute the mean info value
-            extras[info_name] = torch.mean(info_value[env_ids]).item()
+            # copy the info values of the reset environments
+            extras[info_name] = info_value[env_ids].clone()
             # reset the info value
             info_value[env_ids] = 0.0
 
@@ -180,6 +181,63 @@ class DataTerm(ManagerTermBase):
         raise NotImplementedError(f"Debug visualization is not implemented for {self.__class__.__name__}.")
 
 
+class InfoStatistics:
+    """Running statistics of an info over the reset environments, kept on the device.
+
+    The sum, count, minimum, maximum and optionally a histogram of the values are updated without synchronizing with
+    the device, and are only read when the statistics are logged.
+    """
+
+    def __init__(self, device: str, histogram_edges: Sequence[float] | None = None):
+        """Initialize the statistics.
+
+        Args:
+            device: Device the statistics are kept on.
+            histogram_edges: Increasing inner bin edges of the histogram. The first bin collects the values below the
+                first edge and the last bin the values above the last edge. Defaults to None (no histogram).
+        """
+        self.sum = torch.zeros((), dtype=torch.float64, device=device)
+        self.count = torch.zeros((), dtype=torch.int64, device=device)
+        self.min = torch.full((), float("inf"), device=device)
+        self.max = torch.full((), float("-inf"), device=device)
+        self.histogram_edges = None
+        self.histogram = None
+        self.histogram_labels: list[str] = []
+        """Names of the histogram bins, as the half-open interval of the values they collect."""
+        if histogram_edges is not None:
+            self.histogram_edges = torch.tensor(histogram_edges, dtype=torch.float, device=device)
+            self.histogram = torch.zeros(len(histogram_edges) + 1, dtype=torch.int64, device=device)
+            bounds = [float("-inf"), *histogram_edges, float("inf")]
+            self.histogram_labels = [f"[{lower:g},{upper:g})" for lower, upper in zip(bounds[:-1], bounds[1:])]
+
+    @property
+    def mean(self) -> torch.Tensor:
+        """Mean of the values, zero if there are none."""
+        return (self.sum / self.count.clamp_min(1)).float()
+
+    def add(self, values: torch.Tensor):
+        """Add the values of the reset environments."""
+        values = values.flatten().float()
+        # note: the number of elements is known on the host, so checking it does not synchronize
+        if values.numel() == 0:
+            return
+        self.sum += values.sum()
+        self.count += values.numel()
+        torch.minimum(self.min, values.min(), out=self.min)
+        torch.maximum(self.max, values.max(), out=self.max)
+        if self.histogram is not None:
+            bins = torch.bucketize(values, self.histogram_edges, right=True)
+            self.histogram.index_add_(0, bins, torch.ones_like(bins))
+
+    def reset(self):
+        self.sum.zero_()
+        self.count.zero_()
+        self.min.fill_(float("inf"))
+        self.max.fill_(float("-inf"))
+        if self.histogram is not None:
+            self.histogram.zero_()
+
+
 class DataManager(ManagerBase):
     """Manager for generating data.
 
@@ -204,6 +262,11 @@ class DataManager(ManagerBase):
     The data terms are implemented as classes that inherit from the :class:`DataTerm` class.
     Each data manager term should also have a corresponding configuration class that inherits from the
     :class:`DataTermCfg` class.
+
+    Terms are computed lazily: :meth:`compute` only marks the data of all terms as outdated, and a term is computed
+    on its first access through :meth:`get_data` or :meth:`get_term` in the step, after the terms listed in its
+    :attr:`DataTermCfg.dependencies`. Terms that no manager reads in a step are not computed at all, except those
+    with :attr:`DataTermCfg.always_compute` or debug visualization enabled.
     """
 
     _env: ManagerBasedRLEnv
@@ -218,6 +281,15 @@ class DataManager(ManagerBase):
         """
         # create buffers to parse and store terms
         self._terms: dict[str, DataTerm] = dict()
+        # terms to compute, in order, before each term (its dependencies and then the term itself)
+        self._compute_order: dict[str, list[str]] = dict()
+        # terms whose data is up to date for the current step
+        self._computed: set[str] = set()
+        # terms read at least once by other managers
+        self._consumed: set[str] = set()
+        # statistics of the infos of the terms, by log key
+        self._info_statistics: dict[str, InfoStatistics] = dict()
+        self._dt = 0.0
 
         # call the base class constructor (this prepares the terms)
         super().__init__(cfg, env)
@@ -235,12 +307,12 @@ class DataManager(ManagerBase):
         # create table for term information
         table = PrettyTable()
         table.title = "Active Data Terms"
-        table.field_names = ["Index", "Name", "Type"]
+        table.field_names = ["Index", "Name", "Type", "Dependencies"]
         # set alignment of table columns
         table.align["Name"] = "l"
         # add info on each term
         for index, (name, term) in enumerate(self._terms.items()):
-            table.add_row([index, name, term.__class__.__name__])
+            table.add_row([index, name, term.__class__.__name__, ", ".join(term.cfg.dependencies)])
         # convert table to string
         msg += table.get_string()
         msg += "\n"
@@ -256,6 +328,16 @@ class DataManager(ManagerBase):
         """Name of active data terms."""
         return list(self._terms.keys())
 
+    @property
+    def info_statistics(self) -> dict[str, InfoStatistics]:
+        """Statistics of the infos of the terms since they were last flushed, by "Infos/{term_name}/{info_name}"."""
+        return self._info_statistics
+
+    @property
+    def consumed_terms(self) -> list[str]:
+        """Name of data terms that were read through :meth:`get_data` or :meth:`get_term` so far."""
+        return [name for name in self._terms if name in self._consumed]
+
     @property
     def has_debug_vis_implementation(self) -> bool:
         """Whether the data terms have debug visualization implemented."""
@@ -284,6 +366,7 @@ class DataManager(ManagerBase):
         terms = []
         idx = 0
         for name, term in self._terms.items():
+            self._compute_term(name)
             terms.append((name, term.data[env_idx].cpu().tolist()))
             idx += term.data.shape[1]
         return terms
@@ -301,63 +384,104 @@ class DataManager(ManagerBase):
         for term in self._terms.values():
             term.set_debug_vis(debug_vis)
 
-    def reset(self, env_ids: Sequence[int] | None = None) -> dict[str, torch.Tensor]:
-        """Reset the data terms and log their infos.
+    def reset(self, env_ids: Sequence[int] | None = None, flush: bool = True) -> dict[str, torch.Tensor]:
+        """Reset the data terms and accumulate their infos.
+
+        The infos of the reset environments are added to the :attr:`info_statistics` on the device, without
+        synchronizing.
 
         Args:
             env_ids: The list of environment IDs to reset. Defaults to None.
+            flush: Whether to return and clear the accumulated statistics. Defaults to True, which logs the infos of
+                every reset.
 
         Returns:
-            A dictionary containing the information to log under the "Infos/{term_name}/{info_name}" key.
+            The output of :meth:`flush_infos` if ``flush`` is set, otherwise an empty dictionary.
         """
         # resolve environment ids
         if env_ids is None:
             env_ids = slice(None)
-        # store information
-        extras = {}
         for name, term in self._terms.items():
             # reset the data term
             infos = term.reset(env_ids=env_ids)
-            # compute the mean info value
+            # accumulate the info values
             for info_name, info_value in infos.items():
-                extras[f"Infos/{name}/{info_name}"] = info_value
-        # return logged information
+                key = f"Infos/{name}/{info_name}"
+                if key not in self._info_statistics:
+                    self._info_statistics[key] = InfoStatistics(self.device, term.cfg.info_histogram_edges)
+                self._info_statistics[key].add(info_value)
+        return self.flush_infos() if flush else {}
+
+    def flush_infos(self) -> dict[str, torch.Tensor]:
+        """Returns the accumulated statistics of the infos and clears them.
+
+        Returns:
+            A dictionary with the mean of every info under the "Infos/{term_name}/{info_name}" key, and its minimum
+            and maximum under the ".../min" and ".../max" keys. For infos with a histogram, the fraction of the values
+            in every bin is under the ".../histogram/{bin}" keys, with bins named by their interval, e.g. "[0,0.5)".
+            The values are scalar tensors on the device, reduced when logged. Infos without values since the last
+            flush are left out.
+        """
+        extras = {}
+        if not self._info_statistics:
+            return extras
+        # note: the counts of all infos are read on the host in a single transfer per flush
+        counts = torch.stack([statistics.count for statistics in self._info_statistics.values()]).tolist()
+        for (key, statistics), count in zip(self._info_statistics.items(), counts):
+            if count == 0:
+                continue
+            extras[key] = statistics.mean
+            extras[f"{key}/min"] = statistics.min.clone()
+            extras[f"{key}/max"] = statistics.max.clone()
+            if statistics.histogram is not None:
+                fractions = statistics.histogram / count
+                for label, fraction in zip(statistics.histogram_labels, fractions.unbind()):
+                    extras[f"{key}/histogram/{label}"] = fraction
+            statistics.reset()
         return extras
 
     def compute(self, dt: float):
         """Updates the data.
 
-        This function calls each data term managed by the class.
+        This function marks the data of all terms as outdated. The terms are computed on their next access, except
+        the ones that are always computed or visualized, which are computed right away.
 
         Args:
             dt: The time-step interval of the environment.
 
         """
-        # iterate over all the data terms
-        for term in self._terms.values():
-            # compute term's value
-            term.compute(dt)
+        self._dt = dt
+        self._computed.clear()
+        for name, term in self._terms.items():
+            if term.cfg.always_compute or term.cfg.debug_vis:
+                self._compute_term(name)
 
     def get_data(self, name: str) -> torch.Tensor:
         """Returns the data for the specified data term.
 
+        The term (and its dependencies) is computed first if its data is outdated.
+
         Args:
             name: The name of the data term.
 
         Returns:
             The data tensor of the specified data term.
         """
-        return self._terms[name].data
+        return self.get_term(name).data
 
     def get_term(self, name: str) -> DataTerm:
         """Returns the data term with the specified name.
 
+        The term (and its dependencies) is computed first if its data is outdated.
+
         Args:
             name: The name of the data term.
 
         Returns:
             The data term with the specified name.
         """
+        self._consumed.add(name)
+        self._compute_term(name)
         return self._terms[name]
 
     """
@@ -388,3 +512,36 @@ class DataManager(ManagerBase):
                 raise TypeError(f"Returned object for the term '{term_name}' is not of type DataType.")
             # add class to dict
             self._terms[term_name] = term
+        # resolve the order in which the dependencies of each term are computed
+        for term_name in self._terms:
+            self._compute_order[term_name] = self._resolve_compute_order(term_name, [])
+        # the terms start out up to date, as they are only outdated once the environment steps
+        self._computed.update(self._terms)
+
+    def _resolve_compute_order(self, term_name: str, visiting: list[str]) -> list[str]:
+        """Returns the dependencies of the term in topological order, followed by the term itself."""
+        if term_name in visiting:
+            cycle = " -> ".join(visiting[visiting.index(term_name) :] + [term_name])
+            raise ValueError(f"Data terms have a cyclic dependency: {cycle}.")
+        if term_name not in self._terms:
+            raise ValueError(
+                f"Data term '{visiting[-1]}' depends on '{term_name}', which is not a data term."
+                f" Available terms: {list(self._terms.keys())}."
+            )
+        order = []
+        for dependency in self._terms[term_name].cfg.dependencies:
+            for name in self._resolve_compute_order(dependency, visiting + [term_name]):
+                if name not in order:
+                    order.append(name)
+        order.append(term_name)
+        return order
+
+    def _compute_term(self, term_name: str):
+        """Computes the term and its dependencies, if they were not computed in the current step yet."""
+        if term_name in self._computed:
+            return
+        for name in self._compute_order[term_name]:
+            if name not in self._computed:
+                # mark before computing, so that a term reading its own data does not recurse
+                self._computed.add(name)
+                self._terms[name].compute(self._dt)
@@ -0,0 +1,97 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Fused evaluation of manager terms."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+import omni.log
+
+from isaaclab.managers.manager_term_cfg import ManagerTermBaseCfg
+
+from ..utils.wrappers import ForwardingCallable
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+class FusedTermEvaluator:
+    """Evaluates a set of manager terms as one compiled function.
+
+    Each term of a reward manager or an observation group is typically a small function launching a handful of
+    kernels, and many terms recompute the same intermediates (e.g. the norm of the base velocity). The evaluator
+    traces all terms into one function and compiles it with :func:`torch.compile`, which merges the kernels and
+    computes shared subexpressions once. With ``mode="reduce-overhead"``, the compiled graph is additionally
+    replayed as a CUDA graph.
+
+    The managers keep calling their terms as before: :meth:`install` replaces the function of every term
+    configuration with a :class:`FusedTerm`. The first term called in a pass of the manager runs the fused function
+    for all terms, the other terms of the pass return their cached outputs. A pass ends when a term is called a
+    second time. If compilation fails, the terms are evaluated eagerly.
+
+    Note:
+        Terms are evaluated with the parameters of their configuration at the time of evaluation, not with the
+        arguments the manager passes to the :class:`FusedTerm`.
+    """
+
+    def __init__(self, env: ManagerBasedRLEnv, term_cfgs: Sequence[ManagerTermBaseCfg], mode: str = "default"):
+        """Initialize the evaluator.
+
+        Args:
+            env: The environment passed to the terms.
+            term_cfgs: Configurations of the terms to fuse.
+            mode: The compilation mode of :func:`torch.compile`. Defaults to "default".
+        """
+        self._env = env
+        self._term_cfgs = list(term_cfgs)
+        self._funcs: list[Callable[..., torch.Tensor]] = [term_cfg.func for term_cfg in self._term_cfgs]
+        self._outputs: tuple[torch.Tensor, ...] | None = None
+        self._consumed: set[int] = set()
+        self._compiled = torch.compile(self._evaluate, mode=mode, dynamic=False)
+
+    @property
+    def num_terms(self) -> int:
+        return len(self._funcs)
+
+    def install(self):
+        """Replace the functions of the term configurations with :class:`FusedTerm` instances."""
+        for index, term_cfg in enumerate(self._term_cfgs):
+            term_cfg.func = FusedTerm(self, index, self._funcs[index])
+
+    def output(self, index: int) -> torch.Tensor:
+        """Output of the term at ``index`` in the current pass, evaluating all terms if a new pass starts."""
+        if self._outputs is None or index in self._consumed:
+            self._outputs = self._run()
+            self._consumed.clear()
+        self._consumed.add(index)
+        return self._outputs[index]
+
+    def _run(self) -> tuple[torch.Tensor, ...]:
+        if self._compiled is not None:
+            try:
+                return self._compiled()
+            except Exception as e:
+                omni.log.warn(f"Compiling the fused terms failed, falling back to eager evaluation: {e}")
+                self._compiled = None
+        return self._evaluate()
+
+    def _evaluate(self) -> tuple[torch.Tensor, ...]:
+        return tuple(func(self._env, **term_cfg.params) for func, term_cfg in zip(self._funcs, self._term_cfgs))
+
+
+class FusedTerm(ForwardingCallable):
+    """Stand-in for the function of a term evaluated by a :class:`FusedTermEvaluator`."""
+
+    def __init__(self, evaluator: FusedTermEvaluator, index: int, func: Callable[..., torch.Tensor]):
+        super().__init__(func)
+        self._evaluator = evaluator
+        self._index = index
+
+    def __call__(self, *args, **kwargs) -> torch.Tensor:
+        return self._evaluator.output(self._index)
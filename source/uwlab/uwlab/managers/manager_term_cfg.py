@@ -41,6 +41,26 @@ class DataTermCfg(ManagerTermBaseCfg):
 
     history_length: int = 1
 
+    dependencies: list[str] = []
+    """Names of the data terms this term reads while computing. Defaults to an empty list.
+
+    The data manager computes the dependencies of a term before the term itself.
+    """
+
+    always_compute: bool = False
+    """Whether to compute the term on every step even if no other manager reads it. Defaults to False.
+
+    Terms are otherwise computed lazily on their first access in a step. Set this for terms whose state or infos
+    have to advance every step, e.g. terms that integrate over time.
+    """
+
+    info_histogram_edges: list[float] | None = None
+    """Inner bin edges of the histograms of the infos of the term. Defaults to None (no histograms).
+
+    The histograms are accumulated on the device and logged as the fraction of the values in every bin, see
+    :meth:`uwlab.managers.DataManager.flush_infos`.
+    """
+
 
 @configclass
 class DataGroupCfg:
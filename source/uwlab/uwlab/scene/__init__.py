@@ -27,5 +27,5 @@ actions to the scene. All these are handled by different "managers" in the frame
 
 from .interactive_scene import InteractiveScene
 from .interactive_scene_cfg import InteractiveSceneCfg
-from .scene_context import SceneContext
+from .scene_context import SceneContext, SceneSnapshot
 from .scene_context_cfg import SceneContextCfg
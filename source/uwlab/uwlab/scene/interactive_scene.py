@@ -31,6 +31,7 @@ from isaaclab.assets import (
     RigidObjectCollectionCfg,
 )
 from isaaclab.sensors import ContactSensorCfg, FrameTransformerCfg, SensorBase, SensorBaseCfg
+from uwlab.assets import UniversalArticulation
 from uwlab.terrains import TerrainImporter, TerrainImporterCfg
 
 from .interactive_scene_cfg import InteractiveSceneCfg
@@ -486,11 +487,19 @@ class InteractiveScene:
             rigid_object.write_root_velocity_to_sim(root_velocity, env_ids=env_ids)
         self.write_data_to_sim()
 
-    def write_data_to_sim(self):
-        """Writes the data of the scene entities to the simulation."""
+    def write_data_to_sim(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Writes the data of the scene entities to the simulation.
+
+        Args:
+            env_ids: Environment indices to write. Only universal articulations restrict their writes to them, the
+                other entities always write all environments. Defaults to None (all environments).
+        """
         # -- assets
         for articulation in self._articulations.values():
-            articulation.write_data_to_sim()
+            if env_ids is not None and isinstance(articulation, UniversalArticulation):
+                articulation.write_data_to_sim(env_ids)
+            else:
+                articulation.write_data_to_sim()
         for deformable_object in self._deformable_objects.values():
             deformable_object.write_data_to_sim()
         for rigid_object in self._rigid_objects.values():
@@ -5,8 +5,11 @@
 
 from __future__ import annotations
 
+import time
 import torch
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from isaaclab.sensors import SensorBase, SensorBaseCfg
@@ -16,6 +19,29 @@ if TYPE_CHECKING:
     from .scene_context_cfg import SceneContextCfg
 
 
+@dataclass
+class SceneSnapshot:
+    """Joint states of all articulations of a :class:`SceneContext`, read in one update."""
+
+    timestamp: float
+    """Time on the :func:`time.monotonic` clock at which the last articulation was read, in seconds."""
+
+    read_duration: float
+    """Duration of the update, bounded by the slowest articulation when they are read concurrently, in seconds."""
+
+    joint_pos: dict[str, torch.Tensor] = field(default_factory=dict)
+    """Joint positions of each articulation, of shape (num_envs, num_joints)."""
+
+    joint_vel: dict[str, torch.Tensor] = field(default_factory=dict)
+    """Joint velocities of each articulation, of shape (num_envs, num_joints)."""
+
+    read_times: dict[str, float] = field(default_factory=dict)
+    """Time on the :func:`time.monotonic` clock at which each articulation was read, in seconds.
+
+    For articulations with a :attr:`~uwlab.assets.UniversalArticulation.state_history`, this is the time the view
+    measured the joint states."""
+
+
 class SceneContext:
     """EXPERIMENTAL FEATURE
     Different from :class`InteractiveScene`, SceneContext are scene designed to allow more asset
@@ -47,6 +73,10 @@ class SceneContext:
 
         self._global_prim_paths = list()
 
+        # the view I/O of the articulations is spread across a thread pool so blocking calls overlap
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._snapshot: SceneSnapshot | None = None
+
         if self._is_scene_setup_from_cfg():
             # add entities from config
             self._add_entities_from_cfg()
@@ -112,6 +142,11 @@ class SceneContext:
     def env_origins(self) -> torch.Tensor:
         return torch.zeros((self.num_envs, 3), device=self.device)
 
+    @property
+    def snapshot(self) -> SceneSnapshot | None:
+        """Joint states of all articulations read in the last :meth:`update`, None before the first update."""
+        return self._snapshot
+
     """
     Operations.
     """
@@ -124,6 +159,15 @@ class SceneContext:
         # -- sensors
         for sensor in self._sensors.values():
             sensor._initialize_impl(self.device)
+        # -- concurrent I/O
+        if self.cfg.concurrent_io and len(self._articulations) > 1:
+            self._io_pool = ThreadPoolExecutor(max_workers=len(self._articulations), thread_name_prefix="scene_io")
+
+    def close(self):
+        """Stops the threads reading and writing the articulations."""
+        if self._io_pool is not None:
+            self._io_pool.shutdown()
+            self._io_pool = None
 
     def reset(self, env_ids: Sequence[int] | None = None):
         """Resets the scene entities.
@@ -140,24 +184,59 @@ class SceneContext:
             sensor.reset(env_ids)
 
     def write_data_to_context(self):
-        """Writes the data of the scene entities to the simulation."""
+        """Writes the data of the scene entities to the simulation.
+
+        The articulations are written concurrently if :attr:`SceneContextCfg.concurrent_io` is set.
+        """
         # -- assets
-        for articulation in self._articulations.values():
-            articulation.write_data_to_sim()
+        self._map_articulations(lambda articulation: articulation.write_data_to_sim())
 
     def update(self, dt: float) -> None:
         """Update the scene entities.
 
+        The joint states of the articulations are read concurrently if :attr:`SceneContextCfg.concurrent_io` is set,
+        and merged into :attr:`snapshot`.
+
         Args:
             dt: The amount of time passed from last :meth:`update` call.
         """
-        # -- assets
-        for articulation in self._articulations.values():
+
+        def read(articulation: UniversalArticulation) -> tuple[torch.Tensor, torch.Tensor, float]:
             articulation.update(dt)
+            joint_pos, joint_vel = articulation.data.joint_pos, articulation.data.joint_vel
+            # prefer the time the view measured the joint states over the time they were read here
+            history = articulation.state_history
+            if history is not None and len(history) > 0:
+                return joint_pos, joint_vel, history.latest_stamp
+            return joint_pos, joint_vel, time.monotonic()
+
+        # -- assets
+        start = time.monotonic()
+        samples = self._map_articulations(read)
+        snapshot = SceneSnapshot(timestamp=start, read_duration=time.monotonic() - start)
+        for name, (joint_pos, joint_vel, read_time) in zip(self._articulations.keys(), samples):
+            snapshot.joint_pos[name] = joint_pos
+            snapshot.joint_vel[name] = joint_vel
+            snapshot.read_times[name] = read_time
+            snapshot.timestamp = max(snapshot.timestamp, read_time)
+        self._snapshot = snapshot
         # -- sensors
         for sensor in self._sensors.values():
             sensor.update(dt, force_recompute=not self.cfg.lazy_sensor_update)
 
+    def get_loop_statistics(self) -> dict[str, float]:
+        """Timing statistics of the loops polling the articulations.
+
+        Returns:
+            A flat dictionary with keys ``"<articulation name>/<statistic>"``, see
+            :meth:`uwlab.utils.timing.LoopStatistics.summary` for the statistics.
+        """
+        statistics = dict()
+        for name, articulation in self._articulations.items():
+            for key, value in articulation.view.get_loop_statistics().items():
+                statistics[f"{name}/{key}"] = value
+        return statistics
+
     """
     Operations: Iteration.
     """
@@ -206,6 +285,13 @@ class SceneContext:
     Internal methods.
     """
 
+    def _map_articulations(self, func: Callable[[UniversalArticulation], Any]) -> list[Any]:
+        """Calls ``func`` on every articulation, from the thread pool if there is one, and returns the results."""
+        if self._io_pool is None:
+            return [func(articulation) for articulation in self._articulations.values()]
+        # consume the iterator so exceptions raised by an articulation propagate to the caller
+        return list(self._io_pool.map(func, self._articulations.values()))
+
     def _is_scene_setup_from_cfg(self):
         from .scene_context_cfg import SceneContextCfg
 
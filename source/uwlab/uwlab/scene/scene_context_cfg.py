@@ -24,6 +24,13 @@ class SceneContextCfg:
     """Number of environment instances handled by the scene."""
     # DO NOT MODIFY NUM_ENVS DEFAULT VALUE, REAL ENVIRONMENT IS UNLIKELY TO HAVE MORE THAN 1 ENVIRONMENT
 
+    concurrent_io: bool = True
+    """Whether to read and write the articulations concurrently from a thread pool. Default is True.
+
+    The articulations are then updated and written at the same time, so the latency of a step is bounded by the
+    slowest device instead of the sum of all devices. Only used when the scene has more than one articulation.
+    """
+
     lazy_sensor_update: bool = True
     """Whether to update sensors only when they are accessed. Default is True.
 
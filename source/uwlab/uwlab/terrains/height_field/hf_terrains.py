@@ -8,7 +8,13 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-"""Functions to generate height fields for different terrains."""
+"""Functions to generate height fields for different terrains.
+
+Every function generates the height fields of a batch of sub-terrains of the same configuration, one per
+difficulty, and draws the random numbers of every sub-terrain from its own generator. The decorator
+:func:`~uwlab.terrains.height_field.utils.height_field_to_mesh` turns them into the mesh functions used by the
+terrain generator.
+"""
 
 from __future__ import annotations
 
@@ -16,14 +22,16 @@ import numpy as np
 import scipy.interpolate as interpolate
 from typing import TYPE_CHECKING
 
-from isaaclab.terrains.height_field.utils import height_field_to_mesh
+from .utils import height_field_to_mesh
 
 if TYPE_CHECKING:
     from . import hf_terrains_cfg
 
 
 @height_field_to_mesh
-def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUniformTerrainCfg) -> np.ndarray:
+def random_uniform_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfRandomUniformTerrainCfg
+) -> np.ndarray:
     """Generate a terrain with height sampled uniformly from a specified range.
 
     .. image:: ../../_static/terrains/height_field/random_uniform_terrain.jpg
@@ -31,15 +39,16 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
        :align: center
 
     Note:
-        The :obj:`difficulty` parameter is ignored for this terrain.
+        The :obj:`difficulties` parameter is ignored for this terrain.
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
 
     Raises:
@@ -70,22 +79,29 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
     # create range of heights possible
     height_range = np.arange(height_min, height_max + height_step, height_step)
     # sample heights randomly from the range along a grid
-    height_field_downsampled = np.random.choice(height_range, size=(width_downsampled, length_downsampled))
-    # create interpolation function for the sampled heights
+    height_fields_downsampled = np.stack(
+        [rng.choice(height_range, size=(width_downsampled, length_downsampled)) for rng in rngs]
+    )
+    # create interpolation matrices for the sampled heights
+    # note: the interpolating bicubic spline is separable and linear in the sampled heights, so it is evaluated
+    #   for all terrains with two matrix products
     x = np.linspace(0, cfg.size[0] * cfg.horizontal_scale, width_downsampled)
     y = np.linspace(0, cfg.size[1] * cfg.horizontal_scale, length_downsampled)
-    func = interpolate.RectBivariateSpline(x, y, height_field_downsampled)
-
-    # interpolate the sampled heights to obtain the height field
     x_upsampled = np.linspace(0, cfg.size[0] * cfg.horizontal_scale, width_pixels)
     y_upsampled = np.linspace(0, cfg.size[1] * cfg.horizontal_scale, length_pixels)
-    z_upsampled = func(x_upsampled, y_upsampled)
+    interp_x = interpolate.make_interp_spline(x, np.eye(width_downsampled), k=3)(x_upsampled)
+    interp_y = interpolate.make_interp_spline(y, np.eye(length_downsampled), k=3)(y_upsampled)
+
+    # interpolate the sampled heights to obtain the height fields
+    z_upsampled = interp_x @ height_fields_downsampled @ interp_y.T
     # round off the interpolated heights to the nearest vertical step
     return np.rint(z_upsampled).astype(np.int16)
 
 
 @height_field_to_mesh
-def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlopedTerrainCfg) -> np.ndarray:
+def pyramid_sloped_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfPyramidSlopedTerrainCfg
+) -> np.ndarray:
     """Generate a terrain with a truncated pyramid structure.
 
     The terrain is a pyramid-shaped sloped surface with a slope of :obj:`slope` that trims into a flat platform
@@ -102,19 +118,20 @@ def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlop
        :width: 40%
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
     # resolve terrain configuration
     if cfg.inverted:
-        slope = -cfg.slope_range[0] - difficulty * (cfg.slope_range[1] - cfg.slope_range[0])
+        slopes = -cfg.slope_range[0] - difficulties * (cfg.slope_range[1] - cfg.slope_range[0])
     else:
-        slope = cfg.slope_range[0] + difficulty * (cfg.slope_range[1] - cfg.slope_range[0])
+        slopes = cfg.slope_range[0] + difficulties * (cfg.slope_range[1] - cfg.slope_range[0])
 
     # switch parameters to discrete units
     # -- horizontal scale
@@ -122,7 +139,7 @@ def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlop
     length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
     # -- height
     # we want the height to be 1/2 of the width since the terrain is a pyramid
-    height_max = int(slope * cfg.size[0] / 2 / cfg.vertical_scale)
+    height_max = (slopes * cfg.size[0] / 2 / cfg.vertical_scale).astype(int)
     # -- center of the terrain
     center_x = int(width_pixels / 2)
     center_y = int(length_pixels / 2)
@@ -137,24 +154,25 @@ def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlop
     # reshape the meshgrid to be 2D
     xx = xx.reshape(width_pixels, 1)
     yy = yy.reshape(1, length_pixels)
-    # create a sloped surface
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    hf_raw = height_max * xx * yy
+    # create the sloped surfaces
+    hf_raw = height_max[:, None, None] * xx * yy
 
-    # create a flat platform at the center of the terrain
+    # create a flat platform at the center of the terrains
     platform_width = int(cfg.platform_width / cfg.horizontal_scale / 2)
-    # get the height of the platform at the corner of the platform
+    # get the height of the platforms at the corner of the platform
     x_pf = width_pixels // 2 - platform_width
     y_pf = length_pixels // 2 - platform_width
-    z_pf = hf_raw[x_pf, y_pf]
-    hf_raw = np.clip(hf_raw, min(0, z_pf), max(0, z_pf))
+    z_pf = hf_raw[:, x_pf, y_pf, None, None]
+    hf_raw = np.clip(hf_raw, np.minimum(0, z_pf), np.maximum(0, z_pf))
 
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
 
 
 @height_field_to_mesh
-def pyramid_stairs_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidStairsTerrainCfg) -> np.ndarray:
+def pyramid_stairs_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfPyramidStairsTerrainCfg
+) -> np.ndarray:
     """Generate a terrain with a pyramid stair pattern.
 
     The terrain is a pyramid stair pattern which trims to a flat platform at the center of the terrain.
@@ -169,53 +187,53 @@ def pyramid_stairs_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidStai
        :width: 40%
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
     # resolve terrain configuration
-    step_height = cfg.step_height_range[0] + difficulty * (cfg.step_height_range[1] - cfg.step_height_range[0])
+    step_heights = cfg.step_height_range[0] + difficulties * (cfg.step_height_range[1] - cfg.step_height_range[0])
     if cfg.inverted:
-        step_height *= -1
+        step_heights *= -1
     # switch parameters to discrete units
     # -- terrain
     width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
     length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
     # -- stairs
     step_width = int(cfg.step_width / cfg.horizontal_scale)
-    step_height = int(step_height / cfg.vertical_scale)
+    step_heights = (step_heights / cfg.vertical_scale).astype(int)
     # -- platform
     platform_width = int(cfg.platform_width / cfg.horizontal_scale)
 
-    # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # add the steps
-    current_step_height = 0
-    start_x, start_y = 0, 0
-    stop_x, stop_y = width_pixels, length_pixels
-    while (stop_x - start_x) > platform_width and (stop_y - start_y) > platform_width:
-        # increment position
-        # -- x
-        start_x += step_width
-        stop_x -= step_width
-        # -- y
-        start_y += step_width
-        stop_y -= step_width
-        # increment height
-        current_step_height += step_height
-        # add the step
-        hf_raw[start_x:stop_x, start_y:stop_y] = current_step_height
+    # count the steps until the flat platform at the center
+    num_steps = 0
+    size_x, size_y = width_pixels, length_pixels
+    while size_x > platform_width and size_y > platform_width:
+        num_steps += 1
+        size_x -= 2 * step_width
+        size_y -= 2 * step_width
+    # the k-th step covers the pixels at least k step widths away from the border
+    x = np.arange(width_pixels)
+    y = np.arange(length_pixels)
+    distance_x = np.minimum(x, width_pixels - 1 - x)[:, None]
+    distance_y = np.minimum(y, length_pixels - 1 - y)[None, :]
+    levels = np.minimum(np.minimum(distance_x, distance_y) // step_width, num_steps)
+    # create the terrains with the same steps scaled by their step heights
+    hf_raw = step_heights[:, None, None] * levels
 
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
 
 
 @height_field_to_mesh
-def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscreteObstaclesTerrainCfg) -> np.ndarray:
+def discrete_obstacles_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfDiscreteObstaclesTerrainCfg
+) -> np.ndarray:
     """Generate a terrain with randomly generated obstacles as pillars with positive and negative heights.
 
     The terrain is a flat platform at the center of the terrain with randomly generated obstacles as pillars
@@ -228,16 +246,17 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
        :align: center
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
     # resolve terrain configuration
-    obs_height = cfg.obstacle_height_range[0] + difficulty * (
+    obs_heights = cfg.obstacle_height_range[0] + difficulties * (
         cfg.obstacle_height_range[1] - cfg.obstacle_height_range[0]
     )
 
@@ -246,7 +265,7 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
     length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
     # -- obstacles
-    obs_height = int(obs_height / cfg.vertical_scale)
+    obs_heights = (obs_heights / cfg.vertical_scale).astype(int)
     obs_width_min = int(cfg.obstacle_width_range[0] / cfg.horizontal_scale)
     obs_width_max = int(cfg.obstacle_width_range[1] / cfg.horizontal_scale)
     # -- center of the terrain
@@ -260,41 +279,47 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     obs_x_range = np.arange(0, width_pixels, 4)
     obs_y_range = np.arange(0, length_pixels, 4)
 
-    # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # generate the obstacles
-    for _ in range(cfg.num_obstacles):
-        # sample size
-        if cfg.obstacle_height_mode == "choice":
-            height = np.random.choice([-obs_height, -obs_height // 2, obs_height // 2, obs_height])
-        elif cfg.obstacle_height_mode == "fixed":
-            height = obs_height
-        else:
-            raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
-        width = int(np.random.choice(obs_width_range))
-        length = int(np.random.choice(obs_length_range))
-        # sample position
-        x_start = int(np.random.choice(obs_x_range))
-        y_start = int(np.random.choice(obs_y_range))
-        # clip start position to the terrain
-        if x_start + width > width_pixels:
-            x_start = width_pixels - width
-        if y_start + length > length_pixels:
-            y_start = length_pixels - length
-        # add to terrain
-        hf_raw[x_start : x_start + width, y_start : y_start + length] = height
+    # sample the obstacles of all terrains, of shape (N, num_obstacles)
+    if cfg.obstacle_height_mode == "choice":
+        height_choices = np.stack([-obs_heights, -obs_heights // 2, obs_heights // 2, obs_heights], axis=1)
+        choices = np.stack([rng.integers(0, 4, size=cfg.num_obstacles) for rng in rngs])
+        heights = np.take_along_axis(height_choices, choices, axis=1)
+    elif cfg.obstacle_height_mode == "fixed":
+        heights = np.repeat(obs_heights[:, None], cfg.num_obstacles, axis=1)
+    else:
+        raise ValueError(f"Unknown obstacle height mode '{cfg.obstacle_height_mode}'. Must be 'choice' or 'fixed'.")
+    # -- size
+    widths = np.stack([rng.choice(obs_width_range, size=cfg.num_obstacles) for rng in rngs])
+    lengths = np.stack([rng.choice(obs_length_range, size=cfg.num_obstacles) for rng in rngs])
+    # -- position, with the start position clipped to the terrain
+    x_starts = np.stack([rng.choice(obs_x_range, size=cfg.num_obstacles) for rng in rngs])
+    y_starts = np.stack([rng.choice(obs_y_range, size=cfg.num_obstacles) for rng in rngs])
+    x_starts = np.minimum(x_starts, width_pixels - widths)
+    y_starts = np.minimum(y_starts, length_pixels - lengths)
+
+    # create terrains with a flat platform at the center
+    hf_raw = np.zeros((len(difficulties), width_pixels, length_pixels))
+    # add the obstacles in order to all terrains at once, later obstacles cover earlier ones
+    x = np.arange(width_pixels)[None, :]
+    y = np.arange(length_pixels)[None, :]
+    for i in range(cfg.num_obstacles):
+        inside_x = (x >= x_starts[:, i, None]) & (x < (x_starts[:, i] + widths[:, i])[:, None])
+        inside_y = (y >= y_starts[:, i, None]) & (y < (y_starts[:, i] + lengths[:, i])[:, None])
+        np.copyto(hf_raw, heights[:, i, None, None], where=inside_x[:, :, None] & inside_y[:, None, :])
     # clip the terrain to the platform
     x1 = (width_pixels - platform_width) // 2
     x2 = (width_pixels + platform_width) // 2
     y1 = (length_pixels - platform_width) // 2
     y2 = (length_pixels + platform_width) // 2
-    hf_raw[x1:x2, y1:y2] = 0
+    hf_raw[:, x1:x2, y1:y2] = 0
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
 
 
 @height_field_to_mesh
-def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np.ndarray:
+def wave_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfWaveTerrainCfg
+) -> np.ndarray:
     r"""Generate a terrain with a wave pattern.
 
     The terrain is a flat platform at the center of the terrain with a wave pattern. The wave pattern
@@ -313,12 +338,13 @@ def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np
        :align: center
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
 
     Raises:
@@ -329,12 +355,12 @@ def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np
         raise ValueError(f"Number of waves must be a positive integer. Got: {cfg.num_waves}.")
 
     # resolve terrain configuration
-    amplitude = cfg.amplitude_range[0] + difficulty * (cfg.amplitude_range[1] - cfg.amplitude_range[0])
+    amplitudes = cfg.amplitude_range[0] + difficulties * (cfg.amplitude_range[1] - cfg.amplitude_range[0])
     # switch parameters to discrete units
     # -- terrain
     width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
     length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
-    amplitude_pixels = int(0.5 * amplitude / cfg.vertical_scale)
+    amplitude_pixels = (0.5 * amplitudes / cfg.vertical_scale).astype(int)
 
     # compute the wave number: nu = 2 * pi / lambda
     wave_length = length_pixels / cfg.num_waves
@@ -346,16 +372,16 @@ def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np
     xx = xx.reshape(width_pixels, 1)
     yy = yy.reshape(1, length_pixels)
 
-    # create a terrain with a flat platform at the center
-    hf_raw = np.zeros((width_pixels, length_pixels))
-    # add the waves
-    hf_raw += amplitude_pixels * (np.cos(yy * wave_number) + np.sin(xx * wave_number))
+    # create the terrains with the same waves scaled by their amplitudes
+    hf_raw = amplitude_pixels[:, None, None] * (np.cos(yy * wave_number) + np.sin(xx * wave_number))
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
 
 
 @height_field_to_mesh
-def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingStonesTerrainCfg) -> np.ndarray:
+def stepping_stones_terrain(
+    difficulties: np.ndarray, rngs: list[np.random.Generator], cfg: hf_terrains_cfg.HfSteppingStonesTerrainCfg
+) -> np.ndarray:
     """Generate a terrain with a stepping stones pattern.
 
     The terrain is a stepping stones pattern which trims to a flat platform at the center of the terrain.
@@ -365,17 +391,18 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
        :align: center
 
     Args:
-        difficulty: The difficulty of the terrain. This is a value between 0 and 1.
-        cfg: The configuration for the terrain.
+        difficulties: The difficulties of the terrains, with values between 0 and 1. Shape is (N,).
+        rngs: The random number generators of the terrains.
+        cfg: The configuration for the terrains.
 
     Returns:
-        The height field of the terrain as a 2D numpy array with discretized heights.
-        The shape of the array is (width, length), where width and length are the number of points
+        The height fields of the terrains as a 3D numpy array with discretized heights.
+        The shape of the array is (N, width, length), where width and length are the number of points
         along the x and y axis, respectively.
     """
     # resolve terrain configuration
-    stone_width = cfg.stone_width_range[1] - difficulty * (cfg.stone_width_range[1] - cfg.stone_width_range[0])
-    stone_distance = cfg.stone_distance_range[0] + difficulty * (
+    stone_widths = cfg.stone_width_range[1] - difficulties * (cfg.stone_width_range[1] - cfg.stone_width_range[0])
+    stone_distances = cfg.stone_distance_range[0] + difficulties * (
         cfg.stone_distance_range[1] - cfg.stone_distance_range[0]
     )
 
@@ -384,8 +411,8 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
     width_pixels = int(cfg.size[0] / cfg.horizontal_scale)
     length_pixels = int(cfg.size[1] / cfg.horizontal_scale)
     # -- stones
-    stone_distance = int(stone_distance / cfg.horizontal_scale)
-    stone_width = int(stone_width / cfg.horizontal_scale)
+    stone_distances = (stone_distances / cfg.horizontal_scale).astype(int)
+    stone_widths = (stone_widths / cfg.horizontal_scale).astype(int)
     stone_height_max = int(cfg.stone_height_max / cfg.vertical_scale)
     # -- holes
     holes_depth = int(cfg.holes_depth / cfg.vertical_scale)
@@ -394,48 +421,68 @@ def stepping_stones_terrain(difficulty: float, cfg: hf_terrains_cfg.HfSteppingSt
     # create range of heights
     stone_height_range = np.arange(-stone_height_max - 1, stone_height_max, step=1)
 
-    # create a terrain with a flat platform at the center
-    hf_raw = np.full((width_pixels, length_pixels), holes_depth)
     # add the stones
-    start_x, start_y = 0, 0
-    # -- if the terrain is longer than it is wide then fill the terrain column by column
+    # -- if the terrain is longer than it is wide then fill the terrain column by column, otherwise row by row
     if length_pixels >= width_pixels:
-        while start_y < length_pixels:
-            # ensure that stone stops along y-axis
-            stop_y = min(length_pixels, start_y + stone_width)
-            # randomly sample x-position
-            start_x = np.random.randint(0, stone_width)
-            stop_x = max(0, start_x - stone_distance)
-            # fill first stone
-            hf_raw[0:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-            # fill row with stones
-            while start_x < width_pixels:
-                stop_x = min(width_pixels, start_x + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-                start_x += stone_width + stone_distance
-            # update y-position
-            start_y += stone_width + stone_distance
-    elif width_pixels > length_pixels:
-        while start_x < width_pixels:
-            # ensure that stone stops along x-axis
-            stop_x = min(width_pixels, start_x + stone_width)
-            # randomly sample y-position
-            start_y = np.random.randint(0, stone_width)
-            stop_y = max(0, start_y - stone_distance)
-            # fill first stone
-            hf_raw[start_x:stop_x, 0:stop_y] = np.random.choice(stone_height_range)
-            # fill column with stones
-            while start_y < length_pixels:
-                stop_y = min(length_pixels, start_y + stone_width)
-                hf_raw[start_x:stop_x, start_y:stop_y] = np.random.choice(stone_height_range)
-                start_y += stone_width + stone_distance
-            # update x-position
-            start_x += stone_width + stone_distance
+        hf_raw = _stepping_stones(
+            width_pixels, length_pixels, stone_widths, stone_distances, stone_height_range, holes_depth, rngs
+        )
+    else:
+        hf_raw = _stepping_stones(
+            length_pixels, width_pixels, stone_widths, stone_distances, stone_height_range, holes_depth, rngs
+        ).transpose(0, 2, 1)
     # add the platform in the center
     x1 = (width_pixels - platform_width) // 2
     x2 = (width_pixels + platform_width) // 2
     y1 = (length_pixels - platform_width) // 2
     y2 = (length_pixels + platform_width) // 2
-    hf_raw[x1:x2, y1:y2] = 0
+    hf_raw[:, x1:x2, y1:y2] = 0
     # round off the heights to the nearest vertical step
     return np.rint(hf_raw).astype(np.int16)
+
+
+"""
+Helper functions.
+"""
+
+
+def _stepping_stones(
+    num_along: int,
+    num_across: int,
+    stone_widths: np.ndarray,
+    stone_distances: np.ndarray,
+    stone_height_range: np.ndarray,
+    holes_depth: int,
+    rngs: list[np.random.Generator],
+) -> np.ndarray:
+    """Lay out stepping stones in lines along the first axis, with the lines spaced along the second axis.
+
+    Every line starts with a stone at a random offset smaller than the stone width. The pixels before that stone
+    are covered by a first stone, except for the stone distance in front of it.
+
+    Returns:
+        The heights of the stones and holes. Shape is (N, num_along, num_across).
+    """
+    periods = stone_widths + stone_distances
+    # sample the line offsets and the stone heights of every terrain
+    # note: the number of random numbers drawn only depends on the terrain itself, not on the other terrains of the
+    #   batch, the samples are padded to the densest terrain
+    num_lines = (num_across - 1) // periods + 1
+    num_stones = (num_along - 1) // periods + 2
+    starts = np.zeros((len(rngs), num_lines.max()), dtype=int)
+    heights = np.zeros((len(rngs), num_lines.max(), num_stones.max()), dtype=stone_height_range.dtype)
+    for i, rng in enumerate(rngs):
+        starts[i, : num_lines[i]] = rng.integers(0, stone_widths[i], size=num_lines[i])
+        heights[i, : num_lines[i], : num_stones[i]] = rng.choice(stone_height_range, size=(num_lines[i], num_stones[i]))
+    # line of every pixel across the lines, and whether the pixel is on the line
+    across = np.arange(num_across)[None, :]
+    lines = across // periods[:, None]
+    on_line = across % periods[:, None] < stone_widths[:, None]
+    # offset of every pixel from the start of its line, the pixels of the first stone have a negative offset
+    offsets = np.arange(num_along)[None, :, None] - np.take_along_axis(starts, lines, axis=1)[:, None, :]
+    periods = periods[:, None, None]
+    stones = offsets // periods + 1
+    on_stone = on_line[:, None, :] & (offsets % periods < stone_widths[:, None, None])
+    # look up the height of the stone of every pixel
+    batch = np.arange(len(rngs))[:, None, None]
+    return np.where(on_stone, heights[batch, lines[:, None, :], stones], holes_depth)
@@ -0,0 +1,208 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import functools
+import numpy as np
+import trimesh
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .hf_terrains_cfg import HfTerrainBaseCfg
+
+
+def height_field_to_mesh(func: Callable) -> Callable:
+    """Decorator to convert a batched height field function to a mesh function.
+
+    The decorated function generates the height fields of a batch of sub-terrains of the same configuration. It
+    takes the difficulties of the sub-terrains as an array of shape (N,), one random number generator per
+    sub-terrain and the configuration, and returns the height fields as an array of shape (N, width, length).
+
+    The returned mesh function generates a single sub-terrain, with the signature expected by the terrain
+    generator. The batched function is kept as its ``batch_function`` attribute, which
+    :func:`generate_height_fields` uses to generate many sub-terrains at once. Both produce the same sub-terrain for
+    the same difficulty and seed.
+
+    Args:
+        func: The batched height field function to convert.
+
+    Returns:
+        The mesh function. The mesh function returns a tuple containing a list of ``trimesh``
+        mesh objects and the origin of the terrain.
+    """
+
+    @functools.wraps(func)
+    def wrapper(difficulty: float, cfg: HfTerrainBaseCfg):
+        seeds = None if cfg.seed is None else [cfg.seed]
+        heights = generate_height_fields(np.array([difficulty]), seeds, cfg, batch_function=func)
+        vertices, triangles = convert_height_fields_to_meshes(
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+        )
+        mesh = trimesh.Trimesh(vertices=vertices[0], faces=triangles, process=False)
+        return [mesh], height_field_origins(heights, cfg)[0]
+
+    wrapper.batch_function = func
+    return wrapper
+
+
+def generate_height_fields(
+    difficulties: np.ndarray,
+    seeds: Sequence[int] | None,
+    cfg: HfTerrainBaseCfg,
+    batch_function: Callable | None = None,
+) -> np.ndarray:
+    """Generate the height fields of a batch of sub-terrains with the same configuration.
+
+    The height fields include the border of the sub-terrains. Every sub-terrain draws its random numbers from its
+    own generator seeded with its seed, so a sub-terrain does not depend on the other sub-terrains of the batch.
+
+    Args:
+        difficulties: The difficulties of the sub-terrains. Shape is (N,).
+        seeds: The seeds of the sub-terrains. Defaults to None, in which case they are drawn from the global
+            NumPy random number generator.
+        cfg: The configuration of the sub-terrains.
+        batch_function: The batched height field function. Defaults to None, in which case the batched function
+            of the configuration's mesh function is used.
+
+    Returns:
+        The height fields of the sub-terrains as an array of discretized heights. Shape is (N, width, length).
+
+    Raises:
+        ValueError: If the configuration has no batched height field function.
+        ValueError: If the number of seeds does not match the number of difficulties.
+        ValueError: If the border width is non-zero and smaller than the horizontal scale.
+    """
+    difficulties = np.asarray(difficulties, dtype=float).reshape(-1)
+    if batch_function is None:
+        batch_function = getattr(cfg.function, "batch_function", None)
+        if batch_function is None:
+            raise ValueError(f"The terrain function '{cfg.function.__name__}' does not support batched generation.")
+    if seeds is None:
+        seeds = np.random.randint(0, 2**31 - 1, size=len(difficulties))
+    elif len(seeds) != len(difficulties):
+        raise ValueError(f"Expected {len(difficulties)} seeds, got {len(seeds)}.")
+    # check valid border width
+    if cfg.border_width > 0 and cfg.border_width < cfg.horizontal_scale:
+        raise ValueError(
+            f"The border width ({cfg.border_width}) must be greater than or equal to the"
+            f" horizontal scale ({cfg.horizontal_scale})."
+        )
+    # allocate buffer for height fields (with border)
+    width_pixels = int(cfg.size[0] / cfg.horizontal_scale) + 1
+    length_pixels = int(cfg.size[1] / cfg.horizontal_scale) + 1
+    border_pixels = int(cfg.border_width / cfg.horizontal_scale) + 1
+    heights = np.zeros((len(difficulties), width_pixels, length_pixels), dtype=np.int16)
+    # override size of the terrain to account for the border
+    sub_terrain_cfg = cfg.copy()
+    sub_terrain_cfg.size = (
+        (width_pixels - 2 * border_pixels) * cfg.horizontal_scale,
+        (length_pixels - 2 * border_pixels) * cfg.horizontal_scale,
+    )
+    # generate the height fields
+    rngs = [np.random.default_rng(int(seed)) for seed in seeds]
+    heights[:, border_pixels:-border_pixels, border_pixels:-border_pixels] = batch_function(
+        difficulties, rngs, sub_terrain_cfg
+    )
+    return heights
+
+
+def height_field_origins(height_fields: np.ndarray, cfg: HfTerrainBaseCfg) -> np.ndarray:
+    """Compute the origins of a batch of height field sub-terrains.
+
+    The origin of a sub-terrain is at its center, at the highest point within 1 m of the center.
+
+    Args:
+        height_fields: The height fields of the sub-terrains, as returned by :func:`generate_height_fields`.
+            Shape is (N, width, length).
+        cfg: The configuration of the sub-terrains.
+
+    Returns:
+        The origins of the sub-terrains (in m). Shape is (N, 3).
+    """
+    x1 = int((cfg.size[0] * 0.5 - 1) / cfg.horizontal_scale)
+    x2 = int((cfg.size[0] * 0.5 + 1) / cfg.horizontal_scale)
+    y1 = int((cfg.size[1] * 0.5 - 1) / cfg.horizontal_scale)
+    y2 = int((cfg.size[1] * 0.5 + 1) / cfg.horizontal_scale)
+    origins = np.zeros((len(height_fields), 3))
+    origins[:, 0] = 0.5 * cfg.size[0]
+    origins[:, 1] = 0.5 * cfg.size[1]
+    origins[:, 2] = np.max(height_fields[:, x1:x2, y1:y2], axis=(1, 2)) * cfg.vertical_scale
+    return origins
+
+
+def convert_height_fields_to_meshes(
+    height_fields: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a batch of height-field arrays to triangle meshes represented by vertices and triangles.
+
+    This is the batched version of :func:`isaaclab.terrains.height_field.utils.convert_height_field_to_mesh`. All
+    height fields have the same shape, so their meshes share the same triangles and only the vertices are computed
+    per height field, for the whole batch at once.
+
+    Args:
+        height_fields: The input height-field arrays. Shape is (N, num_rows, num_cols).
+        horizontal_scale: The discretization of the terrain along the x and y axis.
+        vertical_scale: The discretization of the terrain along the z axis.
+        slope_threshold: The slope threshold above which surfaces are made vertical.
+            Defaults to None, in which case no correction is applied.
+
+    Returns:
+        The vertices and triangles of the meshes:
+        - **vertices** (np.ndarray(float)): Array of shape (N, num_rows * num_cols, 3).
+          Each row represents the location of each vertex (in m).
+        - **triangles** (np.ndarray(int)): Array of shape (num_triangles, 3), shared by all meshes.
+          Each row represents the indices of the 3 vertices connected by this triangle.
+    """
+    num_fields, num_rows, num_cols = height_fields.shape
+    # create a mesh grid of the height field
+    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
+    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
+    yy, xx = np.meshgrid(y, x)
+    xx = np.repeat(xx[None], num_fields, axis=0)
+    yy = np.repeat(yy[None], num_fields, axis=0)
+    hf = height_fields
+
+    # correct vertical surfaces above the slope threshold
+    if slope_threshold is not None:
+        # scale slope threshold based on the horizontal and vertical scale
+        slope_threshold *= horizontal_scale / vertical_scale
+        # allocate arrays to store the movement of the vertices
+        move_x = np.zeros((num_fields, num_rows, num_cols))
+        move_y = np.zeros((num_fields, num_rows, num_cols))
+        move_corners = np.zeros((num_fields, num_rows, num_cols))
+        # move vertices along the x-axis
+        move_x[:, :-1, :] += hf[:, 1:, :] - hf[:, :-1, :] > slope_threshold
+        move_x[:, 1:, :] -= hf[:, :-1, :] - hf[:, 1:, :] > slope_threshold
+        # move vertices along the y-axis
+        move_y[:, :, :-1] += hf[:, :, 1:] - hf[:, :, :-1] > slope_threshold
+        move_y[:, :, 1:] -= hf[:, :, :-1] - hf[:, :, 1:] > slope_threshold
+        # move vertices along the corners
+        move_corners[:, :-1, :-1] += hf[:, 1:, 1:] - hf[:, :-1, :-1] > slope_threshold
+        move_corners[:, 1:, 1:] -= hf[:, :-1, :-1] - hf[:, 1:, 1:] > slope_threshold
+        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
+        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+
+    # create vertices for the meshes
+    vertices = np.zeros((num_fields, num_rows * num_cols, 3), dtype=np.float32)
+    vertices[..., 0] = xx.reshape(num_fields, -1)
+    vertices[..., 1] = yy.reshape(num_fields, -1)
+    vertices[..., 2] = hf.reshape(num_fields, -1) * vertical_scale
+    # create two triangles for every cell of the grid
+    ind0 = (np.arange(num_rows - 1)[:, None] * num_cols + np.arange(num_cols - 1)[None, :]).reshape(-1)
+    ind1 = ind0 + 1
+    ind2 = ind0 + num_cols
+    ind3 = ind2 + 1
+    triangles = np.zeros((2 * len(ind0), 3), dtype=np.uint32)
+    triangles[0::2] = np.stack([ind0, ind3, ind1], axis=1)
+    triangles[1::2] = np.stack([ind0, ind2, ind3], axis=1)
+
+    return vertices, triangles
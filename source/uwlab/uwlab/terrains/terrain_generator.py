@@ -10,15 +10,21 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
 import numpy as np
 import os
+import random
+import shutil
+import tempfile
 import torch
 import trimesh
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import omni.log
 
-from isaaclab.terrains.height_field import HfTerrainBaseCfg
+from isaaclab.terrains import height_field as isaaclab_height_field
 from isaaclab.terrains.trimesh.utils import make_border
 from isaaclab.terrains.utils import color_meshes_by_height
 from isaaclab.utils.dict import dict_to_md5_hash
@@ -26,9 +32,21 @@ from isaaclab.utils.io import dump_yaml
 from isaaclab.utils.timer import Timer
 from isaaclab.utils.warp import convert_to_warp_mesh
 
+from .height_field import HfTerrainBaseCfg
+from .height_field.utils import convert_height_fields_to_meshes, generate_height_fields, height_field_origins
+
 if TYPE_CHECKING:
     from .terrain_generator_cfg import PatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
 
+TERRAIN_CACHE_VERSION = 4
+"""Version of the terrain generation, part of the cache keys.
+
+Increase it whenever a change makes the generated terrains differ, so that stale cached terrains are not loaded.
+"""
+
+_ARCHIVE_EXCLUDED_KEYS = ("class_type", "num_workers", "use_cache", "cache_dir", "cache_archive", "color_scheme")
+"""Generator settings that do not change the sub-terrains, left out of the key of the terrain archive."""
+
 
 class TerrainGenerator:
     r"""Terrain generator to handle different terrain generation functions.
@@ -72,10 +90,20 @@ class TerrainGenerator:
     in the :obj:`flat_patches` dictionary. The key specifies the intention of the flat patches and the
     value is a tensor containing the flat patches for each sub-terrain.
 
+    Every sub-terrain is generated with its own seed, drawn from the generator's random number generator before
+    any sub-terrain is generated. The sub-terrains are therefore independent of each other and of the order in
+    which they are generated, which allows generating them in parallel processes (see
+    :attr:`~TerrainGeneratorCfg.num_workers`) with the same result as generating them one after another. Height
+    field sub-terrains of the same configuration are generated together as one batch instead (see
+    :func:`~uwlab.terrains.height_field.utils.generate_height_fields`).
+
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
-    sub-terrain configurations. This means that if the same sub-terrain configuration is used
+    sub-terrain configurations, difficulty and seed. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. The meshes, origins and flat patches are
+    stored as binary NumPy arrays that are memory-mapped when loaded. With
+    :attr:`~TerrainGeneratorCfg.cache_archive`, the whole terrain is additionally stored as one archive and loaded
+    without generating or loading the sub-terrains one by one.
 
     .. attention::
 
@@ -121,7 +149,7 @@ class TerrainGenerator:
             # size of all terrains
             sub_cfg.size = self.cfg.size
             # params for height field terrains
-            if isinstance(sub_cfg, HfTerrainBaseCfg):
+            if isinstance(sub_cfg, (HfTerrainBaseCfg, isaaclab_height_field.HfTerrainBaseCfg)):
                 sub_cfg.horizontal_scale = self.cfg.horizontal_scale
                 sub_cfg.vertical_scale = self.cfg.vertical_scale
                 sub_cfg.slope_threshold = self.cfg.slope_threshold
@@ -151,13 +179,20 @@ class TerrainGenerator:
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
         # parse configuration and add sub-terrains
-        # create terrains based on curriculum or randomly
-        if self.cfg.curriculum:
-            with Timer("[INFO] Generating terrains based on curriculum took"):
-                self._generate_curriculum_terrains()
+        archive_dir = self._get_archive_dir()
+        if archive_dir is not None and os.path.exists(archive_dir):
+            with Timer("[INFO] Loading the terrain archive took"):
+                self._load_terrain_archive(archive_dir)
         else:
-            with Timer("[INFO] Generating terrains randomly took"):
-                self._generate_random_terrains()
+            # create terrains based on curriculum or randomly
+            if self.cfg.curriculum:
+                with Timer("[INFO] Generating terrains based on curriculum took"):
+                    self._generate_curriculum_terrains()
+            else:
+                with Timer("[INFO] Generating terrains randomly took"):
+                    self._generate_random_terrains()
+            if archive_dir is not None:
+                self._save_terrain_archive(archive_dir)
         # add a border around the terrains
         self._add_terrain_border()
         # combine all the sub-terrains into a single mesh
@@ -217,6 +252,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        tiles = []
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -224,10 +260,9 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            tiles.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_index]))
+        # generate terrains and add them to sub-terrains
+        self._generate_sub_terrains(tiles)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -246,6 +281,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        tiles = []
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -257,15 +293,58 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                tiles.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate terrains and add them to sub-terrains
+        self._generate_sub_terrains(tiles)
 
     """
     Internal helper functions.
     """
 
+    def _generate_sub_terrains(self, tiles: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the sub-terrains and add them in order.
+
+        The seeds of all sub-terrains are drawn up front, so the result does not depend on whether the
+        sub-terrains are generated in a process pool. Height field sub-terrains that support batched generation are
+        generated in one batch per sub-terrain configuration, the others one by one.
+
+        Args:
+            tiles: The row, column, difficulty and configuration of every sub-terrain.
+        """
+        # draw the seeds of the sub-terrains
+        seeds = self.np_rng.integers(0, 2**31 - 1, size=len(tiles))
+        # resolve the sub-terrains to generate
+        cfgs = [self._get_sub_terrain_cfg(difficulty, cfg, seed) for (_, _, difficulty, cfg), seed in zip(tiles, seeds)]
+        results: list[tuple[trimesh.Trimesh, np.ndarray] | None] = [self._load_terrain_mesh(cfg) for cfg in cfgs]
+        missing = [index for index, result in enumerate(results) if result is None]
+        generated: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        # generate the missing height field sub-terrains in batches of the same configuration
+        batches: dict[int, list[int]] = {}
+        for index in missing:
+            if getattr(cfgs[index].function, "batch_function", None) is not None:
+                batches.setdefault(id(tiles[index][3]), []).append(index)
+        for indices in batches.values():
+            batch = _generate_height_field_sub_terrains([cfgs[index] for index in indices])
+            generated.update(zip(indices, batch))
+        # generate the other missing sub-terrains
+        remaining = [index for index in missing if index not in generated]
+        num_workers = min(self.cfg.num_workers, len(remaining))
+        if num_workers > 1:
+            omni.log.info(f"Generating {len(remaining)} sub-terrains with {num_workers} processes.")
+            # note: fork keeps the modules of the parent loaded, spawned workers would have to import them again
+            method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context(method)) as executor:
+                generated.update(zip(remaining, executor.map(_generate_sub_terrain, [cfgs[i] for i in remaining])))
+        else:
+            generated.update((index, _generate_sub_terrain(cfgs[index])) for index in remaining)
+        for index in missing:
+            vertices, faces, origin = generated[index]
+            self._save_terrain_mesh(cfgs[index], vertices, faces, origin)
+            results[index] = (trimesh.Trimesh(vertices=vertices, faces=faces, process=False), origin)
+        # add to sub-terrains in order
+        for (sub_row, sub_col, _, _), cfg, (mesh, origin) in zip(tiles, cfgs, results):
+            self._add_sub_terrain(mesh, origin, sub_row, sub_col, cfg)
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -305,8 +384,8 @@ class TerrainGenerator:
         # sample flat patches if specified
         if sub_terrain_cfg.patch_sampling is not None:
             omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+            # the warp mesh is only created if some patches are not cached
+            wp_mesh = None
             # sample flat patches based on each patch configuration for that sub-terrain
             for name, patch_cfg in sub_terrain_cfg.patch_sampling.items():
                 patch_cfg: PatchSamplingCfg
@@ -315,12 +394,15 @@ class TerrainGenerator:
                     self.flat_patches[name] = torch.zeros(
                         (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
                     )
+                patches = self._load_flat_patches(sub_terrain_cfg, patch_cfg)
+                if patches is None:
+                    # convert the mesh to warp mesh
+                    if wp_mesh is None:
+                        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+                    patches = patch_cfg.func(wp_mesh=wp_mesh, origin=origin, cfg=patch_cfg)
+                    self._save_flat_patches(sub_terrain_cfg, patch_cfg, patches)
                 # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = patch_cfg.func(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    cfg=patch_cfg,
-                )
+                self.flat_patches[name][row, col] = patches
 
         # transform the mesh to the correct position
         transform = np.eye(4)
@@ -331,7 +413,9 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
-    def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
+    def _get_terrain_mesh(
+        self, difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None = None
+    ) -> tuple[trimesh.Trimesh, np.ndarray]:
         """Generate a sub-terrain mesh based on the input difficulty parameter.
 
         If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
@@ -344,48 +428,221 @@ class TerrainGenerator:
         Args:
             difficulty: The difficulty parameter.
             cfg: The configuration of the sub-terrain.
+            seed: The seed of the sub-terrain. Defaults to None, in which case the seed of the generator is used.
 
         Returns:
             The sub-terrain mesh and origin.
         """
+        cfg = self._get_sub_terrain_cfg(difficulty, cfg, seed)
+        # check if the sub-terrain is cached
+        result = self._load_terrain_mesh(cfg)
+        if result is not None:
+            return result
+        # generate the terrain
+        vertices, faces, origin = _generate_sub_terrain(cfg)
+        self._save_terrain_mesh(cfg, vertices, faces, origin)
+        # return the generated mesh
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False), origin
+
+    def _get_sub_terrain_cfg(self, difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None) -> SubTerrainBaseCfg:
+        """Copy of the sub-terrain configuration with its difficulty and seed."""
         # copy the configuration
         cfg = cfg.copy()
         # add other parameters to the sub-terrain configuration
         cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
-            # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
-            # return the generated mesh
-            return mesh, origin
+        cfg.seed = self.cfg.seed if seed is None else int(seed)
+        return cfg
 
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
+    """
+    Internal helper functions - Cache.
+    """
 
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+    def _get_cache_dir(self, cfg: SubTerrainBaseCfg) -> str:
+        """Cache directory of a sub-terrain.
+
+        The directory is named after the hash of the configuration, difficulty, seed and
+        :data:`TERRAIN_CACHE_VERSION`, so sub-terrains only share it if they are generated identically.
+        """
+        key = {"cfg": cfg.to_dict(), "difficulty": cfg.difficulty, "seed": cfg.seed, "version": TERRAIN_CACHE_VERSION}
+        return os.path.join(self.cfg.cache_dir, dict_to_md5_hash(key))
+
+    def _load_terrain_mesh(self, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray] | None:
+        """Load a sub-terrain from the cache, None if caching is disabled or the sub-terrain is not cached."""
+        if not self.cfg.use_cache:
+            return None
+        sub_terrain_cache_dir = self._get_cache_dir(cfg)
+        # the origin is written last, so its presence marks a complete entry
+        if not os.path.exists(os.path.join(sub_terrain_cache_dir, "origin.npy")):
+            return None
+        # map the arrays copy-on-write, pages are only read when the mesh is used
+        vertices = np.load(os.path.join(sub_terrain_cache_dir, "vertices.npy"), mmap_mode="c")
+        faces = np.load(os.path.join(sub_terrain_cache_dir, "faces.npy"), mmap_mode="c")
+        origin = np.load(os.path.join(sub_terrain_cache_dir, "origin.npy"))
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False), origin
+
+    def _save_terrain_mesh(self, cfg: SubTerrainBaseCfg, vertices: np.ndarray, faces: np.ndarray, origin: np.ndarray):
+        """Save a sub-terrain to the cache if caching is enabled."""
+        if not self.cfg.use_cache:
+            return
+        sub_terrain_cache_dir = self._get_cache_dir(cfg)
+        # create the cache directory
+        os.makedirs(sub_terrain_cache_dir, exist_ok=True)
+        # save the data
+        dump_yaml(os.path.join(sub_terrain_cache_dir, "cfg.yaml"), cfg)
+        _save_array(os.path.join(sub_terrain_cache_dir, "vertices.npy"), vertices)
+        _save_array(os.path.join(sub_terrain_cache_dir, "faces.npy"), faces)
+        _save_array(os.path.join(sub_terrain_cache_dir, "origin.npy"), origin)
+
+    def _get_flat_patches_path(self, cfg: SubTerrainBaseCfg, patch_cfg: PatchSamplingCfg) -> str:
+        return os.path.join(self._get_cache_dir(cfg), f"patches_{dict_to_md5_hash(patch_cfg.to_dict())}.npy")
+
+    def _load_flat_patches(self, cfg: SubTerrainBaseCfg, patch_cfg: PatchSamplingCfg) -> torch.Tensor | None:
+        """Load the flat patches of a sub-terrain from the cache, None if they are not cached."""
+        if not self.cfg.use_cache:
+            return None
+        path = self._get_flat_patches_path(cfg, patch_cfg)
+        if not os.path.exists(path):
+            return None
+        return torch.from_numpy(np.load(path)).to(self.device)
+
+    def _save_flat_patches(self, cfg: SubTerrainBaseCfg, patch_cfg: PatchSamplingCfg, patches: torch.Tensor):
+        """Save the flat patches of a sub-terrain to the cache if caching is enabled."""
+        if not self.cfg.use_cache:
+            return
+        os.makedirs(self._get_cache_dir(cfg), exist_ok=True)
+        _save_array(self._get_flat_patches_path(cfg, patch_cfg), patches.cpu().numpy())
+
+    def _get_archive_dir(self) -> str | None:
+        """Directory of the archive of the whole terrain, None if it is not used.
+
+        The archive is only used with a fixed seed, as the terrain is otherwise not reproducible.
+        """
+        if not (self.cfg.use_cache and self.cfg.cache_archive and self.cfg.seed is not None):
+            return None
+        cfg_dict = {key: value for key, value in self.cfg.to_dict().items() if key not in _ARCHIVE_EXCLUDED_KEYS}
+        key = dict_to_md5_hash({"cfg": cfg_dict, "version": TERRAIN_CACHE_VERSION})
+        return os.path.join(self.cfg.cache_dir, "archives", key)
+
+    def _save_terrain_archive(self, archive_dir: str):
+        """Store the sub-terrain meshes, origins, flat patches and the random number generator state in one
+        directory of arrays."""
+        vertices = [np.asarray(mesh.vertices) for mesh in self.terrain_meshes]
+        faces = [np.asarray(mesh.faces) for mesh in self.terrain_meshes]
+        arrays = {
+            "vertices": np.concatenate(vertices),
+            "faces": np.concatenate(faces),
+            "num_vertices": np.array([len(v) for v in vertices], dtype=np.int64),
+            "num_faces": np.array([len(f) for f in faces], dtype=np.int64),
+            "origins": self.terrain_origins,
+        }
+        for name, patches in self.flat_patches.items():
+            arrays[f"patches_{name}"] = patches.cpu().numpy()
+        meta = {"patch_names": list(self.flat_patches.keys()), "rng_state": self.np_rng.bit_generator.state}
+        # write the archive next to its final location and move it there at once
+        os.makedirs(os.path.dirname(archive_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(archive_dir))
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+            with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp_dir, archive_dir)
+        except OSError as e:
+            # another process stored the same archive in the meantime
+            omni.log.warn(f"Could not store the terrain archive at '{archive_dir}': {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _load_terrain_archive(self, archive_dir: str):
+        """Restore the sub-terrain meshes, origins, flat patches and random number generator state of an archive."""
+        with open(os.path.join(archive_dir, "meta.json")) as f:
+            meta = json.load(f)
+        # map the arrays copy-on-write, each sub-terrain mesh is a view into them
+        vertices = np.load(os.path.join(archive_dir, "vertices.npy"), mmap_mode="c")
+        faces = np.load(os.path.join(archive_dir, "faces.npy"), mmap_mode="c")
+        vertex_offsets = np.cumsum(np.load(os.path.join(archive_dir, "num_vertices.npy")))
+        face_offsets = np.cumsum(np.load(os.path.join(archive_dir, "num_faces.npy")))
+        vertex_start, face_start = 0, 0
+        for vertex_end, face_end in zip(vertex_offsets, face_offsets):
+            self.terrain_meshes.append(
+                trimesh.Trimesh(
+                    vertices=vertices[vertex_start:vertex_end], faces=faces[face_start:face_end], process=False
+                )
+            )
+            vertex_start, face_start = vertex_end, face_end
+        self.terrain_origins = np.load(os.path.join(archive_dir, "origins.npy"))
+        for name in meta["patch_names"]:
+            patches = np.load(os.path.join(archive_dir, f"patches_{name}.npy"))
+            self.flat_patches[name] = torch.from_numpy(patches).to(self.device)
+        # continue with the random numbers the generation would have left
+        self.np_rng.bit_generator.state = meta["rng_state"]
+
+
+def _generate_sub_terrain(cfg: SubTerrainBaseCfg) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate a sub-terrain centered at the origin.
+
+    This runs in the worker processes of the terrain generator, so it only exchanges arrays. The global random
+    number generators are seeded with the seed of the sub-terrain while it is generated, which makes the result
+    independent of the process and of the other sub-terrains. Their previous state is restored afterwards, so the
+    generation does not affect the global state of the calling process.
+
+    Args:
+        cfg: The configuration of the sub-terrain, with its difficulty and seed.
+
+    Returns:
+        The vertices and faces of the sub-terrain mesh, and its origin.
+    """
+    # generate the terrain
+    if cfg.seed is None:
+        meshes, origin = cfg.function(cfg.difficulty, cfg)
+    else:
+        # note: the sub-terrain functions may draw from the global generators, so we seed them temporarily
+        random_state, np_random_state = random.getstate(), np.random.get_state()
+        random.seed(cfg.seed)
+        np.random.seed(cfg.seed)
+        try:
+            meshes, origin = cfg.function(cfg.difficulty, cfg)
+        finally:
+            random.setstate(random_state)
+            np.random.set_state(np_random_state)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin = np.asarray(origin, dtype=float) + transform[0:3, -1]
+    return np.asarray(mesh.vertices), np.asarray(mesh.faces), origin
+
+
+def _generate_height_field_sub_terrains(
+    cfgs: list[HfTerrainBaseCfg]
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Generate a batch of height field sub-terrains centered at the origin.
+
+    The sub-terrains only differ in their difficulty and seed. Their height fields and meshes are generated for the
+    whole batch at once, and match the sub-terrains generated one by one by :func:`_generate_sub_terrain`.
+
+    Args:
+        cfgs: The configurations of the sub-terrains, with their difficulties and seeds.
+
+    Returns:
+        The vertices and faces of the sub-terrain meshes, and their origins.
+    """
+    cfg = cfgs[0]
+    difficulties = np.array([cfg.difficulty for cfg in cfgs])
+    heights = generate_height_fields(difficulties, [cfg.seed for cfg in cfgs], cfg)
+    vertices, faces = convert_height_fields_to_meshes(
+        heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+    )
+    origins = height_field_origins(heights, cfg)
+    # offset meshes such that they are in their center
+    offset = np.array([-cfg.size[0] * 0.5, -cfg.size[1] * 0.5, 0.0])
+    return [(vertices[i] + offset, faces, origins[i] + offset) for i in range(len(cfgs))]
+
+
+def _save_array(path: str, array: np.ndarray):
+    """Save an array through a temporary file, so readers never see a partially written file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
@@ -159,6 +159,13 @@ class TerrainGeneratorCfg:
     of difficulty. Otherwise, the terrains will be generated based on this range in a random order.
     """
 
+    num_workers: int = 0
+    """Number of processes generating the sub-terrains in parallel. Defaults to 0 (generated in this process).
+
+    The result does not depend on the number of workers, as every sub-terrain is generated with its own seed.
+    The flat patches are still sampled in this process.
+    """
+
     use_cache: bool = False
     """Whether to load the sub-terrain from cache if it exists. Defaults to True.
 
@@ -167,5 +174,13 @@ class TerrainGeneratorCfg:
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
     """
 
+    cache_archive: bool = False
+    """Whether to additionally cache the whole terrain as one archive. Defaults to False.
+
+    The archive stores the meshes, origins and flat patches of all sub-terrains as memory-mapped arrays, so a
+    terrain that was generated before is loaded without generating or loading the sub-terrains one by one. It is
+    only used if :attr:`use_cache` is enabled and the :attr:`seed` is set.
+    """
+
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
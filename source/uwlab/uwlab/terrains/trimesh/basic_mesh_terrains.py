@@ -13,12 +13,13 @@
 from __future__ import annotations
 
 import numpy as np
-import scipy.spatial.transform as tf
 import torch
 import trimesh
 from typing import TYPE_CHECKING
 
-from isaaclab.terrains.trimesh.utils import make_border, make_plane
+from isaaclab.terrains.trimesh.utils import make_border, make_box, make_cone, make_cylinder, make_plane
+
+from .utils import make_boxes, make_cones, make_cylinders, make_rng, random_tilted_rotations, yaw_rotations
 
 if TYPE_CHECKING:
     from . import basic_mesh_terrains_cfg
@@ -688,28 +689,20 @@ def star_terrain(
         cfg.platform_width * 0.5, bar_height, sections=2 * cfg.num_bars, transform=platform_transform
     )
     meshes_list.append(platform)
-    # Generate bars to connect the platform to the terrain
-    transform = np.eye(4)
-    transform[:3, -1] = np.asarray(platform_center)
-    yaw = 0.0
-    for _ in range(cfg.num_bars):
-        # compute the length of the bar based on the yaw
-        # length changes since the bar is connected to a square border
-        bar_length = cfg.size[0]
-        if yaw < 0.25 * np.pi:
-            bar_length /= np.math.cos(yaw)
-        elif yaw < 0.75 * np.pi:
-            bar_length /= np.math.sin(yaw)
-        else:
-            bar_length /= np.math.cos(np.pi - yaw)
-        # compute the transform of the bar
-        transform[0:3, 0:3] = tf.Rotation.from_euler("z", yaw).as_matrix()
-        # add the bar to the mesh
-        dim = [bar_length - bar_width, bar_width, bar_height]
-        bar = trimesh.creation.box(dim, transform)
-        meshes_list.append(bar)
-        # increment the yaw
-        yaw += np.pi / cfg.num_bars
+    # Generate bars to connect the platform to the terrain, evenly spaced in yaw
+    yaws = np.arange(cfg.num_bars) * np.pi / cfg.num_bars
+    # compute the length of the bars based on the yaw
+    # length changes since the bar is connected to a square border
+    bar_lengths = cfg.size[0] / np.where(
+        yaws < 0.25 * np.pi, np.cos(yaws), np.where(yaws < 0.75 * np.pi, np.sin(yaws), np.cos(np.pi - yaws))
+    )
+    # add the bars to the mesh
+    dims = np.zeros((cfg.num_bars, 3))
+    dims[:, 0] = bar_lengths - bar_width
+    dims[:, 1] = bar_width
+    dims[:, 2] = bar_height
+    centers = np.repeat(np.asarray(platform_center)[None], cfg.num_bars, axis=0)
+    meshes_list.append(make_boxes(centers, dims, yaw_rotations(yaws)))
     # Generate the exterior border
     inner_size = (cfg.size[0] - 2 * bar_width, cfg.size[1] - 2 * bar_width)
     meshes_list += make_border(cfg.size, inner_size, bar_height, platform_center)
@@ -821,35 +814,58 @@ def repeated_objects_terrain(
     )
     platform_corners[0, :] *= 1 - platform_clearance
     platform_corners[1, :] *= 1 + platform_clearance
-    # sample valid center for objects
+    rng = make_rng(cfg.seed)
+    # sample valid centers for objects uniformly from the terrain around the platform
+    # note: the area around the platform is split into the rectangles left and right of the platform over the full
+    #   width of the terrain, and below and above the platform. They are sampled in proportion to their area.
+    x0, y0 = np.clip(platform_corners[0], 0.0, cfg.size)
+    x1, y1 = np.clip(platform_corners[1], 0.0, cfg.size)
+    # -- bounds of the rectangles as (x_min, x_max, y_min, y_max)
+    regions = np.array([
+        [0.0, x0, 0.0, cfg.size[1]],
+        [x1, cfg.size[0], 0.0, cfg.size[1]],
+        [x0, x1, 0.0, y0],
+        [x0, x1, y1, cfg.size[1]],
+    ])
+    areas = (regions[:, 1] - regions[:, 0]) * (regions[:, 3] - regions[:, 2])
+    if num_objects > 0 and areas.sum() <= 0.0:
+        raise ValueError(f"The platform of width {cfg.platform_width} leaves no space for objects on the terrain.")
+    region = rng.choice(len(regions), size=num_objects, p=areas / max(areas.sum(), 1e-12))
     object_centers = np.zeros((num_objects, 3))
-    # use a mask to track invalid objects that still require sampling
-    mask_objects_left = np.ones((num_objects,), dtype=bool)
-    # loop until no objects are left to sample
-    while np.any(mask_objects_left):
-        # only sample the centers of the remaining invalid objects
-        num_objects_left = mask_objects_left.sum()
-        object_centers[mask_objects_left, 0] = np.random.uniform(0, cfg.size[0], num_objects_left)
-        object_centers[mask_objects_left, 1] = np.random.uniform(0, cfg.size[1], num_objects_left)
-        # filter out the centers that are on the platform
-        is_within_platform_x = np.logical_and(
-            object_centers[mask_objects_left, 0] >= platform_corners[0, 0],
-            object_centers[mask_objects_left, 0] <= platform_corners[1, 0],
-        )
-        is_within_platform_y = np.logical_and(
-            object_centers[mask_objects_left, 1] >= platform_corners[0, 1],
-            object_centers[mask_objects_left, 1] <= platform_corners[1, 1],
-        )
-        # update the mask to track the validity of the objects sampled in this iteration
-        mask_objects_left[mask_objects_left] = np.logical_and(is_within_platform_x, is_within_platform_y)
+    object_centers[:, 0] = rng.uniform(regions[region, 0], regions[region, 1])
+    object_centers[:, 1] = rng.uniform(regions[region, 2], regions[region, 3])
+    # randomize the height of the objects and drop the ones that do not stick out of the ground
+    ob_heights = height + rng.uniform(-cfg.max_height_noise, cfg.max_height_noise, num_objects)
+    object_centers = object_centers[ob_heights > 0.0]
+    ob_heights = ob_heights[ob_heights > 0.0]
 
     # generate obstacles (but keep platform clean)
-    for index in range(len(object_centers)):
-        # randomize the height of the object
-        ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
-        if ob_height > 0.0:
-            object_mesh = object_func(center=object_centers[index], height=ob_height, **object_kwargs)
-            meshes_list.append(object_mesh)
+    if len(ob_heights) > 0 and object_func in (make_box, make_cylinder, make_cone):
+        # build all objects at once
+        rotations = random_tilted_rotations(
+            rng, len(ob_heights), object_kwargs["max_yx_angle"], degrees=object_kwargs["degrees"]
+        )
+        if object_func is make_box:
+            extents = np.zeros((len(ob_heights), 3))
+            extents[:, 0] = object_kwargs["length"]
+            extents[:, 1] = object_kwargs["width"]
+            extents[:, 2] = ob_heights
+            meshes_list.append(make_boxes(object_centers, extents, rotations))
+        else:
+            # the cylinders and cones have 4 or 5 sections, with one mesh per number of sections
+            make_objects = make_cylinders if object_func is make_cylinder else make_cones
+            sections = rng.integers(4, 6, len(ob_heights))
+            radii = np.full(len(ob_heights), object_kwargs["radius"])
+            for num_sections in np.unique(sections):
+                mask = sections == num_sections
+                meshes_list.append(
+                    make_objects(
+                        object_centers[mask], radii[mask], ob_heights[mask], rotations[mask], sections=int(num_sections)
+                    )
+                )
+    else:
+        for center, ob_height in zip(object_centers, ob_heights):
+            meshes_list.append(object_func(center=center, height=ob_height, **object_kwargs))
 
     # generate a ground plane for the terrain
     ground_plane = make_plane(cfg.size, height=0.0, center_zero=False)
@@ -10,12 +10,10 @@ from __future__ import annotations
 import io
 import numpy as np
 import os
-import random
 import subprocess
 import torch
 import trimesh
 import yaml
-from scipy.spatial.transform import Rotation as R
 from typing import TYPE_CHECKING
 
 import requests
@@ -26,6 +24,8 @@ from isaaclab.terrains.trimesh.mesh_terrains import inverted_pyramid_stairs_terr
 from isaaclab.terrains.trimesh.mesh_terrains_cfg import MeshInvertedPyramidStairsTerrainCfg, MeshPyramidStairsTerrainCfg
 from isaaclab.terrains.trimesh.utils import make_border, make_plane
 
+from .utils import make_boxes, make_rng, yaw_rotations
+
 if TYPE_CHECKING:
     from . import mesh_terrains_cfg
 
@@ -360,30 +360,28 @@ def stepping_beams_terrain(
         # create border meshes
         make_borders = make_border(cfg.size, border_inner_size, terrain_height, border_center)
         meshes_list += make_borders
-    # calculate the center of all the stones
-    # add random noise to the center
-    # add noise to the height
     # create the stones
-    for i in range(num_stones):
-        transform = np.eye(4)
-        grid_dim = [
-            stone_width,
-            low_stone_l + random.uniform(0, high_stone_l - low_stone_l),
-            terrain_height + random.uniform(-h_offset, h_offset),
-        ]
-        center = [
+    if num_stones > 0:
+        rng = make_rng(cfg.seed)
+        index = np.arange(num_stones)
+        # sample the dimensions of the stones, with noise on the length and height
+        grid_dims = np.zeros((num_stones, 3))
+        grid_dims[:, 0] = stone_width
+        grid_dims[:, 1] = low_stone_l + rng.uniform(0, high_stone_l - low_stone_l, num_stones)
+        grid_dims[:, 2] = terrain_height + rng.uniform(-h_offset, h_offset, num_stones)
+        # calculate the center of all the stones, with noise on the center
+        centers = np.zeros((num_stones, 3))
+        centers[:, 0] = (
             cfg.size[0] / 2
             + cfg.platform_width / 2
-            + (i + 1) * gap_width
-            + (i + 0.5) * stone_width
-            + random.uniform(-0.25, 0.25) * gap_width,
-            cfg.size[1] / 2 + random.uniform(-0.1, 0.1) * grid_dim[1],
-            -terrain_height / 2,
-        ]
-        transform[0:3, -1] = np.asarray(center)
-        # create rotation matrix
-        transform[0:3, 0:3] = R.from_euler("z", random.uniform(-yaw, yaw), degrees=True).as_matrix()
-        meshes_list.append(trimesh.creation.box(grid_dim, transform))
+            + (index + 1) * gap_width
+            + (index + 0.5) * stone_width
+            + rng.uniform(-0.25, 0.25, num_stones) * gap_width
+        )
+        centers[:, 1] = cfg.size[1] / 2 + rng.uniform(-0.1, 0.1, num_stones) * grid_dims[:, 1]
+        centers[:, 2] = -terrain_height / 2
+        rotations = yaw_rotations(rng.uniform(-yaw, yaw, num_stones), degrees=True)
+        meshes_list.append(make_boxes(centers, grid_dims, rotations))
     # add a platform in the center of the terrain that is accessible from all sides
     dim = (cfg.platform_width, cfg.platform_width, terrain_height)
     pos = (0.5 * cfg.size[0], 0.5 * cfg.size[1], -terrain_height / 2)
@@ -517,84 +515,39 @@ def structured_terrain(
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
     mesh_list = []
     terrain = cfg.terrain_type
+    rng = make_rng(cfg.seed)
     # generate the terrain
     if terrain == "obstacles":
         origin = np.array([cfg.size[0] / 2, cfg.size[1] / 2, 0.0])
-        for i in range(12):
-            if i < 8:
-                length = random.uniform(0.2, 2.0)
-                width = random.uniform(0.2, 2.0)
-                height = random.uniform(0.08, 0.25)
-            else:
-                length = random.uniform(0.2, 1.0)
-                width = random.uniform(0.2, 1.0)
-                height = 3.0
-            center = (
-                cfg.size[0] / 2 + random.uniform(1, cfg.size[0] / 2) * (-1) ** (random.randint(1, 2)),
-                cfg.size[1] / 2 + random.uniform(1, cfg.size[0] / 2) * (-1) ** (random.randint(1, 2)),
-                height / 2,
-            )
-            transform = np.eye(4)
-            transform[0:3, -1] = np.asarray(center)
-            # create the box
-            dims = (length, width, height)
-            mesh = trimesh.creation.box(dims, transform=transform)
-            mesh_list.append(mesh)
+        # 8 low obstacles and 4 tall pillars
+        num_obstacles = 12
+        dims = np.zeros((num_obstacles, 3))
+        dims[:8, :2] = rng.uniform(0.2, 2.0, (8, 2))
+        dims[:8, 2] = rng.uniform(0.08, 0.25, 8)
+        dims[8:, :2] = rng.uniform(0.2, 1.0, (4, 2))
+        dims[8:, 2] = 3.0
+        offsets = rng.uniform(1, cfg.size[0] / 2, (num_obstacles, 2)) * rng.choice([-1, 1], (num_obstacles, 2))
+        centers = np.zeros((num_obstacles, 3))
+        centers[:, :2] = np.array([cfg.size[0] / 2, cfg.size[1] / 2]) + offsets
+        centers[:, 2] = dims[:, 2] / 2
+        # create the boxes
+        mesh_list.append(make_boxes(centers, dims))
         # add walls
-        if random.uniform(0, 1) > 0.1:
-            center_pts = [(0, 0, 0), (cfg.size[0], 0, 0), (0, cfg.size[1], 0), (cfg.size[0], cfg.size[1], 0)]
-            for i, center in enumerate(center_pts):
-                if random.uniform(0, 1) > 0.5:
-                    continue
-                length = cfg.size[0] * random.uniform(0.2, 0.4)
-                width = cfg.size[1] * random.uniform(0.2, 0.4)
-                height = 6.0
-                transform = np.eye(4)
-                c = (center[0] + (-1) ** i * length / 2, center[1] + (-1) ** (i // 2) * width / 2, center[2])
-                transform[0:3, -1] = np.asarray(c)
-                # create the box
-                dims = (length, width, height)
-                mesh = trimesh.creation.box(dims, transform=transform)
-                mesh_list.append(mesh)
+        if rng.uniform(0, 1) > 0.1:
+            mesh_list += _make_corner_walls(rng, cfg.size, wall_probability=0.5, size_range=(0.2, 0.4))
         # add plane
         ground_plane = make_plane(cfg.size, height=0.0, center_zero=False)
         mesh_list.append(ground_plane)
 
-    elif terrain == "stairs":
-        step_width = random.uniform(0.2, 0.5)
-        _mesh_list, origin = pyramid_stairs_terrain(
-            difficulty,
-            MeshPyramidStairsTerrainCfg(
-                size=cfg.size,
-                border_width=1.0,
-                step_height_range=(0.08, 0.20),
-                step_width=step_width,
-                platform_width=2.0,
-            ),
-        )
-        mesh_list += _mesh_list
-        # add walls
-        if random.uniform(0, 1) > 0.05:
-            center_pts = [(0, 0, 0), (cfg.size[0], 0, 0), (0, cfg.size[1], 0), (cfg.size[0], cfg.size[1], 0)]
-            for i, center in enumerate(center_pts):
-                if random.uniform(0, 1) > 0.75:
-                    continue
-                length = cfg.size[0] * random.uniform(0.3, 0.4)
-                width = cfg.size[1] * random.uniform(0.3, 0.4)
-                height = 6.0
-                transform = np.eye(4)
-                c = (center[0] + (-1) ** i * length / 2, center[1] + (-1) ** (i // 2) * width / 2, center[2])
-                transform[0:3, -1] = np.asarray(c)
-                # create the box
-                dims = (length, width, height)
-                mesh = trimesh.creation.box(dims, transform=transform)
-                mesh_list.append(mesh)
-    elif terrain == "inverted_stairs":
-        step_width = random.uniform(0.2, 0.5)
-        # inverted prymaid
-        _mesh_list, origin = inverted_pyramid_stairs_terrain(
+    elif terrain in ("stairs", "inverted_stairs"):
+        step_width = rng.uniform(0.2, 0.5)
+        if terrain == "stairs":
+            stairs_function, stairs_cfg_class = pyramid_stairs_terrain, MeshPyramidStairsTerrainCfg
+        else:
+            stairs_function, stairs_cfg_class = inverted_pyramid_stairs_terrain, MeshInvertedPyramidStairsTerrainCfg
+        _mesh_list, origin = stairs_function(
             difficulty,
-            MeshInvertedPyramidStairsTerrainCfg(
+            stairs_cfg_class(
                 size=cfg.size,
                 border_width=1.0,
                 step_height_range=(0.08, 0.20),
@@ -604,38 +557,12 @@ def structured_terrain(
         )
         mesh_list += _mesh_list
         # add walls
-        if random.uniform(0, 1) > 0.05:
-            center_pts = [(0, 0, 0), (cfg.size[0], 0, 0), (0, cfg.size[1], 0), (cfg.size[0], cfg.size[1], 0)]
-            for i, center in enumerate(center_pts):
-                if random.uniform(0, 1) > 0.75:
-                    continue
-                length = cfg.size[0] * random.uniform(0.3, 0.4)
-                width = cfg.size[1] * random.uniform(0.3, 0.4)
-                height = 6.0
-                transform = np.eye(4)
-                c = (center[0] + (-1) ** i * length / 2, center[1] + (-1) ** (i // 2) * width / 2, center[2])
-                transform[0:3, -1] = np.asarray(c)
-                # create the box
-                dims = (length, width, height)
-                mesh = trimesh.creation.box(dims, transform=transform)
-                mesh_list.append(mesh)
+        if rng.uniform(0, 1) > 0.05:
+            mesh_list += _make_corner_walls(rng, cfg.size, wall_probability=0.75, size_range=(0.3, 0.4))
     elif terrain == "walls":
         origin = np.array([cfg.size[0] / 2, cfg.size[1] / 2, 0.0])
         # add walls
-        center_pts = [(0, 0, 0), (cfg.size[0], 0, 0), (0, cfg.size[1], 0), (cfg.size[0], cfg.size[1], 0)]
-        for i, center in enumerate(center_pts):
-            if random.uniform(0, 1) > 0.75:
-                continue
-            length = cfg.size[0] * random.uniform(0.3, 0.4)
-            width = cfg.size[1] * random.uniform(0.3, 0.4)
-            height = 6.0
-            transform = np.eye(4)
-            c = (center[0] + (-1) ** i * length / 2, center[1] + (-1) ** (i // 2) * width / 2, center[2])
-            transform[0:3, -1] = np.asarray(c)
-            # create the box
-            dims = (length, width, height)
-            mesh = trimesh.creation.box(dims, transform=transform)
-            mesh_list.append(mesh)
+        mesh_list += _make_corner_walls(rng, cfg.size, wall_probability=0.75, size_range=(0.3, 0.4))
         # add plane
         ground_plane = make_plane(cfg.size, height=0.0, center_zero=False)
         mesh_list.append(ground_plane)
@@ -643,3 +570,27 @@ def structured_terrain(
         raise ValueError(f"terrain_type {terrain} is not supported")
     # update the origin in a free space
     return mesh_list, origin
+
+
+def _make_corner_walls(
+    rng: np.random.Generator, size: tuple[float, float], wall_probability: float, size_range: tuple[float, float]
+) -> list[trimesh.Trimesh]:
+    """Add tall walls in the corners of the terrain.
+
+    Every corner gets a wall with probability ``wall_probability``. The walls extend from their corner by a fraction
+    of the terrain size sampled from ``size_range``.
+    """
+    corners = np.array([(0.0, 0.0), (size[0], 0.0), (0.0, size[1]), (size[0], size[1])])
+    # sample all corners so that the random numbers drawn do not depend on which walls are kept
+    keep = rng.uniform(0, 1, 4) <= wall_probability
+    dims = np.zeros((4, 3))
+    dims[:, 0] = size[0] * rng.uniform(*size_range, 4)
+    dims[:, 1] = size[1] * rng.uniform(*size_range, 4)
+    dims[:, 2] = 6.0
+    # move the walls inwards from their corner
+    signs = np.array([(1, 1), (-1, 1), (1, -1), (-1, -1)])
+    centers = np.zeros((4, 3))
+    centers[:, :2] = corners + signs * dims[:, :2] / 2
+    if not np.any(keep):
+        return []
+    return [make_boxes(centers[keep], dims[keep])]
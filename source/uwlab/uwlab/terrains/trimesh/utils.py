@@ -0,0 +1,185 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Vectorized builders for meshes made of many primitives.
+
+The terrains are often made of many boxes, cylinders or cones of the same kind. Instead of creating and
+concatenating one ``trimesh`` object per primitive, the builders transform the vertices of one template primitive
+for all instances at once and offset the template faces per instance.
+"""
+
+from __future__ import annotations
+
+import functools
+import numpy as np
+import scipy.spatial.transform as tf
+import trimesh
+
+
+def make_rng(seed: int | None) -> np.random.Generator:
+    """Create the random number generator of a sub-terrain.
+
+    Args:
+        seed: The seed of the sub-terrain. If None, the seed is drawn from the global NumPy random number
+            generator, which the terrain generator seeds for every sub-terrain.
+
+    Returns:
+        The random number generator.
+    """
+    if seed is None:
+        seed = np.random.randint(0, 2**31 - 1)
+    return np.random.default_rng(seed)
+
+
+def make_boxes(centers: np.ndarray, extents: np.ndarray, rotations: np.ndarray | None = None) -> trimesh.Trimesh:
+    """Generate a single mesh made of N boxes.
+
+    Args:
+        centers: The centers of the boxes (in m). Shape is (N, 3).
+        extents: The dimensions of the boxes along their x, y and z axis (in m). Shape is (N, 3).
+        rotations: The rotation matrices of the boxes. Shape is (N, 3, 3). Defaults to None (no rotation).
+
+    Returns:
+        A trimesh.Trimesh object with the boxes.
+    """
+    vertices, faces = _unit_box()
+    return _make_instances(vertices, faces, np.asarray(extents, dtype=float), centers, rotations)
+
+
+def make_cylinders(
+    centers: np.ndarray,
+    radii: np.ndarray,
+    heights: np.ndarray,
+    rotations: np.ndarray | None = None,
+    sections: int = 32,
+) -> trimesh.Trimesh:
+    """Generate a single mesh made of N cylinders with the same number of sections.
+
+    The cylinders are centered at their centers, with their axis along the z axis before the rotation.
+
+    Args:
+        centers: The centers of the cylinders (in m). Shape is (N, 3).
+        radii: The radii of the cylinders (in m). Shape is (N,).
+        heights: The heights of the cylinders (in m). Shape is (N,).
+        rotations: The rotation matrices of the cylinders. Shape is (N, 3, 3). Defaults to None (no rotation).
+        sections: The number of sections of the cylinders. Defaults to 32.
+
+    Returns:
+        A trimesh.Trimesh object with the cylinders.
+    """
+    radii = np.asarray(radii, dtype=float)
+    scales = np.stack([radii, radii, np.asarray(heights, dtype=float)], axis=1)
+    vertices, faces = _unit_cylinder(sections)
+    return _make_instances(vertices, faces, scales, centers, rotations)
+
+
+def make_cones(
+    centers: np.ndarray,
+    radii: np.ndarray,
+    heights: np.ndarray,
+    rotations: np.ndarray | None = None,
+    sections: int = 32,
+) -> trimesh.Trimesh:
+    """Generate a single mesh made of N cones with the same number of sections.
+
+    The cones have their base at their centers and their tip along the z axis before the rotation.
+
+    Args:
+        centers: The centers of the cone bases (in m). Shape is (N, 3).
+        radii: The radii of the cones (in m). Shape is (N,).
+        heights: The heights of the cones (in m). Shape is (N,).
+        rotations: The rotation matrices of the cones. Shape is (N, 3, 3). Defaults to None (no rotation).
+        sections: The number of sections of the cones. Defaults to 32.
+
+    Returns:
+        A trimesh.Trimesh object with the cones.
+    """
+    radii = np.asarray(radii, dtype=float)
+    scales = np.stack([radii, radii, np.asarray(heights, dtype=float)], axis=1)
+    vertices, faces = _unit_cone(sections)
+    return _make_instances(vertices, faces, scales, centers, rotations)
+
+
+def random_tilted_rotations(
+    rng: np.random.Generator, num: int, max_yx_angle: float = 0.0, degrees: bool = True
+) -> np.ndarray:
+    """Sample rotations with a random yaw and a random tilt along the y and x axis.
+
+    The rotations follow the same distribution as the ones of :func:`isaaclab.terrains.trimesh.utils.make_box`:
+    uniformly random rotations whose y and x Euler angles are scaled down by ``max_yx_angle``.
+
+    Args:
+        rng: The random number generator.
+        num: The number of rotations.
+        max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
+        degrees: Whether the angle is in degrees. Defaults to True.
+
+    Returns:
+        The rotation matrices. Shape is (num, 3, 3).
+    """
+    euler_zyx = tf.Rotation.random(num, rng).as_euler("zyx")
+    # cap the rotation along the y and x axis
+    if degrees:
+        max_yx_angle = max_yx_angle / 180.0
+    euler_zyx[:, 1:] *= max_yx_angle
+    return tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
+
+
+def yaw_rotations(yaws: np.ndarray, degrees: bool = False) -> np.ndarray:
+    """Rotation matrices about the z axis.
+
+    Args:
+        yaws: The yaw angles. Shape is (N,).
+        degrees: Whether the angles are in degrees. Defaults to False.
+
+    Returns:
+        The rotation matrices. Shape is (N, 3, 3).
+    """
+    yaws = np.asarray(yaws, dtype=float).reshape(-1, 1)
+    return tf.Rotation.from_euler("z", yaws, degrees=degrees).as_matrix()
+
+
+"""
+Internal helpers.
+"""
+
+
+@functools.cache
+def _unit_box() -> tuple[np.ndarray, np.ndarray]:
+    box = trimesh.creation.box((1.0, 1.0, 1.0))
+    return np.asarray(box.vertices), np.asarray(box.faces)
+
+
+@functools.cache
+def _unit_cylinder(sections: int) -> tuple[np.ndarray, np.ndarray]:
+    cylinder = trimesh.creation.cylinder(radius=1.0, height=1.0, sections=sections)
+    return np.asarray(cylinder.vertices), np.asarray(cylinder.faces)
+
+
+@functools.cache
+def _unit_cone(sections: int) -> tuple[np.ndarray, np.ndarray]:
+    cone = trimesh.creation.cone(radius=1.0, height=1.0, sections=sections)
+    return np.asarray(cone.vertices), np.asarray(cone.faces)
+
+
+def _make_instances(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    scales: np.ndarray,
+    centers: np.ndarray,
+    rotations: np.ndarray | None,
+) -> trimesh.Trimesh:
+    """Scale, rotate and translate the template vertices for every instance, and offset the template faces."""
+    num_instances = len(scales)
+    # transform the vertices of all instances, of shape (N, V, 3)
+    instance_vertices = vertices[None] * scales[:, None, :]
+    if rotations is not None:
+        instance_vertices = instance_vertices @ np.swapaxes(np.asarray(rotations), 1, 2)
+    instance_vertices += np.asarray(centers, dtype=float).reshape(num_instances, 1, 3)
+    # offset the faces by the vertices of the previous instances, of shape (N, F, 3)
+    instance_faces = faces[None] + (np.arange(num_instances) * len(vertices))[:, None, None]
+    return trimesh.Trimesh(
+        vertices=instance_vertices.reshape(-1, 3), faces=instance_faces.reshape(-1, 3), process=False
+    )
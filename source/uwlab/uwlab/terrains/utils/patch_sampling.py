@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
+import math
 import numpy as np
 import torch
+import torch.nn.functional as F
 from typing import TYPE_CHECKING
 
+import omni.log
 import warp as wp  # Warp (https://github.com/NVIDIA/warp)
 
 from isaaclab.utils.warp import raycast_mesh
@@ -488,3 +491,183 @@ def find_flat_patches_by_radius(
     # (i.e., subtract origin so that final returned coords are consistent
     #  with the original code's behavior)
     return flat_patches - origin
+
+
+def find_flat_patches_from_height_map(
+    wp_mesh: wp.Mesh,
+    origin: np.ndarray | torch.Tensor | tuple[float, float, float],
+    cfg: patch_cfg.HeightMapFlatPatchSamplingCfg,
+) -> torch.Tensor:
+    """Finds flat patches of given radius in the input mesh from a height map of the mesh.
+
+    Instead of rejection sampling, the function rasterizes the search space once and draws all patches at once:
+
+    1. Ray-cast a grid with spacing :attr:`~patch_cfg.HeightMapFlatPatchSamplingCfg.resolution` to obtain the
+       height map of the mesh.
+    2. Compute the minimum and maximum height around every cell with a min/max filter over the largest patch
+       radius (one cell is added to cover the jitter of the sampled centers).
+    3. Mark the cells whose patch lies in one of the z ranges and whose height difference is at most the maximum
+       height difference as valid, and draw the patch centers uniformly from the valid cells.
+    4. Confirm the drawn centers with the ring ray-casts of :func:`find_flat_patches`, and redraw the ones that
+       fail for at most :attr:`~patch_cfg.HeightMapFlatPatchSamplingCfg.max_confirm_iterations` rounds.
+
+    The min/max filter uses a square window, which contains the disk of the patch, so the validity of a cell is
+    conservative up to the resolution of the height map. Centers that still fail the ring check after the last
+    round are replaced by randomly chosen confirmed centers, with a warning. If no center was confirmed, they are
+    kept with a warning, as their patch is only valid on the height map.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        origin: The origin defining the center of the search space. This is specified in the mesh frame.
+        cfg: The configuration of the sampling.
+
+    Returns:
+        A tensor of shape (num_patches, 3) containing the flat patches. The patches are defined in the mesh frame,
+        relative to the origin.
+
+    Raises:
+        ValueError: If the search space does not overlap with the mesh.
+        RuntimeError: If no cell of the height map is valid.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+
+    # resolve inputs to consistent type
+    patch_radius = [cfg.patch_radius] if isinstance(cfg.patch_radius, (float, int)) else list(cfg.patch_radius)
+    x_ranges = [cfg.x_range] if isinstance(cfg.x_range, tuple) else list(cfg.x_range)
+    y_ranges = [cfg.y_range] if isinstance(cfg.y_range, tuple) else list(cfg.y_range)
+    z_ranges = [cfg.z_range] if isinstance(cfg.z_range, tuple) else list(cfg.z_range)
+    if isinstance(origin, np.ndarray):
+        origin = torch.from_numpy(origin).to(torch.float).to(device)
+    elif isinstance(origin, torch.Tensor):
+        origin = origin.to(torch.float).to(device)
+    else:
+        origin = torch.tensor(origin, dtype=torch.float, device=device)
+    origin_x, origin_y, origin_z = origin.tolist()
+
+    # bound the search space by the mesh
+    mesh_points = wp_mesh.points.numpy()
+    mesh_min, mesh_max = mesh_points[:, :2].min(axis=0), mesh_points[:, :2].max(axis=0)
+    x_ranges = [(max(low + origin_x, mesh_min[0]), min(high + origin_x, mesh_max[0])) for low, high in x_ranges]
+    y_ranges = [(max(low + origin_y, mesh_min[1]), min(high + origin_y, mesh_max[1])) for low, high in y_ranges]
+    x_ranges = [(low, high) for low, high in x_ranges if low <= high]
+    y_ranges = [(low, high) for low, high in y_ranges if low <= high]
+    if not x_ranges or not y_ranges:
+        raise ValueError("The x and y ranges of the flat patch sampling do not overlap with the terrain mesh.")
+    z_ranges = [(low + origin_z, high + origin_z) for low, high in z_ranges]
+
+    # 1. rasterize the search space, padded by the patch radius, into a height map
+    resolution = cfg.resolution
+    padding = max(patch_radius) + resolution
+    x_min = max(min(low for low, _ in x_ranges) - padding, mesh_min[0])
+    x_max = min(max(high for _, high in x_ranges) + padding, mesh_max[0])
+    y_min = max(min(low for low, _ in y_ranges) - padding, mesh_min[1])
+    y_max = min(max(high for _, high in y_ranges) + padding, mesh_max[1])
+    grid_x = torch.arange(x_min, x_max + 0.5 * resolution, resolution, device=device)
+    grid_y = torch.arange(y_min, y_max + 0.5 * resolution, resolution, device=device)
+    cells = torch.stack(torch.meshgrid(grid_x, grid_y, indexing="ij"), dim=-1)
+    heights = _raycast_heights(wp_mesh, cells.view(-1, 2)).view(cells.shape[:2])
+
+    # 2-3. valid cells: flat enough and within a z range over the patch radius, and inside the sampling ranges
+    half_width = math.ceil(max(patch_radius) / resolution) + 1
+    valid = _flat_cell_mask(heights, half_width, cfg.max_height_diff, z_ranges)
+    valid &= _in_ranges(cells[..., 0], x_ranges) & _in_ranges(cells[..., 1], y_ranges)
+    if cfg.radius_range is not None:
+        distance = torch.linalg.norm(cells - origin[:2], dim=-1)
+        valid &= (distance >= cfg.radius_range[0]) & (distance <= cfg.radius_range[1])
+    valid_cells = cells[valid]
+    if len(valid_cells) == 0:
+        raise RuntimeError(
+            "Failed to find valid patches! No cell of the height map is flat enough."
+            f"\n\tMaximum height difference: {cfg.max_height_diff}"
+            f"\n\tPatch radius: {patch_radius}"
+        )
+
+    # create a circle of points around (0, 0) to confirm the patches, as in :func:`find_flat_patches`
+    angle = torch.linspace(0, 2 * np.pi, 10, device=device)
+    ring = torch.cat([radius * torch.stack([torch.cos(angle), torch.sin(angle)], dim=-1) for radius in patch_radius])
+
+    # 4. draw all patches at once and confirm them
+    flat_patches = torch.zeros(cfg.num_patches, 3, device=device)
+    patch_ids = torch.arange(cfg.num_patches, device=device)
+    for _ in range(max(cfg.max_confirm_iterations, 1)):
+        # draw cells and jitter the centers within their cell
+        cell_ids = torch.randint(len(valid_cells), (len(patch_ids),), device=device)
+        centers = valid_cells[cell_ids] + (torch.rand(len(patch_ids), 2, device=device) - 0.5) * resolution
+        flat_patches[patch_ids, :2] = centers
+        flat_patches[patch_ids, 2] = _raycast_heights(wp_mesh, centers)
+        # ring check on the exact mesh
+        ring_heights = _raycast_heights(wp_mesh, (centers.unsqueeze(1) + ring).view(-1, 2)).view(len(patch_ids), -1)
+        ring_ok = torch.zeros(len(patch_ids), dtype=torch.bool, device=device)
+        for low, high in z_ranges:
+            ring_ok |= ((ring_heights >= low) & (ring_heights <= high)).all(dim=1)
+        ring_ok &= (ring_heights.max(dim=1)[0] - ring_heights.min(dim=1)[0]) <= cfg.max_height_diff
+        patch_ids = patch_ids[~ring_ok]
+        if len(patch_ids) == 0:
+            break
+
+    # replace the centers that failed the ring check in every round by confirmed ones
+    if len(patch_ids) > 0:
+        confirmed = torch.ones(cfg.num_patches, dtype=torch.bool, device=device)
+        confirmed[patch_ids] = False
+        confirmed_ids = confirmed.nonzero().squeeze(-1)
+        if len(confirmed_ids) > 0:
+            omni.log.warn(
+                f"{len(patch_ids)} of {cfg.num_patches} flat patches failed the ray-cast confirmation within"
+                f" {cfg.max_confirm_iterations} iterations, replacing them with confirmed patches."
+            )
+            replacements = confirmed_ids[torch.randint(len(confirmed_ids), (len(patch_ids),), device=device)]
+            flat_patches[patch_ids] = flat_patches[replacements]
+        else:
+            omni.log.warn(
+                f"None of the {cfg.num_patches} flat patches passed the ray-cast confirmation within"
+                f" {cfg.max_confirm_iterations} iterations, keeping the patches that are flat on the height map."
+                " Consider decreasing the resolution or increasing max_confirm_iterations."
+            )
+
+    # return the flat patches (in the mesh frame)
+    return flat_patches - origin
+
+
+def _flat_cell_mask(
+    heights: torch.Tensor, half_width: int, max_height_diff: float, z_ranges: list[tuple[float, float]]
+) -> torch.Tensor:
+    """Mask of the cells of a height map whose surrounding window is flat enough and within a z range.
+
+    Args:
+        heights: The height map of shape (num_x, num_y), infinite where there is no mesh.
+        half_width: Half width of the square window around every cell, in cells.
+        max_height_diff: Maximum height difference within the window.
+        z_ranges: The (min, max) ranges of heights, the whole window must lie in one of them.
+
+    Returns:
+        The mask of the valid cells, of shape (num_x, num_y).
+    """
+    # note: cells without a hit are given infinite extent, so that no patch covering them is valid
+    missed = ~torch.isfinite(heights)
+    max_heights = torch.where(missed, float("inf"), heights)
+    min_heights = torch.where(missed, float("-inf"), heights)
+    window = dict(kernel_size=2 * half_width + 1, stride=1, padding=half_width)
+    max_heights = F.max_pool2d(max_heights[None, None], **window)[0, 0]
+    min_heights = -F.max_pool2d(-min_heights[None, None], **window)[0, 0]
+    valid = (max_heights - min_heights) <= max_height_diff
+    in_z_range = torch.zeros_like(valid)
+    for low, high in z_ranges:
+        in_z_range |= (min_heights >= low) & (max_heights <= high)
+    return valid & in_z_range
+
+
+def _raycast_heights(wp_mesh: wp.Mesh, points: torch.Tensor) -> torch.Tensor:
+    """Heights of the mesh below the (x, y) ``points`` of shape (N, 2), infinite where there is no mesh."""
+    starts = torch.cat([points, torch.full_like(points[:, :1], 100.0)], dim=-1)
+    dirs = torch.zeros_like(starts)
+    dirs[:, 2] = -1.0
+    return raycast_mesh(starts, dirs, wp_mesh)[0][:, 2]
+
+
+def _in_ranges(values: torch.Tensor, ranges: list[tuple[float, float]]) -> torch.Tensor:
+    """Mask of the values inside at least one of the (min, max) ranges."""
+    mask = torch.zeros_like(values, dtype=torch.bool)
+    for low, high in ranges:
+        mask |= (values >= low) & (values <= high)
+    return mask
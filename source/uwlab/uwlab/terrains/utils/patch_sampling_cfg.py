@@ -97,3 +97,58 @@ class FlatPatchSamplingByRadiusCfg(PatchSamplingCfg):
     max_height_diff: float = MISSING
 
     max_iterations: int = 100
+
+
+@configclass
+class HeightMapFlatPatchSamplingCfg(PatchSamplingCfg):
+    """Configuration for sampling flat patches from a height map of the sub-terrain.
+
+    The sampling runs in constant time per sub-terrain instead of rejection sampling until all patches are valid,
+    see :func:`~uwlab.terrains.utils.patch_sampling.find_flat_patches_from_height_map`.
+    """
+
+    func: Callable = sampling_functions.find_flat_patches_from_height_map
+    """The function to use for sampling patches."""
+
+    patch_radius: float | list[float] = MISSING
+    """Radius of the patches.
+
+    A list of radii can be provided to check for patches of different sizes. The height map is filtered over the
+    largest radius.
+    """
+
+    x_range: tuple[float, float] | list[tuple[float, float]] = (-1e6, 1e6)
+    """The range or list of ranges of x-coordinates to sample from. Defaults to (-1e6, 1e6).
+
+    The ranges are internally clamped to the size of the terrain mesh.
+    """
+
+    y_range: tuple[float, float] | list[tuple[float, float]] = (-1e6, 1e6)
+    """The range or list of ranges of y-coordinates to sample from. Defaults to (-1e6, 1e6).
+
+    The ranges are internally clamped to the size of the terrain mesh.
+    """
+
+    z_range: tuple[float, float] | list[tuple[float, float]] = (-1e6, 1e6)
+    """Allowed range or list of ranges of z-coordinates for the sampled patch. Defaults to (-1e6, 1e6).
+
+    With several ranges, the whole patch must lie in one of them.
+    """
+
+    radius_range: tuple[float, float] | None = None
+    """Range of distances of the patch centers to the origin in the xy-plane. Defaults to None (no restriction)."""
+
+    max_height_diff: float = MISSING
+    """Maximum allowed height difference between the highest and lowest points on the patch."""
+
+    resolution: float = 0.05
+    """Spacing of the height map in m. Defaults to 0.05.
+
+    The validity of the patches is exact up to this resolution before they are confirmed by ray-casting.
+    """
+
+    max_confirm_iterations: int = 5
+    """Maximum number of rounds redrawing the patches that fail the ray-cast confirmation. Defaults to 5.
+
+    The patches that still fail after the last round are replaced by confirmed ones, with a warning.
+    """
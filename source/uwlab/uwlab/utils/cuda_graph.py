@@ -0,0 +1,115 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable, Sequence
+
+import omni.log
+
+
+class CudaGraphCallable:
+    """Runs a function eagerly for a few calls, then captures it into a CUDA graph and replays it.
+
+    Every call executes the function exactly once: the warm-up calls run eagerly on a side stream (as required
+    before capturing), the next call captures the graph and replays it. The function must only work on tensors whose
+    address and shape stay the same between calls, and must not depend on host side state that changes between
+    calls, as only the recorded kernels are replayed.
+
+    The tensors returned by ``inputs`` are checked before every replay. If one of them was reallocated or changed
+    shape, the graph is dropped and captured again after a new warm-up. If capturing fails, the function runs
+    eagerly from then on.
+
+    Example:
+        .. code-block:: python
+
+            substep = CudaGraphCallable(apply_actions, inputs=lambda: [action_buffer])
+            for _ in range(decimation):
+                action_buffer.copy_(new_action)
+                substep()
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], None],
+        inputs: Callable[[], Sequence[torch.Tensor]] | None = None,
+        warmup: int = 3,
+        name: str = "cuda_graph",
+    ):
+        """Initialize the callable.
+
+        Args:
+            func: Function without arguments to capture.
+            inputs: Returns the tensors the graph reads or writes, whose addresses and shapes must not change.
+                Defaults to None (no check).
+            warmup: Number of eager calls before capturing. Defaults to 3.
+            name: Name used in warnings.
+        """
+        self.func = func
+        self.inputs = inputs
+        self.warmup = warmup
+        self.name = name
+        self.failed = False
+        """Whether capturing failed, in which case the function runs eagerly."""
+        self.num_captures = 0
+        """Number of times the graph was captured."""
+        self._graph: torch.cuda.CUDAGraph | None = None
+        self._signature: list[tuple[int, tuple[int, ...]]] = []
+        self._warmup_left = warmup
+        self._stream: torch.cuda.Stream | None = None
+
+    @property
+    def is_captured(self) -> bool:
+        return self._graph is not None
+
+    def reset(self):
+        """Drop the graph, it is captured again after a new warm-up."""
+        self._graph = None
+        self._warmup_left = self.warmup
+
+    def __call__(self):
+        if self.failed:
+            self.func()
+            return
+        if self._graph is not None and self._signature != self._input_signature():
+            omni.log.info(f"Inputs of '{self.name}' changed, capturing the CUDA graph again.")
+            self.reset()
+        if self._graph is None:
+            if self._warmup_left > 0:
+                self._warmup()
+                return
+            self._capture()
+            if self._graph is None:
+                self.func()
+                return
+        self._graph.replay()
+
+    def _warmup(self):
+        if self._stream is None:
+            self._stream = torch.cuda.Stream()
+        self._stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(self._stream):
+            self.func()
+        torch.cuda.current_stream().wait_stream(self._stream)
+        self._warmup_left -= 1
+
+    def _capture(self):
+        graph = torch.cuda.CUDAGraph()
+        try:
+            with torch.cuda.graph(graph):
+                self.func()
+        except Exception as e:
+            omni.log.warn(f"Capturing '{self.name}' into a CUDA graph failed, running it eagerly: {e}")
+            self.failed = True
+            return
+        self._graph = graph
+        self._signature = self._input_signature()
+        self.num_captures += 1
+
+    def _input_signature(self) -> list[tuple[int, tuple[int, ...]]]:
+        if self.inputs is None:
+            return []
+        return [(tensor.data_ptr(), tuple(tensor.shape)) for tensor in self.inputs()]
@@ -16,11 +16,14 @@ if TYPE_CHECKING:
 
 
 def outlier_noise(data: torch.Tensor, cfg: noise_cfg.OutlierNoiseCfg) -> torch.Tensor:
-    """Applies a gaussian noise to a given data set.
+    """Replaces random elements of a given data set with outliers.
+
+    The noise of :attr:`~noise_cfg.OutlierNoiseCfg.noise_cfg` is applied to the whole data set and selected where
+    an outlier occurs, which avoids the host synchronization of indexing with a mask.
 
     Args:
         data: The unmodified data set to apply noise to.
-        cfg: The configuration parameters for gaussian noise.
+        cfg: The configuration parameters for outlier noise.
 
     Returns:
         The data modified by the noise parameters provided.
@@ -33,12 +36,17 @@ def outlier_noise(data: torch.Tensor, cfg: noise_cfg.OutlierNoiseCfg) -> torch.T
     # generate a mask for the outliers
     mask = torch.rand_like(data) < cfg.probability
 
-    data[mask] = cfg.noise_cfg.func(data[mask], cfg.noise_cfg)
-
-    return data
+    return torch.where(mask, cfg.noise_cfg.func(data, cfg.noise_cfg), data)
 
 
 class NoiseModelGroup(NoiseModel):
+    """Applies a different chain of noise models to each group of environments.
+
+    Every environment is assigned to a group on reset, with the probabilities given by the proportions of the
+    groups. Each noise model runs once over the data of all environments, and its output is selected for the
+    environments of its group, so applying the noise launches a fixed set of kernels and never waits for the device.
+    """
+
     def __init__(self, noise_model_cfg: noise_cfg.NoiseModelGroupCfg, num_envs: int, device: str):
         # initialize parent class
         super().__init__(noise_model_cfg, num_envs, device)
@@ -48,6 +56,9 @@ class NoiseModelGroup(NoiseModel):
         )
         self.proportions /= torch.sum(self.proportions)
         self.noise_group_assignment = torch.zeros(num_envs, device=device, dtype=torch.int64)
+        # membership of the environments in the groups, shape (num_groups, num_envs)
+        self._group_masks = torch.zeros(len(self.proportions), num_envs, device=device, dtype=torch.bool)
+        self._group_masks[0] = True
 
         self.noise_model_list: list[list[noise_cfg.NoiseCfg]] = []
 
@@ -69,6 +80,8 @@ class NoiseModelGroup(NoiseModel):
             env_ids = torch.arange(self._num_envs, device=self._device)
 
         self.noise_group_assignment[env_ids] = torch.multinomial(self.proportions, len(env_ids), replacement=True)
+        group_ids = torch.arange(len(self.proportions), device=self._device)
+        torch.eq(group_ids.unsqueeze(1), self.noise_group_assignment.unsqueeze(0), out=self._group_masks)
 
     def apply(self, data: torch.Tensor) -> torch.Tensor:
         """Apply bias noise to the data.
@@ -79,10 +92,18 @@ class NoiseModelGroup(NoiseModel):
         Returns:
             The data with the noise applied. Shape is the same as the input data.
         """
-        for i in range(len(self.noise_model_list)):
-            noise_models = self.noise_model_list[i]
-            noise_group = self.noise_group_assignment == i
+        output = data
+        for i, noise_models in enumerate(self.noise_model_list):
+            if len(noise_models) == 0:
+                continue
+            noisy_data = data
             for noise_model in noise_models:
-                data[noise_group] = noise_model.func(data[noise_group], noise_model)
+                noisy_data = noise_model.func(noisy_data, noise_model)
+            # select the output of the group for its environments
+            mask = self._group_masks[i].view(-1, *([1] * (data.dim() - 1)))
+            output = torch.where(mask, noisy_data, output)
+
+        return output
 
-        return data
+    def __call__(self, data: torch.Tensor) -> torch.Tensor:
+        return self.apply(data)
@@ -0,0 +1,349 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import time
+import torch
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from prettytable import PrettyTable
+from typing import Any
+
+from .wrappers import ForwardingCallable
+
+# upper bin edges of the timing histograms in microseconds, the last bin collects everything above
+HISTOGRAM_EDGES_US: tuple[float, ...] = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000)
+
+
+class LoopStatistics:
+    """Latency, jitter and overrun statistics of a periodic loop.
+
+    The counters live in shared memory so that a loop running in a worker thread or process can record them while
+    the environment reads them, e.g. to log them. For every cycle three quantities are recorded:
+
+    - latency: how late the loop woke up with respect to its deadline.
+    - jitter: how much the time between two consecutive wake-ups deviates from the period.
+    - overrun: how far the work of a cycle ran past the deadline of the next cycle, only recorded for cycles that
+      missed it.
+    """
+
+    _QUANTITIES = ("latency", "jitter", "overrun")
+
+    def __init__(self, dt: float):
+        """Allocate the shared counters.
+
+        Args:
+            dt: Period of the loop in seconds.
+        """
+        self.dt = dt
+        self.histograms = torch.zeros((len(self._QUANTITIES), len(HISTOGRAM_EDGES_US) + 1), dtype=torch.int64)
+        self.histograms.share_memory_()
+        # per quantity: sum and max in seconds
+        self.totals = torch.zeros((len(self._QUANTITIES), 2), dtype=torch.float64).share_memory_()
+        # cycles, skipped periods
+        self.counters = torch.zeros(2, dtype=torch.int64).share_memory_()
+
+    def reset(self):
+        self.histograms.zero_()
+        self.totals.zero_()
+        self.counters.zero_()
+
+    def record(self, latency: float, jitter: float | None = None, overrun: float | None = None, skipped: int = 0):
+        """Record one cycle, times are in seconds."""
+        self.counters[0] += 1
+        self.counters[1] += skipped
+        for i, value in enumerate((latency, jitter, overrun)):
+            if value is None:
+                continue
+            self.histograms[i, bisect.bisect_left(HISTOGRAM_EDGES_US, value * 1e6)] += 1
+            self.totals[i, 0] += value
+            if value > self.totals[i, 1]:
+                self.totals[i, 1] = value
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the recorded cycles.
+
+        Returns:
+            A flat dictionary with the number of cycles, overruns and skipped periods, and mean, max and 99th
+            percentile (upper histogram bin edge) of latency and jitter in microseconds.
+        """
+        histograms = self.histograms.clone()
+        totals = self.totals.clone()
+        summary = {
+            "cycles": float(self.counters[0]),
+            "overruns": float(histograms[2].sum()),
+            "skipped_periods": float(self.counters[1]),
+        }
+        for i, name in enumerate(self._QUANTITIES[:2]):
+            count = int(histograms[i].sum())
+            summary[f"{name}_mean_us"] = float(totals[i, 0]) / max(count, 1) * 1e6
+            summary[f"{name}_max_us"] = float(totals[i, 1]) * 1e6
+            summary[f"{name}_p99_us"] = self._percentile(histograms[i], 0.99, float(totals[i, 1]) * 1e6)
+        return summary
+
+    @staticmethod
+    def _percentile(histogram: torch.Tensor, q: float, max_value: float) -> float:
+        count = int(histogram.sum())
+        if count == 0:
+            return 0.0
+        index = int(torch.searchsorted(torch.cumsum(histogram, 0), math.ceil(q * count)))
+        return float(HISTOGRAM_EDGES_US[index]) if index < len(HISTOGRAM_EDGES_US) else max_value
+
+
+class DeadlineScheduler:
+    """Paces a periodic loop on absolute deadlines of a monotonic clock.
+
+    Deadlines advance by exactly one period per cycle, so time spent doing the work of a cycle does not accumulate
+    as drift. A cycle that runs past the next deadline is recorded as an overrun, and whole periods that were missed
+    are skipped instead of being caught up in a burst. Optionally, the last ``busy_wait`` seconds before a deadline
+    are spent spinning rather than sleeping, trading CPU time for wake-up precision, and the loop can be pinned to a
+    set of CPUs.
+
+    Example:
+        .. code-block:: python
+
+            scheduler = DeadlineScheduler(dt=0.002, busy_wait=0.0005)
+            while running:
+                scheduler.wait()
+                poll_hardware()
+    """
+
+    def __init__(
+        self,
+        dt: float,
+        busy_wait: float = 0.0,
+        cpu_affinity: list[int] | None = None,
+        statistics: LoopStatistics | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            dt: Period of the loop in seconds.
+            busy_wait: Time in seconds before each deadline that is spent spinning. Defaults to 0 (only sleep).
+            cpu_affinity: CPUs the calling thread is pinned to on :meth:`start`. Defaults to None (no pinning).
+            statistics: Statistics the cycles are recorded to. Defaults to a new instance.
+        """
+        self.dt = dt
+        self.busy_wait = busy_wait
+        self.cpu_affinity = cpu_affinity
+        self.statistics = statistics if statistics is not None else LoopStatistics(dt)
+        self._deadline: float | None = None
+        self._last_wake: float | None = None
+
+    def start(self):
+        """Pin the calling thread if requested and place the first deadline one period from now."""
+        if self.cpu_affinity is not None:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(0, self.cpu_affinity)
+            else:
+                print("Warning: CPU pinning is not supported on this platform, ignoring cpu_affinity.")
+        self.reset()
+
+    def reset(self):
+        """Forget the current deadline, e.g. while the loop is paused. The next :meth:`wait` restarts pacing."""
+        self._deadline = None
+        self._last_wake = None
+
+    def wait(self):
+        """Block until the next deadline and advance the deadline by one period."""
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now + self.dt
+        overrun = None
+        skipped = 0
+        if now > self._deadline:
+            # the previous cycle missed this deadline, drop the periods that passed entirely
+            overrun = now - self._deadline
+            skipped = int(overrun // self.dt)
+            self._deadline += skipped * self.dt
+        remaining = self._deadline - now - self.busy_wait
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.monotonic() < self._deadline:
+            pass
+        wake = time.monotonic()
+        jitter = abs(wake - self._last_wake - self.dt) if self._last_wake is not None else None
+        self.statistics.record(wake - self._deadline, jitter, overrun, skipped)
+        self._last_wake = wake
+        self._deadline += self.dt
+
+
+class StepProfiler:
+    """Records the time spent in named, nested scopes of an environment step.
+
+    Every scope records two durations: the wall time until the host leaves the scope, and the synchronized time,
+    which additionally waits for the CUDA work launched in the scope to finish. The synchronized time is what a scope
+    actually costs on the GPU, the difference to the wall time shows how much of it runs asynchronously. With
+    ``cuda_sync`` disabled (or without CUDA), both are the same and the profiler does not stall the device.
+
+    Scopes opened inside other scopes are named by their path, e.g. ``"reward/track_lin_vel"``. Durations are summed
+    per step (a scope can be entered several times in one step) and aggregated over a sliding window of the last
+    ``window`` steps, closed with :meth:`step`.
+
+    Example:
+        .. code-block:: python
+
+            profiler = StepProfiler(window=100)
+            with profiler.scope("reward"):
+                reward = profiler.wrap("track_lin_vel", track_lin_vel)(env)
+            profiler.step()
+            print(profiler.table())
+    """
+
+    def __init__(self, window: int = 100, cuda_sync: bool = True):
+        """Initialize the profiler.
+
+        Args:
+            window: Number of steps the statistics are aggregated over.
+            cuda_sync: Whether to synchronize CUDA at the boundaries of every scope. Defaults to True.
+        """
+        self.window = window
+        self.cuda_sync = cuda_sync and torch.cuda.is_available()
+        self.num_steps = 0
+        """Number of steps closed so far."""
+        self._origin = time.perf_counter()
+        self._stack: list[str] = []
+        # scope path -> index of first entry, to list scopes in the order they run
+        self._order: dict[str, int] = {}
+        # scope path -> (wall, synchronized, calls) of the open step
+        self._current: dict[str, list[float]] = {}
+        # scope path -> (wall, synchronized, calls) of the steps in the window
+        self._history: dict[str, deque[tuple[float, float, float]]] = {}
+        # (scope path, start, synchronized duration) of the open step and of the steps in the window
+        self._events: list[tuple[str, float, float]] = []
+        self._trace: deque[list[tuple[str, float, float]]] = deque(maxlen=window)
+
+    def reset(self):
+        """Forget all recorded steps."""
+        self.num_steps = 0
+        self._order.clear()
+        self._current.clear()
+        self._history.clear()
+        self._events = []
+        self._trace.clear()
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """Time the body of the ``with`` statement as scope ``name``, nested in the currently open scope."""
+        path = "/".join(self._stack + [name])
+        self._order.setdefault(path, len(self._order))
+        self._stack.append(name)
+        if self.cuda_sync:
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start
+            if self.cuda_sync:
+                torch.cuda.synchronize()
+            synced = time.perf_counter() - start
+            self._stack.pop()
+            record = self._current.setdefault(path, [0.0, 0.0, 0])
+            record[0] += wall
+            record[1] += synced
+            record[2] += 1
+            self._events.append((path, start, synced))
+
+    def wrap(self, name: str, func: Callable) -> ProfiledCallable:
+        """Wrap ``func`` so that every call is timed as scope ``name``."""
+        return ProfiledCallable(self, name, func)
+
+    def step(self):
+        """Close the current step and add it to the window."""
+        for path in self._current.keys() - self._history.keys():
+            self._history[path] = deque(maxlen=self.window)
+        for path, history in self._history.items():
+            history.append(tuple(self._current.get(path, (0.0, 0.0, 0))))
+        self._current.clear()
+        self._trace.append(self._events)
+        self._events = []
+        self.num_steps += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Statistics of every scope over the window.
+
+        Returns:
+            For every scope path, the mean number of calls per step (``calls``), the mean wall and synchronized time
+            per step (``wall_ms``, ``synced_ms``) and the maximum synchronized time of a step (``synced_max_ms``) in
+            milliseconds.
+        """
+        summary = {}
+        for path, history in self._history.items():
+            if len(history) == 0:
+                continue
+            wall, synced, calls = zip(*history)
+            summary[path] = {
+                "calls": sum(calls) / len(history),
+                "wall_ms": sum(wall) / len(history) * 1e3,
+                "synced_ms": sum(synced) / len(history) * 1e3,
+                "synced_max_ms": max(synced) * 1e3,
+            }
+        return summary
+
+    def table(self) -> str:
+        """The :meth:`summary` as a table, with the share of every scope in the total time of its top level scopes."""
+        summary = self.summary()
+        total = sum(stats["synced_ms"] for path, stats in summary.items() if "/" not in path)
+        table = PrettyTable()
+        table.title = f"Step Profile (last {min(self.num_steps, self.window)} steps)"
+        table.field_names = ["Scope", "Calls/step", "Wall [ms]", "Synced [ms]", "Max [ms]", "Share [%]"]
+        table.align["Scope"] = "l"
+        table.float_format = ".3"
+        for path in sorted(summary, key=self._sort_key):
+            stats = summary[path]
+            depth = path.count("/")
+            table.add_row([
+                "  " * depth + path.rsplit("/", 1)[-1],
+                stats["calls"],
+                stats["wall_ms"],
+                stats["synced_ms"],
+                stats["synced_max_ms"],
+                100.0 * stats["synced_ms"] / total if total > 0 else 0.0,
+            ])
+        return table.get_string()
+
+    def _sort_key(self, path: str) -> tuple[int, ...]:
+        # parents before children, siblings in the order they first ran
+        parts = path.split("/")
+        return tuple(self._order.get("/".join(parts[: i + 1]), len(self._order)) for i in range(len(parts)))
+
+    def export_chrome_trace(self, path: str):
+        """Write the scopes of the steps in the window as a trace viewable in ``chrome://tracing`` or Perfetto."""
+        events = []
+        for step_events in self._trace:
+            for scope_path, start, duration in step_events:
+                events.append({
+                    "name": scope_path.rsplit("/", 1)[-1],
+                    "cat": scope_path.split("/", 1)[0],
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": {"scope": scope_path},
+                })
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class ProfiledCallable(ForwardingCallable):
+    """A callable timing every call of the wrapped callable as a scope of a :class:`StepProfiler`."""
+
+    def __init__(self, profiler: StepProfiler, name: str, func: Callable):
+        super().__init__(func)
+        self._profiler = profiler
+        self._name = name
+
+    def __call__(self, *args, **kwargs) -> Any:
+        with self._profiler.scope(self._name):
+            return self._func(*args, **kwargs)
@@ -0,0 +1,29 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+class ForwardingCallable:
+    """Base class of callables that stand in for the function of a manager term.
+
+    Attribute access is forwarded to the wrapped callable, so class-based manager terms keep working (e.g. their
+    ``reset``). Subclasses override :meth:`__call__`, which calls the wrapped callable by default.
+    """
+
+    def __init__(self, func: Callable):
+        self._func = func
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._func(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # the wrapped callable is not set yet while copying or unpickling, do not recurse into it
+        if name == "_func":
+            raise AttributeError(name)
+        return getattr(self._func, name)
@@ -0,0 +1,160 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import time
+import torch
+import unittest
+
+from uwlab_assets.robots.leap.articulation_drive import DynamixelDriverCfg, FakeDynamixelPortHandler
+from uwlab_assets.robots.leap.articulation_drive.dynamixel_client import (
+    ADDR_GOAL_POSITION,
+    ADDR_PRESENT_CURRENT,
+    ADDR_PRESENT_POSITION,
+    ADDR_PRESENT_VELOCITY,
+    DEFAULT_CUR_SCALE,
+    DEFAULT_POS_SCALE,
+    DEFAULT_VEL_SCALE,
+    DynamixelClient,
+    pack_sync_write_param,
+)
+from uwlab_assets.robots.leap.articulation_drive.dynamixel_fake_port import INST_SYNC_READ, INST_SYNC_WRITE
+
+NUM_MOTORS = 16
+
+
+class TestDynamixelClient(unittest.TestCase):
+    """Test cases for the Dynamixel client against a fake serial port."""
+
+    def setUp(self):
+        self.motor_ids = list(range(NUM_MOTORS))
+        self.port = FakeDynamixelPortHandler(motor_ids=self.motor_ids)
+        self.client = DynamixelClient(motor_ids=self.motor_ids, port_handler=self.port)
+        self.client.connect()
+        # raw register values of every motor, with negative values to check the two's complement decoding
+        self.raw_pos = np.arange(NUM_MOTORS, dtype=np.int64) * 300 - 2000
+        self.raw_vel = np.arange(NUM_MOTORS, dtype=np.int64) * 7 - 50
+        self.raw_cur = np.arange(NUM_MOTORS, dtype=np.int64) * 20 - 150
+        self._write_present_state(self.raw_pos, self.raw_vel, self.raw_cur)
+
+    def tearDown(self):
+        self.client.disconnect()
+
+    """
+    Tests.
+    """
+
+    def test_pack_sync_write_param(self):
+        """Test that the sync write parameter holds the id and the little-endian two's complement of every value."""
+        param = pack_sync_write_param([1, 2, 3], [5, -1, 1000.7], 4)
+        expected = [1, 5, 0, 0, 0, 2, 0xFF, 0xFF, 0xFF, 0xFF, 3, 0xE8, 0x03, 0, 0]
+        self.assertEqual(param, expected)
+        # values are truncated towards zero and cut to the requested size
+        self.assertEqual(pack_sync_write_param([7], [-2.9], 2), [7, 0xFE, 0xFF])
+        self.assertEqual(pack_sync_write_param([7], [300], 1), [7, 300 & 0xFF])
+
+    def test_read_pos_vel_cur(self):
+        """Test that the positions, velocities and currents of a sync read are decoded and scaled."""
+        pos, vel, cur = self.client.read_pos_vel_cur()
+        np.testing.assert_allclose(pos, self.raw_pos * DEFAULT_POS_SCALE, rtol=1e-6)
+        np.testing.assert_allclose(vel, self.raw_vel * DEFAULT_VEL_SCALE, rtol=1e-6)
+        np.testing.assert_allclose(cur, self.raw_cur * DEFAULT_CUR_SCALE, rtol=1e-6)
+        # all motors are read with a single sync read
+        self.assertEqual(self._count_packets(INST_SYNC_READ), 1)
+
+    def test_write_desired_pos(self):
+        """Test that the goal positions of all motors are written with a single sync write."""
+        targets = np.linspace(-1.0, 1.0, NUM_MOTORS)
+        num_writes = self._count_packets(INST_SYNC_WRITE)
+        self.client.write_desired_pos(self.motor_ids, targets)
+        self.assertEqual(self._count_packets(INST_SYNC_WRITE), num_writes + 1)
+        expected = (targets / DEFAULT_POS_SCALE).astype(np.int64)
+        for motor_id, value in zip(self.motor_ids, expected):
+            goal = self.port.read_table(motor_id, ADDR_GOAL_POSITION, 4)
+            self.assertEqual(int.from_bytes(goal, "little", signed=True), value)
+        # the ideal motors are at their goal, which the next read reports
+        pos, _, _ = self.client.read_pos_vel_cur()
+        np.testing.assert_allclose(pos, expected * DEFAULT_POS_SCALE, rtol=1e-6)
+
+    def test_pipelined_read(self):
+        """Test that a requested read returns the state at the time of the request and measures the round trip."""
+        self.client.request_pos_vel_cur()
+        # the state changes after the request was answered
+        self._write_present_state(self.raw_pos + 100, self.raw_vel, self.raw_cur)
+        delay = 0.01
+        time.sleep(delay)
+        pos, _, _ = self.client.read_pos_vel_cur()
+        np.testing.assert_allclose(pos, self.raw_pos * DEFAULT_POS_SCALE, rtol=1e-6)
+        self.assertEqual(self._count_packets(INST_SYNC_READ), 1)
+        # the round trip includes the time spent between the request and the collection of the response
+        self.assertGreaterEqual(self.client.round_trip_time, delay)
+        self.assertGreater(self.client.mean_round_trip_time, 0.0)
+        # without a pending request, the read is done right away and sees the new state
+        pos, _, _ = self.client.read_pos_vel_cur()
+        np.testing.assert_allclose(pos, (self.raw_pos + 100) * DEFAULT_POS_SCALE, rtol=1e-6)
+        self.assertEqual(self._count_packets(INST_SYNC_READ), 2)
+
+    def test_write_collects_pending_read(self):
+        """Test that a write first collects the response of a pending read, as the bus is half-duplex."""
+        self.client.request_pos_vel_cur()
+        self.client.write_desired_pos(self.motor_ids, np.zeros(NUM_MOTORS))
+        self.assertFalse(self.port.getBytesAvailable())
+        # the pending response was consumed, so the next read requests fresh data
+        pos, _, _ = self.client.read_pos_vel_cur()
+        np.testing.assert_allclose(pos, np.zeros(NUM_MOTORS), atol=1e-6)
+        self.assertEqual(self._count_packets(INST_SYNC_READ), 2)
+
+    def test_driver(self):
+        """Test the driver with and without pipelined reads."""
+        for pipelined in (False, True):
+            with self.subTest(pipelined=pipelined):
+                port = FakeDynamixelPortHandler(motor_ids=self.motor_ids)
+                cfg = DynamixelDriverCfg(port="fake", port_handler=port, pipelined=pipelined)
+                driver = cfg.class_type(cfg)
+                try:
+                    pos_target = torch.linspace(-0.5, 0.5, NUM_MOTORS).view(1, -1)
+                    zeros = torch.zeros_like(pos_target)
+                    num_reads = self._count_packets(INST_SYNC_READ, port)
+                    driver.write_dof_targets(pos_target, zeros, zeros)
+                    # the pipelined driver requests the next state right after writing the targets
+                    num_requests = self._count_packets(INST_SYNC_READ, port) - num_reads
+                    self.assertEqual(num_requests, int(pipelined))
+                    pos, vel, eff = driver.read_dof_states()
+                    self.assertEqual(self._count_packets(INST_SYNC_READ, port), num_reads + 1)
+                    torch.testing.assert_close(pos, pos_target, atol=DEFAULT_POS_SCALE, rtol=0.0)
+                    self.assertEqual(vel.shape, (1, NUM_MOTORS))
+                    self.assertEqual(eff.shape, (1, NUM_MOTORS))
+                finally:
+                    driver.close()
+
+    """
+    Helper functions.
+    """
+
+    def _write_present_state(self, raw_pos: np.ndarray, raw_vel: np.ndarray, raw_cur: np.ndarray):
+        for motor_id, pos, vel, cur in zip(self.motor_ids, raw_pos, raw_vel, raw_cur):
+            self.port.write_table(motor_id, ADDR_PRESENT_POSITION, int(pos).to_bytes(4, "little", signed=True))
+            self.port.write_table(motor_id, ADDR_PRESENT_VELOCITY, int(vel).to_bytes(4, "little", signed=True))
+            self.port.write_table(motor_id, ADDR_PRESENT_CURRENT, int(cur).to_bytes(2, "little", signed=True))
+
+    def _count_packets(self, instruction: int, port: FakeDynamixelPortHandler | None = None) -> int:
+        """Number of instruction packets of the given kind received by the fake port."""
+        port = self.port if port is None else port
+        return sum(packet[7] == instruction for packet in port.packets)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,90 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch the simulator
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+
+"""Rest everything follows."""
+
+import numpy as np
+import time
+import torch
+import unittest
+
+from uwlab_assets.robots.ur5.articulation_drive.ur_driver import MODBUS_TARGET_REGISTER
+from uwlab_assets.robots.ur5.articulation_drive.ur_driver_cfg import URDriverCfg
+from uwlab_assets.robots.ur5.articulation_drive.ur_stand_in import URStandInServer
+
+
+class TestURDriver(unittest.TestCase):
+    """Test cases for the UR driver against a local stand-in of the controller."""
+
+    def setUp(self):
+        self.stand_in = URStandInServer()
+        # distinct values in every streamed field, so a wrong slice of the realtime packet is noticed
+        self.stand_in.joint_pos = np.array([0.1, -0.2, 0.3, -0.4, 0.5, -0.6])
+        self.stand_in.joint_vel = np.array([1.0, 1.1, 1.2, 1.3, 1.4, 1.5])
+        self.stand_in.joint_current = np.array([-2.0, -2.1, -2.2, -2.3, -2.4, -2.5])
+        self.stand_in.start()
+        cfg = URDriverCfg(ip="127.0.0.1", port=self.stand_in.modbus_port, rt_port=self.stand_in.rt_port)
+        self.driver = cfg.class_type(cfg)
+
+    def tearDown(self):
+        self.driver.close()
+        self.stand_in.stop()
+
+    """
+    Tests.
+    """
+
+    def test_read_dof_states(self):
+        """Test that the joint positions, velocities and currents are decoded from the realtime packets."""
+        pos, vel, eff = self.driver.read_dof_states()
+        torch.testing.assert_close(pos, self._as_tensor(self.stand_in.joint_pos))
+        torch.testing.assert_close(vel, self._as_tensor(self.stand_in.joint_vel))
+        torch.testing.assert_close(eff, self._as_tensor(self.stand_in.joint_current))
+        # the state is timestamped on reception
+        self.assertLessEqual(self.driver.latest_state.timestamp, time.monotonic())
+
+    def test_write_dof_targets(self):
+        """Test that the targets are written with a single multi-register write and streamed back."""
+        pos_target = torch.tensor([[0.25, -0.5, 1.0, -1.5, 2.0, -3.14]])
+        zeros = torch.zeros_like(pos_target)
+        num_writes = self.stand_in.num_writes
+        self.driver.write_dof_targets(pos_target, zeros, zeros)
+        self._wait_for(lambda: self.stand_in.num_writes > num_writes)
+        # all six targets land in the target registers with one write
+        self.assertEqual(self.stand_in.num_writes, num_writes + 1)
+        self.assertEqual(self.stand_in.writes[-1], (MODBUS_TARGET_REGISTER, 6))
+        registers = self.stand_in.registers[MODBUS_TARGET_REGISTER : MODBUS_TARGET_REGISTER + 6].view(np.int16)
+        np.testing.assert_array_equal(registers, (pos_target[0].numpy() * 100).astype(np.int64))
+        # the stand-in tracks the targets, which the next streamed states report
+        expected = self._as_tensor(registers / 100.0)
+        self._wait_for(lambda: torch.allclose(self.driver.read_dof_states()[0], expected))
+        torch.testing.assert_close(self.driver.read_dof_states()[0], expected)
+
+    """
+    Helper functions.
+    """
+
+    @staticmethod
+    def _as_tensor(values: np.ndarray) -> torch.Tensor:
+        return torch.tensor(values, dtype=torch.float32).view(1, -1)
+
+    @staticmethod
+    def _wait_for(condition, timeout: float = 2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -5,3 +5,4 @@
 
 from .dynamixel_driver import DynamixelDriver
 from .dynamixel_driver_cfg import DynamixelDriverCfg
+from .dynamixel_fake_port import FakeDynamixelPortHandler
@@ -43,13 +43,14 @@ def dynamixel_cleanup_handler():
         open_client.disconnect()
 
 
-def signed_to_unsigned(value: int, size: int) -> int:
-    """Converts the given value to its unsigned representation."""
-    if value < 0:
-        bit_size = 8 * size
-        max_value = (1 << bit_size) - 1
-        value = max_value + value
-    return value
+def pack_sync_write_param(motor_ids: Sequence[int], values: Sequence[Union[int, float]], size: int) -> list:
+    """Packs ``[motor id, value (little-endian, two's complement)]`` of all motors into a sync write parameter."""
+    # truncate towards zero like int(), negative values wrap to their two's complement
+    data = np.asarray(values, dtype=np.float64).astype(np.int64).astype("<i8")
+    packed = np.empty((len(motor_ids), 1 + size), dtype=np.uint8)
+    packed[:, 0] = motor_ids
+    packed[:, 1:] = data.view(np.uint8).reshape(-1, 8)[:, :size]
+    return packed.ravel().tolist()
 
 
 def unsigned_to_signed(value: int, size: int) -> int:
@@ -63,6 +64,11 @@ def unsigned_to_signed(value: int, size: int) -> int:
 class DynamixelClient:
     """Client for communicating with Dynamixel motors.
     NOTE: This only supports Protocol 2.
+
+    Positions, velocities and currents of all motors are read with a single sync read and decoded with NumPy, and
+    values are written to all motors with a single sync write. A read can be requested ahead of time with
+    :meth:`request_pos_vel_cur`, e.g. right after writing the targets, and collected later by
+    :meth:`read_pos_vel_cur`, so the motors answer while the caller does other work.
     """
 
     # The currently open clients.
@@ -77,6 +83,7 @@ class DynamixelClient:
         pos_scale: Optional[float] = None,
         vel_scale: Optional[float] = None,
         cur_scale: Optional[float] = None,
+        port_handler=None,
     ):
         """Initializes a new client.
         Args:
@@ -94,6 +101,9 @@ class DynamixelClient:
                 motor-dependent. If not provided uses the default scale.
             cur_scale: The scaling factor for the currents. This is
                 motor-dependent. If not provided uses the default scale.
+            port_handler: The port handler to communicate through, e.g. a
+                :class:`FakeDynamixelPortHandler` to run without hardware.
+                If not provided, opens the serial device at ``port``.
         """
         import dynamixel_sdk
 
@@ -104,7 +114,7 @@ class DynamixelClient:
         self.baudrate = baudrate
         self.lazy_connect = lazy_connect
 
-        self.port_handler = self.dxl.PortHandler(port)
+        self.port_handler = port_handler if port_handler is not None else self.dxl.PortHandler(port)
         self.packet_handler = self.dxl.PacketHandler(PROTOCOL_VERSION)
 
         self._pos_vel_cur_reader = DynamixelPosVelCurReader(
@@ -114,28 +124,6 @@ class DynamixelClient:
             vel_scale=vel_scale if vel_scale is not None else DEFAULT_VEL_SCALE,
             cur_scale=cur_scale if cur_scale is not None else DEFAULT_CUR_SCALE,
         )
-        self._pos_reader = DynamixelPosReader(
-            self,
-            self.motor_ids,
-            pos_scale=pos_scale if pos_scale is not None else DEFAULT_POS_SCALE,
-            vel_scale=vel_scale if vel_scale is not None else DEFAULT_VEL_SCALE,
-            cur_scale=cur_scale if cur_scale is not None else DEFAULT_CUR_SCALE,
-        )
-        self._vel_reader = DynamixelVelReader(
-            self,
-            self.motor_ids,
-            pos_scale=pos_scale if pos_scale is not None else DEFAULT_POS_SCALE,
-            vel_scale=vel_scale if vel_scale is not None else DEFAULT_VEL_SCALE,
-            cur_scale=cur_scale if cur_scale is not None else DEFAULT_CUR_SCALE,
-        )
-        self._cur_reader = DynamixelCurReader(
-            self,
-            self.motor_ids,
-            pos_scale=pos_scale if pos_scale is not None else DEFAULT_POS_SCALE,
-            vel_scale=vel_scale if vel_scale is not None else DEFAULT_VEL_SCALE,
-            cur_scale=cur_scale if cur_scale is not None else DEFAULT_CUR_SCALE,
-        )
-        self._sync_writers = {}
 
         self.OPEN_CLIENTS.add(self)
 
@@ -143,6 +131,19 @@ class DynamixelClient:
     def is_connected(self) -> bool:
         return self.port_handler.is_open
 
+    @property
+    def round_trip_time(self) -> float:
+        """Seconds from sending the last read request to decoding its response.
+
+        For a pipelined read this includes the time the caller spent before collecting the response.
+        """
+        return self._pos_vel_cur_reader.last_round_trip_time
+
+    @property
+    def mean_round_trip_time(self) -> float:
+        """Exponential moving average of :attr:`round_trip_time` in seconds."""
+        return self._pos_vel_cur_reader.mean_round_trip_time
+
     def connect(self):
         """Connects to the Dynamixel motors.
         NOTE: This should be called after all DynamixelClients on the same
@@ -211,21 +212,31 @@ class DynamixelClient:
             time.sleep(retry_interval)
             retries -= 1
 
+    def request_pos_vel_cur(self):
+        """Sends a read request for the positions, velocities and currents without waiting for the response.
+
+        The response is collected by the next :meth:`read_pos_vel_cur`.
+        """
+        self._pos_vel_cur_reader.request()
+
     def read_pos_vel_cur(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Returns the current positions and velocities."""
-        return self._pos_vel_cur_reader.read()
+        """Returns the current positions, velocities and currents.
+
+        Collects the response to an earlier :meth:`request_pos_vel_cur` if there is one, otherwise reads now.
+        """
+        return self._pos_vel_cur_reader.receive()
 
     def read_pos(self) -> np.ndarray:
-        """Returns the current positions and velocities."""
-        return self._pos_reader.read()
+        """Returns the current positions."""
+        return self.read_pos_vel_cur()[0]
 
     def read_vel(self) -> np.ndarray:
-        """Returns the current positions and velocities."""
-        return self._vel_reader.read()
+        """Returns the current velocities."""
+        return self.read_pos_vel_cur()[1]
 
     def read_cur(self) -> np.ndarray:
-        """Returns the current positions and velocities."""
-        return self._cur_reader.read()
+        """Returns the current currents."""
+        return self.read_pos_vel_cur()[2]
 
     def write_desired_pos(self, motor_ids: Sequence[int], positions: np.ndarray):
         """Writes the given desired positions.
@@ -245,52 +256,36 @@ class DynamixelClient:
         value: int,
         address: int,
     ) -> Sequence[int]:
-        """Writes a value to the motors.
+        """Writes a value to the motors with a single sync write.
         Args:
             motor_ids: The motor IDs to write to.
             value: The value to write to the control table.
             address: The control table address to write to.
         Returns:
-            A list of IDs that were unsuccessful.
+            A list of IDs that were unsuccessful. Sync writes are not
+            acknowledged by the motors, so this is either empty or all IDs.
         """
-        self.check_connected()
-        errored_ids = []
-        for motor_id in motor_ids:
-            comm_result, dxl_error = self.packet_handler.write1ByteTxRx(self.port_handler, motor_id, address, value)
-            success = self.handle_packet_result(comm_result, dxl_error, motor_id, context="write_byte")
-            if not success:
-                errored_ids.append(motor_id)
-        return errored_ids
+        success = self.sync_write(motor_ids, [value] * len(motor_ids), address, 1)
+        return [] if success else list(motor_ids)
 
-    def sync_write(self, motor_ids: Sequence[int], values: Sequence[Union[int, float]], address: int, size: int):
+    def sync_write(
+        self, motor_ids: Sequence[int], values: Sequence[Union[int, float]], address: int, size: int
+    ) -> bool:
         """Writes values to a group of motors.
         Args:
             motor_ids: The motor IDs to write to.
             values: The values to write.
             address: The control table address to write to.
             size: The size of the control table value being written to.
+        Returns:
+            Whether the packet was sent.
         """
         self.check_connected()
-        key = (address, size)
-        if key not in self._sync_writers:
-            self._sync_writers[key] = self.dxl.GroupSyncWrite(self.port_handler, self.packet_handler, address, size)
-        sync_writer = self._sync_writers[key]
-
-        errored_ids = []
-        for motor_id, desired_pos in zip(motor_ids, values):
-            value = signed_to_unsigned(int(desired_pos), size=size)
-            value = value.to_bytes(size, byteorder="little")
-            success = sync_writer.addParam(motor_id, value)
-            if not success:
-                errored_ids.append(motor_id)
-
-        if errored_ids:
-            logging.error("Sync write failed for: %s", str(errored_ids))
-
-        comm_result = sync_writer.txPacket()
-        self.handle_packet_result(comm_result, context="sync_write")
-
-        sync_writer.clearParam()
+        # the bus is half-duplex, a pending read has to be collected before anything else is sent
+        self._pos_vel_cur_reader.finish()
+        param = pack_sync_write_param(motor_ids, values, size)
+        comm_result = self.packet_handler.syncWriteTxOnly(self.port_handler, address, size, param, len(param))
+        return self.handle_packet_result(comm_result, context="sync_write")
 
     def check_connected(self):
         """Ensures the robot is connected."""
@@ -321,13 +316,6 @@ class DynamixelClient:
             return False
         return True
 
-    def convert_to_unsigned(self, value: int, size: int) -> int:
-        """Converts the given value to its unsigned representation."""
-        if value < 0:
-            max_value = (1 << (8 * size)) - 1
-            value = max_value + value
-        return value
-
     def __enter__(self):
         """Enables use as a context manager."""
         if not self.is_connected:
@@ -344,59 +332,112 @@ class DynamixelClient:
 
 
 class DynamixelReader:
-    """Reads data from Dynamixel motors.
-    This wraps a GroupBulkRead from the DynamixelSDK.
+    """Reads a block of the control table from Dynamixel motors.
+    This wraps a GroupSyncRead from the DynamixelSDK.
+
+    The raw response bytes of all motors are stored in one ``(num_motors, size)``
+    buffer and decoded through NumPy views of it. The request and the response
+    can be handled separately (:meth:`request`, :meth:`receive`) to pipeline a
+    read with other work.
     """
 
+    # exponential moving average weight of the round trip time
+    RTT_SMOOTHING = 0.1
+
     def __init__(self, client: DynamixelClient, motor_ids: Sequence[int], address: int, size: int):
         """Initializes a new reader."""
         self.client = client
-        self.motor_ids = motor_ids
+        self.motor_ids = list(motor_ids)
         self.address = address
         self.size = size
+        self._raw = np.zeros((len(self.motor_ids), size), dtype=np.uint8)
         self._initialize_data()
 
-        self.operation = self.client.dxl.GroupBulkRead(client.port_handler, client.packet_handler)
+        self.operation = self.client.dxl.GroupSyncRead(client.port_handler, client.packet_handler, address, size)
 
-        for motor_id in motor_ids:
-            success = self.operation.addParam(motor_id, address, size)
+        for motor_id in self.motor_ids:
+            success = self.operation.addParam(motor_id)
             if not success:
-                raise OSError(f"[Motor ID: {motor_id}] Could not add parameter to bulk read.")
+                raise OSError(f"[Motor ID: {motor_id}] Could not add parameter to sync read.")
 
-    def read(self):
-        """Reads data from the motors."""
+        self._pending = False
+        self._request_time = 0.0
+        self.last_round_trip_time = 0.0
+        self.mean_round_trip_time = 0.0
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether a request was sent whose response has not been collected."""
+        return self._pending
+
+    def request(self) -> bool:
+        """Sends the read request without waiting for the response."""
         self.client.check_connected()
-        success = False
-        while not success:
-            comm_result = self.operation.txRxPacket()
-            success = self.client.handle_packet_result(comm_result, context="read")
-
-        # If we failed, send a copy of the previous data.
-        if not success:
-            return self._get_data()
-
-        errored_ids = []
-        for i, motor_id in enumerate(self.motor_ids):
-            # Check if the data is available.
-            available = self.operation.isAvailable(motor_id, self.address, self.size)
-            if not available:
-                errored_ids.append(motor_id)
-                continue
+        self._request_time = time.perf_counter()
+        comm_result = self.operation.txPacket()
+        self._pending = self.client.handle_packet_result(comm_result, context="read request")
+        return self._pending
 
-            self._update_data(i, motor_id)
+    def receive(self):
+        """Collects the response to the pending request and returns the data.
 
-        if errored_ids:
-            logging.error("Bulk read data is unavailable for: %s", str(errored_ids))
+        Requests (again) until a response is decoded successfully.
+        """
+        while True:
+            if not self._pending and not self.request():
+                continue
+            if self._collect():
+                return self._get_data()
+
+    def read(self):
+        """Reads data from the motors."""
+        # drop the response to an older request, the caller asks for fresh data
+        self.finish()
+        self.request()
+        return self.receive()
+
+    def finish(self):
+        """Collects the response to a pending request, if any, so that the bus is free."""
+        if self._pending:
+            self._collect()
+
+    def _collect(self) -> bool:
+        """Receives and decodes the response to the pending request."""
+        self._pending = False
+        comm_result = self.operation.rxPacket()
+        if not self.client.handle_packet_result(comm_result, context="read"):
+            return False
+        rtt = time.perf_counter() - self._request_time
+        self.last_round_trip_time = rtt
+        if self.mean_round_trip_time == 0.0:
+            self.mean_round_trip_time = rtt
+        else:
+            self.mean_round_trip_time += self.RTT_SMOOTHING * (rtt - self.mean_round_trip_time)
 
-        return self._get_data()
+        rows = [self.operation.data_dict[motor_id] for motor_id in self.motor_ids]
+        if all(len(row) == self.size for row in rows):
+            self._raw[:] = rows
+        else:
+            # keep the previous data of motors that did not answer
+            errored_ids = []
+            for i, (motor_id, row) in enumerate(zip(self.motor_ids, rows)):
+                if len(row) == self.size:
+                    self._raw[i] = row
+                else:
+                    errored_ids.append(motor_id)
+            logging.error("Sync read data is unavailable for: %s", str(errored_ids))
+        self._update_data()
+        return True
 
     def _initialize_data(self):
         """Initializes the cached data."""
+        # little-endian signed view of the raw block, for 1, 2 and 4 byte values
+        self._values = self._raw.view(np.dtype(f"<i{self.size}"))[:, 0]
         self._data = np.zeros(len(self.motor_ids), dtype=np.float32)
 
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        self._data[index] = self.operation.getData(motor_id, self.address, self.size)
+    def _update_data(self):
+        """Decodes the raw response of all motors."""
+        self._data[:] = self._values
 
     def _get_data(self):
         """Returns a copy of the data."""
@@ -404,7 +445,10 @@ class DynamixelReader:
 
 
 class DynamixelPosVelCurReader(DynamixelReader):
-    """Reads positions and velocities."""
+    """Reads positions, velocities and currents."""
+
+    # layout of the present current, velocity and position registers, starting at ADDR_PRESENT_POS_VEL_CUR
+    POS_VEL_CUR_DTYPE = np.dtype([("cur", "<i2"), ("vel", "<i4"), ("pos", "<i4")])
 
     def __init__(
         self,
@@ -426,131 +470,22 @@ class DynamixelPosVelCurReader(DynamixelReader):
 
     def _initialize_data(self):
         """Initializes the cached data."""
+        self._fields = self._raw.view(self.POS_VEL_CUR_DTYPE)[:, 0]
         self._pos_data = np.zeros(len(self.motor_ids), dtype=np.float32)
         self._vel_data = np.zeros(len(self.motor_ids), dtype=np.float32)
         self._cur_data = np.zeros(len(self.motor_ids), dtype=np.float32)
 
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        cur = self.operation.getData(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT)
-        vel = self.operation.getData(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY)
-        pos = self.operation.getData(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION)
-        cur = unsigned_to_signed(cur, size=2)
-        vel = unsigned_to_signed(vel, size=4)
-        pos = unsigned_to_signed(pos, size=4)
-        self._pos_data[index] = float(pos) * self.pos_scale
-        self._vel_data[index] = float(vel) * self.vel_scale
-        self._cur_data[index] = float(cur) * self.cur_scale
+    def _update_data(self):
+        """Decodes the raw response of all motors."""
+        np.multiply(self._fields["pos"], self.pos_scale, out=self._pos_data, casting="unsafe")
+        np.multiply(self._fields["vel"], self.vel_scale, out=self._vel_data, casting="unsafe")
+        np.multiply(self._fields["cur"], self.cur_scale, out=self._cur_data, casting="unsafe")
 
     def _get_data(self):
         """Returns a copy of the data."""
         return (self._pos_data.copy(), self._vel_data.copy(), self._cur_data.copy())
 
 
-class DynamixelPosReader(DynamixelReader):
-    """Reads positions and velocities."""
-
-    def __init__(
-        self,
-        client: DynamixelClient,
-        motor_ids: Sequence[int],
-        pos_scale: float = 1.0,
-        vel_scale: float = 1.0,
-        cur_scale: float = 1.0,
-    ):
-        super().__init__(
-            client,
-            motor_ids,
-            address=ADDR_PRESENT_POS_VEL_CUR,
-            size=LEN_PRESENT_POS_VEL_CUR,
-        )
-        self.pos_scale = pos_scale
-
-    def _initialize_data(self):
-        """Initializes the cached data."""
-        self._pos_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        pos = self.operation.getData(motor_id, ADDR_PRESENT_POSITION, LEN_PRESENT_POSITION)
-        pos = unsigned_to_signed(pos, size=4)
-        self._pos_data[index] = float(pos) * self.pos_scale
-
-    def _get_data(self):
-        """Returns a copy of the data."""
-        return self._pos_data.copy()
-
-
-class DynamixelVelReader(DynamixelReader):
-    """Reads positions and velocities."""
-
-    def __init__(
-        self,
-        client: DynamixelClient,
-        motor_ids: Sequence[int],
-        pos_scale: float = 1.0,
-        vel_scale: float = 1.0,
-        cur_scale: float = 1.0,
-    ):
-        super().__init__(
-            client,
-            motor_ids,
-            address=ADDR_PRESENT_POS_VEL_CUR,
-            size=LEN_PRESENT_POS_VEL_CUR,
-        )
-        self.pos_scale = pos_scale
-        self.vel_scale = vel_scale
-        self.cur_scale = cur_scale
-
-    def _initialize_data(self):
-        """Initializes the cached data."""
-        self._vel_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        vel = self.operation.getData(motor_id, ADDR_PRESENT_VELOCITY, LEN_PRESENT_VELOCITY)
-        vel = unsigned_to_signed(vel, size=4)
-        self._vel_data[index] = float(vel) * self.vel_scale
-
-    def _get_data(self):
-        """Returns a copy of the data."""
-        return self._vel_data.copy()
-
-
-class DynamixelCurReader(DynamixelReader):
-    """Reads positions and velocities."""
-
-    def __init__(
-        self,
-        client: DynamixelClient,
-        motor_ids: Sequence[int],
-        pos_scale: float = 1.0,
-        vel_scale: float = 1.0,
-        cur_scale: float = 1.0,
-    ):
-        super().__init__(
-            client,
-            motor_ids,
-            address=ADDR_PRESENT_POS_VEL_CUR,
-            size=LEN_PRESENT_POS_VEL_CUR,
-        )
-        self.cur_scale = cur_scale
-
-    def _initialize_data(self):
-        """Initializes the cached data."""
-        self._cur_data = np.zeros(len(self.motor_ids), dtype=np.float32)
-
-    def _update_data(self, index: int, motor_id: int):
-        """Updates the data index for the given motor ID."""
-        cur = self.operation.getData(motor_id, ADDR_PRESENT_CURRENT, LEN_PRESENT_CURRENT)
-        cur = unsigned_to_signed(cur, size=2)
-        self._cur_data[index] = float(cur) * self.cur_scale
-
-    def _get_data(self):
-        """Returns a copy of the data."""
-        return self._cur_data.copy()
-
-
 # Register global cleanup function.
 atexit.register(dynamixel_cleanup_handler)
 
@@ -578,6 +513,7 @@ if __name__ == "__main__":
             pos_now, vel_now, cur_now = dxl_client.read_pos_vel_cur()
             if step % 5 == 0:
                 print(f"[{step}] Frequency: {1.0 / (time.time() - read_start):.2f} Hz")
+                print(f"> Round trip: {dxl_client.mean_round_trip_time * 1e3:.2f} ms")
                 print(f"> Pos: {pos_now.tolist()}")
                 print(f"> Vel: {vel_now.tolist()}")
                 print(f"> Cur: {cur_now.tolist()}")
@@ -38,15 +38,25 @@ class DynamixelDriver(ArticulationDrive):
     def close(self):
         self.dxl_client.disconnect()
 
+    @property
+    def round_trip_time(self) -> float:
+        """Mean time in seconds from sending a state read request to decoding its response."""
+        return self.dxl_client.mean_round_trip_time
+
     def read_dof_states(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-        pos = torch.tensor((self.dxl_client.read_pos() - self.offset), device=self.device).view(1, -1)
-        vel = torch.tensor(self.dxl_client.read_vel(), device=self.device).view(1, -1)
+        # positions and velocities of all motors come from a single sync read
+        pos, vel, _ = self.dxl_client.read_pos_vel_cur()
+        pos = torch.from_numpy(pos - self.offset).view(1, -1)
+        vel = torch.from_numpy(vel).view(1, -1)
         eff = torch.zeros_like(pos, device=self.device)
         return pos, vel, eff
 
     def write_dof_targets(self, pos_target: torch.Tensor, vel_target: torch.Tensor, eff_target: torch.Tensor):
         pos_target = pos_target[0] + self.offset
         self.dxl_client.write_desired_pos(self.joint_idx.tolist(), pos_target.numpy())
+        if self.cfg.pipelined:
+            # the motors answer while the caller runs the rest of its cycle, collected by the next read_dof_states
+            self.dxl_client.request_pos_vel_cur()
 
     def set_dof_stiffnesses(self, stiffnesses):
         self.dxl_client.sync_write(self.joint_idx.tolist(), stiffnesses[0].tolist(), 84, 2)  # Pgain stiffness
@@ -70,6 +80,7 @@ class DynamixelDriver(ArticulationDrive):
             port=self.cfg.port,
             motor_ids=[i for i in range(16)],
             baudrate=4000000,
+            port_handler=self.cfg.port_handler,
         )
         self.dxl_client.connect()
         self.dxl_client.sync_write(self.joint_idx.tolist(), self.joint_integral.tolist(), 82, 2)  # Igain
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from dataclasses import MISSING
-from typing import Callable
+from typing import Any, Callable
 
 from isaaclab.utils import configclass
 from uwlab.assets.articulation.articulation_drive import ArticulationDriveCfg
@@ -20,6 +20,15 @@ class DynamixelDriverCfg(ArticulationDriveCfg):
 
     port: str = MISSING  # type: ignore
 
+    port_handler: Any = None
+    """Port handler to talk to the motors through instead of opening :attr:`port`, e.g. a
+    :class:`FakeDynamixelPortHandler` to run the driver without hardware. Defaults to None."""
+
+    pipelined: bool = False
+    """Request the next state read right after writing the targets, so the motors answer while the rest of the
+    control cycle runs. The states returned by :meth:`DynamixelDriver.read_dof_states` are then sampled right after
+    the previous write instead of at the time of the call. Defaults to False."""
+
     hand_kI: float = 0.0  # type: ignore
 
     hand_curr_lim: float = 350  # type: ignore
@@ -0,0 +1,240 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""A stand-in for the serial port of a Dynamixel bus, answering Protocol 2 packets from simulated motors.
+
+Pass it to :class:`DynamixelClient` to exercise the full packet path of the DynamixelSDK without hardware:
+
+.. code-block:: python
+
+    port = FakeDynamixelPortHandler(motor_ids=range(16))
+    client = DynamixelClient(motor_ids=range(16), port_handler=port)
+    client.connect()
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+
+from .dynamixel_client import ADDR_GOAL_POSITION, ADDR_PRESENT_POSITION, LEN_GOAL_POSITION
+
+HEADER = [0xFF, 0xFF, 0xFD, 0x00]
+BROADCAST_ID = 0xFE
+
+INST_PING = 0x01
+INST_READ = 0x02
+INST_WRITE = 0x03
+INST_STATUS = 0x55
+INST_SYNC_READ = 0x82
+INST_SYNC_WRITE = 0x83
+INST_BULK_READ = 0x92
+INST_BULK_WRITE = 0x93
+
+CONTROL_TABLE_SIZE = 1024
+MODEL_NUMBER = 1020  # XM430-W350
+
+
+def crc16(data: Iterable[int]) -> int:
+    """CRC-16 (polynomial 0x8005) of a Protocol 2 packet."""
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return crc
+
+
+def add_stuffing(body: list[int]) -> list[int]:
+    """Inserts 0xFD after every 0xFF 0xFF 0xFD in the instruction and parameters, so it cannot look like a header."""
+    stuffed = []
+    for byte in body:
+        stuffed.append(byte)
+        if stuffed[-3:] == [0xFF, 0xFF, 0xFD]:
+            stuffed.append(0xFD)
+    return stuffed
+
+
+def remove_stuffing(body: list[int]) -> list[int]:
+    """Reverts :func:`add_stuffing`."""
+    plain = []
+    i = 0
+    while i < len(body):
+        plain.append(body[i])
+        if plain[-3:] == [0xFF, 0xFF, 0xFD] and i + 1 < len(body) and body[i + 1] == 0xFD:
+            i += 1
+        i += 1
+    return plain
+
+
+class FakeDynamixelPortHandler:
+    """Port handler of the DynamixelSDK backed by simulated motors instead of a serial device.
+
+    Every motor owns a control table. Instruction packets written to the port are applied to the tables immediately
+    and the status packets the motors would send back are queued for :meth:`readPort`. The motors are ideal: the
+    present position follows the goal position as soon as it is written. Tests can read and modify the tables
+    directly through :meth:`read_table` and :meth:`write_table`.
+
+    Supported instructions are ping, read, write, sync read, sync write, bulk read and bulk write.
+    """
+
+    def __init__(self, motor_ids: Iterable[int], port_name: str = "fake", response_delay: float = 0.0):
+        """Initializes the simulated bus.
+
+        Args:
+            motor_ids: IDs of the simulated motors.
+            port_name: Name reported for the port.
+            response_delay: Time in seconds the motors take to answer a packet, spent in :meth:`writePort`.
+        """
+        self.port_name = port_name
+        self.response_delay = response_delay
+        self.tables = {motor_id: bytearray(CONTROL_TABLE_SIZE) for motor_id in motor_ids}
+        for table in self.tables.values():
+            table[0:2] = MODEL_NUMBER.to_bytes(2, "little")
+        self.is_open = False
+        self.is_using = False
+        self.baudrate = 1000000
+        self.packets: list[list[int]] = []
+        """Instruction packets received so far, after removing the byte stuffing."""
+        self._rx_buffer: list[int] = []
+
+    """
+    Control tables.
+    """
+
+    def read_table(self, motor_id: int, address: int, size: int) -> bytes:
+        return bytes(self.tables[motor_id][address : address + size])
+
+    def write_table(self, motor_id: int, address: int, data: bytes | Iterable[int]):
+        data = bytes(data)
+        self.tables[motor_id][address : address + len(data)] = data
+        # ideal motor, it is at the goal position as soon as it receives it
+        if address <= ADDR_GOAL_POSITION < address + len(data):
+            goal = self.read_table(motor_id, ADDR_GOAL_POSITION, LEN_GOAL_POSITION)
+            self.tables[motor_id][ADDR_PRESENT_POSITION : ADDR_PRESENT_POSITION + LEN_GOAL_POSITION] = goal
+
+    """
+    PortHandler interface.
+    """
+
+    def openPort(self) -> bool:
+        self.is_open = True
+        return True
+
+    def closePort(self):
+        self.is_open = False
+
+    def clearPort(self):
+        pass
+
+    def setPortName(self, port_name: str):
+        self.port_name = port_name
+
+    def getPortName(self) -> str:
+        return self.port_name
+
+    def setBaudRate(self, baudrate: int) -> bool:
+        self.baudrate = baudrate
+        return True
+
+    def getBaudRate(self) -> int:
+        return self.baudrate
+
+    def getBytesAvailable(self) -> int:
+        return len(self._rx_buffer)
+
+    def readPort(self, length: int) -> list[int]:
+        data = self._rx_buffer[:length]
+        del self._rx_buffer[:length]
+        return data
+
+    def writePort(self, packet: list[int]) -> int:
+        packet = list(packet)
+        if self.response_delay > 0.0:
+            time.sleep(self.response_delay)
+        self._handle_packet(packet)
+        return len(packet)
+
+    def setPacketTimeout(self, packet_length: int):
+        pass
+
+    def setPacketTimeoutMillis(self, msec: float):
+        pass
+
+    def isPacketTimeout(self) -> bool:
+        # responses are queued as soon as a packet is written, missing bytes are never going to arrive
+        return True
+
+    def getCurrentTime(self) -> float:
+        return time.time() * 1000.0
+
+    def getTimeSinceStart(self) -> float:
+        return 0.0
+
+    """
+    Simulated motors.
+    """
+
+    def _handle_packet(self, packet: list[int]):
+        if packet[:4] != HEADER or len(packet) < 10:
+            return
+        length = packet[5] | (packet[6] << 8)
+        if len(packet) != 7 + length or crc16(packet[:-2]) != (packet[-2] | (packet[-1] << 8)):
+            return
+        motor_id = packet[4]
+        body = remove_stuffing(packet[7:-2])
+        instruction, params = body[0], body[1:]
+        self.packets.append(packet[:7] + body + packet[-2:])
+
+        if instruction == INST_PING:
+            ids = list(self.tables) if motor_id == BROADCAST_ID else [motor_id]
+            for i in ids:
+                self._respond(i, [*MODEL_NUMBER.to_bytes(2, "little"), 0x2E])
+        elif instruction == INST_READ:
+            address, size = self._word(params, 0), self._word(params, 2)
+            self._respond(motor_id, self.read_table(motor_id, address, size))
+        elif instruction == INST_WRITE:
+            self._write(motor_id, self._word(params, 0), params[2:])
+            if motor_id != BROADCAST_ID:
+                self._respond(motor_id, [])
+        elif instruction == INST_SYNC_READ:
+            address, size = self._word(params, 0), self._word(params, 2)
+            for i in params[4:]:
+                self._respond(i, self.read_table(i, address, size))
+        elif instruction == INST_SYNC_WRITE:
+            address, size = self._word(params, 0), self._word(params, 2)
+            for offset in range(4, len(params), size + 1):
+                self._write(params[offset], address, params[offset + 1 : offset + 1 + size])
+        elif instruction == INST_BULK_READ:
+            for offset in range(0, len(params), 5):
+                i, address, size = params[offset], self._word(params, offset + 1), self._word(params, offset + 3)
+                self._respond(i, self.read_table(i, address, size))
+        elif instruction == INST_BULK_WRITE:
+            offset = 0
+            while offset < len(params):
+                i, address, size = params[offset], self._word(params, offset + 1), self._word(params, offset + 3)
+                self._write(i, address, params[offset + 5 : offset + 5 + size])
+                offset += 5 + size
+
+    def _write(self, motor_id: int, address: int, data: list[int]):
+        ids = list(self.tables) if motor_id == BROADCAST_ID else [motor_id]
+        for i in ids:
+            if i in self.tables:
+                self.write_table(i, address, data)
+
+    def _respond(self, motor_id: int, data: bytes | list[int], error: int = 0):
+        """Queues the status packet of ``motor_id``, motors that do not exist stay silent."""
+        if motor_id not in self.tables:
+            return
+        body = add_stuffing([INST_STATUS, error, *data])
+        length = len(body) + 2
+        packet = HEADER + [motor_id, length & 0xFF, length >> 8] + body
+        crc = crc16(packet)
+        self._rx_buffer.extend(packet + [crc & 0xFF, crc >> 8])
+
+    @staticmethod
+    def _word(params: list[int], offset: int) -> int:
+        return params[offset] | (params[offset + 1] << 8)
@@ -6,22 +6,45 @@
 from __future__ import annotations
 
 import numpy as np
+import socket
+import struct
+import time
 import torch
 from typing import TYPE_CHECKING
 
 import pymodbus.client as ModbusClient
-import urx
-from pymodbus.constants import Endian
 from pymodbus.framer import Framer
-from pymodbus.payload import BinaryPayloadBuilder
 
-from uwlab.assets.articulation.articulation_drive import ArticulationDrive
+from uwlab.assets.articulation.articulation_drive import (
+    ArticulationDrive,
+    JointStateSample,
+    LatestCommandWriter,
+    StateStreamReader,
+)
 
 if TYPE_CHECKING:
     from .ur_driver_cfg import URDriverCfg
 
+# first holding register of the six joint targets read by the URScript on the robot
+MODBUS_TARGET_REGISTER = 128
+
+# realtime client interface: a big-endian int32 message size followed by big-endian doubles, of which the driver
+# uses time (1), q target, qd target, qdd target, I target, M target, q actual, qd actual and I actual (6 each)
+RT_NUM_DOUBLES = 49
+RT_Q_ACTUAL = slice(31, 37)
+RT_QD_ACTUAL = slice(37, 43)
+RT_I_ACTUAL = slice(43, 49)
+
 
 class URDriver(ArticulationDrive):
+    """Driver for UR arms that never blocks the control loop.
+
+    Joint states are streamed from the realtime client interface of the controller by a background
+    :class:`StateStreamReader`, :meth:`read_dof_states` returns the latest sample. Joint currents are reported as
+    efforts. Position targets are written to six Modbus holding registers, read by the URScript running on the
+    robot, with one multi-register write sent by a background :class:`LatestCommandWriter`.
+    """
+
     def __init__(self, cfg: URDriverCfg, data_indices: slice = slice(None)):
         self.device = torch.device("cpu")
         self.cfg = cfg
@@ -31,6 +54,8 @@ class URDriver(ArticulationDrive):
         self.current_pos = torch.zeros(1, 6, device=self.device)
         self.current_vel = torch.zeros(1, 6, device=self.device)
         self.current_eff = torch.zeros(1, 6, device=self.device)
+        self._rt_socket: socket.socket | None = None
+        self._prepare()
 
     @property
     def ordered_joint_names(self):
@@ -43,36 +68,84 @@ class URDriver(ArticulationDrive):
             "wrist_3_joint",
         ]
 
+    @property
+    def latest_state(self) -> JointStateSample:
+        """The most recent timestamped joint state received from the robot."""
+        return self._state_stream.latest()  # type: ignore
+
     def _prepare(self):
-        # Initialize urx connection
-        self.arm = urx.Robot(self.cfg.ip, use_rt=True)
+        # Initialize the realtime state stream
+        self._connect_realtime()
+        self._state_stream = StateStreamReader(self._receive_state, self._connect_realtime, name="ur_state_stream")
+        self._state_stream.start()
 
         # Initialize Modbus Client
         self.modbus_client = ModbusClient.ModbusTcpClient(self.cfg.ip, port=self.cfg.port, framer=Framer.SOCKET)
         self.modbus_client.connect()
+        self._command_writer = LatestCommandWriter(self.sendModbusValues, name="ur_modbus_writer")
+        self._command_writer.start()
+
+        self._state_stream.wait_for_sample(timeout=self.cfg.connect_timeout)
+        self.read_dof_states()
+
+    def _connect_realtime(self):
+        if self._rt_socket is not None:
+            self._rt_socket.close()
+        self._rt_socket = socket.create_connection((self.cfg.ip, self.cfg.rt_port), timeout=self.cfg.connect_timeout)
+        self._rt_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _receive_exactly(self, size: int) -> bytes:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            n = self._rt_socket.recv_into(view[received:])  # type: ignore
+            if n == 0:
+                raise ConnectionError("Realtime stream closed by the robot.")
+            received += n
+        return bytes(buffer)
+
+    def _receive_state(self) -> JointStateSample:
+        """Blocking receive of the next realtime packet, called by the state stream thread."""
+        (size,) = struct.unpack(">i", self._receive_exactly(4))
+        payload = self._receive_exactly(size - 4)
+        timestamp = time.monotonic()
+        if len(payload) < RT_NUM_DOUBLES * 8:
+            raise ValueError(f"Realtime packet of {size} bytes is too short.")
+        values = np.frombuffer(payload, dtype=">f8", count=RT_NUM_DOUBLES).astype(np.float32)
+        return JointStateSample(
+            timestamp=timestamp,
+            pos=torch.from_numpy(values[RT_Q_ACTUAL].copy()).view(1, -1),
+            vel=torch.from_numpy(values[RT_QD_ACTUAL].copy()).view(1, -1),
+            eff=torch.from_numpy(values[RT_I_ACTUAL].copy()).view(1, -1),
+        )
 
     def sendModbusValues(self, values):
         # Values will be divided by 100 in URScript
         values = np.array(values) * 100
-        builder = BinaryPayloadBuilder(byteorder=Endian.BIG, wordorder=Endian.BIG)
-        # Loop through each pose value and write it to a register
-        for i in range(6):
-            builder.reset()
-            builder.add_16bit_int(int(values[i]))
-            payload = builder.to_registers()
-            self.modbus_client.write_register(128 + i, payload[0])
+        # all six targets go out in one write, as 16 bit two's complement registers
+        registers = [int(value) & 0xFFFF for value in values[:6]]
+        self.modbus_client.write_registers(MODBUS_TARGET_REGISTER, registers)
 
     def write_dof_targets(self, pos_target: torch.Tensor, vel_target: torch.Tensor, eff_target: torch.Tensor):
-        # Non-blocking motion
-
-        self.sendModbusValues(pos_target[0].tolist())
+        # Non-blocking motion, a target still waiting to be sent is replaced by this one
+        self._command_writer.submit(pos_target[0].tolist())
 
     def read_dof_states(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-        """Blocking call to get_joint_states, storing the data in local torch Tensors."""
-        joint_pos = np.array(self.arm.getj())
-        pos = torch.tensor(joint_pos, device=self.device)
-        self.current_pos[:] = pos
-        return pos, self.current_vel, self.current_eff
+        """Non-blocking, returns the latest streamed joint states."""
+        sample = self._state_stream.latest()
+        if sample is not None:
+            self.current_pos[:] = sample.pos
+            self.current_vel[:] = sample.vel
+            self.current_eff[:] = sample.eff
+        return self.current_pos.clone(), self.current_vel.clone(), self.current_eff.clone()
+
+    def close(self):
+        self._command_writer.stop()
+        self._state_stream.stop(timeout=0.0)
+        if self._rt_socket is not None:
+            self._rt_socket.close()
+        self.modbus_client.close()
 
     def set_dof_stiffnesses(self, stiffnesses):
         pass
@@ -96,8 +169,9 @@ class URDriver(ArticulationDrive):
 #     class Cfg:
 #         ip = "192.168.1.2"
 #         port = 602
+#         rt_port = 30003
+#         connect_timeout = 5.0
 #     driver = URDriver(cfg=Cfg())
-#     driver._prepare()
 #     pos, vel, eff = driver.read_dof_states()
 #     print(pos, vel, eff)
 #     driver.write_dof_targets(pos, vel, eff)
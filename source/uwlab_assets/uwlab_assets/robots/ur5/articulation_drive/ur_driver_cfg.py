@@ -21,3 +21,10 @@ class URDriverCfg(ArticulationDriveCfg):
     ip: str = MISSING  # type: ignore
 
     port: int = MISSING  # type: ignore
+    """Port of the Modbus TCP server the joint targets are written to."""
+
+    rt_port: int = 30003
+    """Port of the realtime client interface the joint states are streamed from."""
+
+    connect_timeout: float = 5.0
+    """Seconds to wait for the connections and the first joint state."""
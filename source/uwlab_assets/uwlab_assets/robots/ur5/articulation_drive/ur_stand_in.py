@@ -0,0 +1,169 @@
+# Copyright (c) 2024-2025, The UW Lab Project Developers.
+# All Rights Reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""A local stand-in for a UR controller, to run :class:`URDriver` without a robot.
+
+.. code-block:: python
+
+    stand_in = URStandInServer()
+    stand_in.start()
+    driver = URDriver(URDriverCfg(ip="127.0.0.1", port=stand_in.modbus_port, rt_port=stand_in.rt_port))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import numpy as np
+import socketserver
+import struct
+import threading
+import time
+
+from .ur_driver import MODBUS_TARGET_REGISTER, RT_I_ACTUAL, RT_NUM_DOUBLES, RT_Q_ACTUAL, RT_QD_ACTUAL
+
+NUM_REGISTERS = 256
+
+
+class URStandInServer:
+    """Serves the realtime client interface and a Modbus TCP server like a UR controller running the deployment
+    URScript.
+
+    The simulated arm tracks the joint targets written to the target registers ideally: the streamed joint
+    positions jump to the target (register value / 100). The streamed velocities and currents are the ones set in
+    :attr:`joint_vel` and :attr:`joint_current`, zero by default. Modbus function codes 3 (read holding registers),
+    6 (write single register) and 16 (write multiple registers) are supported.
+
+    Args:
+        host: Address to listen on.
+        rt_port: Port of the realtime stream. Defaults to 0 (any free port, see :attr:`rt_port`).
+        modbus_port: Port of the Modbus server. Defaults to 0 (any free port, see :attr:`modbus_port`).
+        rate: Realtime packets sent per second to each client.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", rt_port: int = 0, modbus_port: int = 0, rate: float = 500.0):
+        self.rate = rate
+        self.registers = np.zeros(NUM_REGISTERS, dtype=np.uint16)
+        self.joint_pos = np.zeros(6)
+        self.joint_vel = np.zeros(6)
+        """Joint velocities streamed in the realtime packets."""
+        self.joint_current = np.zeros(6)
+        """Joint currents streamed in the realtime packets."""
+        self.num_writes = 0
+        """Number of Modbus write requests received."""
+        self.writes: list[tuple[int, int]] = []
+        """Start register and number of registers of every Modbus write request received."""
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        self._rt_server = self._make_server(host, rt_port, self._stream)
+        self._modbus_server = self._make_server(host, modbus_port, self._serve_modbus)
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def rt_port(self) -> int:
+        return self._rt_server.server_address[1]
+
+    @property
+    def modbus_port(self) -> int:
+        return self._modbus_server.server_address[1]
+
+    def start(self):
+        for server in (self._rt_server, self._modbus_server):
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        for server in (self._rt_server, self._modbus_server):
+            server.shutdown()
+            server.server_close()
+
+    @staticmethod
+    def _make_server(host: str, port: int, handle) -> socketserver.ThreadingTCPServer:
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                with contextlib.suppress(ConnectionError, OSError):
+                    handle(self.request)
+
+        server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        server.daemon_threads = True
+        server.allow_reuse_address = True
+        server.server_bind()
+        server.server_activate()
+        return server
+
+    """
+    Realtime stream.
+    """
+
+    def realtime_packet(self) -> bytes:
+        values = np.zeros(RT_NUM_DOUBLES)
+        with self._lock:
+            values[0] = time.monotonic() - self._start_time
+            values[RT_Q_ACTUAL] = self.joint_pos
+            values[RT_QD_ACTUAL] = self.joint_vel
+            values[RT_I_ACTUAL] = self.joint_current
+        payload = values.astype(">f8").tobytes()
+        return struct.pack(">i", 4 + len(payload)) + payload
+
+    def _stream(self, connection):
+        period = 1.0 / self.rate
+        deadline = time.monotonic()
+        while True:
+            connection.sendall(self.realtime_packet())
+            deadline += period
+            time.sleep(max(deadline - time.monotonic(), 0.0))
+
+    """
+    Modbus TCP.
+    """
+
+    def _serve_modbus(self, connection):
+        while True:
+            header = self._receive_exactly(connection, 7)
+            if header is None:
+                return
+            transaction, protocol, length, unit = struct.unpack(">HHHB", header)
+            pdu = self._receive_exactly(connection, length - 1)
+            if pdu is None:
+                return
+            response = self._handle_pdu(pdu)
+            connection.sendall(struct.pack(">HHHB", transaction, protocol, len(response) + 1, unit) + response)
+
+    def _handle_pdu(self, pdu: bytes) -> bytes:
+        function = pdu[0]
+        if function == 3:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            with self._lock:
+                values = self.registers[address : address + count].astype(">u2").tobytes()
+            return bytes([function, len(values)]) + values
+        if function == 6:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            self._write_registers(address, [value])
+            return pdu[:5]
+        if function == 16:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            values = struct.unpack(f">{count}H", pdu[6 : 6 + 2 * count])
+            self._write_registers(address, values)
+            return pdu[:5]
+        # illegal function
+        return bytes([function | 0x80, 0x01])
+
+    def _write_registers(self, address: int, values):
+        with self._lock:
+            self.registers[address : address + len(values)] = values
+            self.num_writes += 1
+            self.writes.append((address, len(values)))
+            # the URScript reads the targets as signed values scaled by 100
+            self.joint_pos = self.registers[MODBUS_TARGET_REGISTER : MODBUS_TARGET_REGISTER + 6].view(np.int16) / 100.0
+
+    @staticmethod
+    def _receive_exactly(connection, size: int) -> bytes | None:
+        data = b""
+        while len(data) < size:
+            chunk = connection.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
@@ -5,17 +5,33 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import torch
 from typing import TYPE_CHECKING
 
-from uwlab.assets.articulation.articulation_drive import ArticulationDrive
+from uwlab.assets.articulation.articulation_drive import (
+    ArticulationDrive,
+    JointStateSample,
+    LatestCommandWriter,
+    StateStreamReader,
+)
 
 if TYPE_CHECKING:
     from .xarm_driver_cfg import XarmDriverCfg
 
 
 class XarmDriver(ArticulationDrive):
+    """Driver for xArm arms that never blocks the control loop.
+
+    The SDK only offers blocking calls, so joint states are polled by a background :class:`StateStreamReader` and
+    :meth:`read_dof_states` returns the latest sample. The workspace check (forward kinematics) and the servo command
+    run in a background :class:`LatestCommandWriter`, which always sends the most recent target.
+
+    Both threads reconnect when the SDK returns an error code. The reconnection is guarded by a lock and only done
+    by the first thread that sees the failing connection, the other one then uses the new connection.
+    """
+
     def __init__(self, cfg: XarmDriverCfg, data_indices: slice = slice(None)):
         self.device = torch.device("cpu")
         self.cfg = cfg
@@ -30,46 +46,84 @@ class XarmDriver(ArticulationDrive):
         self.current_pos = torch.zeros(1, 5, device=self.device)
         self.current_vel = torch.zeros(1, 5, device=self.device)
         self.current_eff = torch.zeros(1, 5, device=self.device)
+        self._connection_lock = threading.Lock()
+        self._next_poll_time = 0.0
         self._prepare()
+        # note: the state stream does not reconnect by itself, failed polls are handled by _receive_state
+        self._state_stream = StateStreamReader(self._receive_state, name="xarm_state_stream")
+        self._state_stream.start()
+        self._command_writer = LatestCommandWriter(self._send_command, name="xarm_command_writer")
+        self._command_writer.start()
+        self._state_stream.wait_for_sample(timeout=cfg.connect_timeout)
+        self.read_dof_states()
 
     @property
     def ordered_joint_names(self):
         return ["joint" + str(i) for i in range(1, 6)]
 
+    @property
+    def latest_state(self) -> JointStateSample:
+        """The most recent timestamped joint state received from the robot."""
+        return self._state_stream.latest()  # type: ignore
+
     def close(self):
-        self._arm.disconnect()
+        self._command_writer.stop()
+        self._state_stream.stop()
+        with self._connection_lock:
+            self._arm.disconnect()
 
     def read_dof_states(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-        """Blocking call to get_joint_states, storing the data in local torch Tensors."""
-        code = 1
-        while code != 0:
-            code, (pos, vel, eff) = self._arm.get_joint_states(is_radian=True)
-            if code != 0:
-                self._log(f"Warning: get_joint_states returned code={code}", is_error=True)
-                self._prepare()
-        pos = torch.tensor(pos[:5], device=self.device).view(1, -1)
-        vel = torch.tensor(vel[:5], device=self.device).view(1, -1)
-        eff = torch.tensor(eff[:5], device=self.device).view(1, -1)
-        self.current_pos[:] = pos
-        self.current_vel[:] = vel
-        self.current_eff[:] = eff
-        return pos, vel, eff
+        """Non-blocking, returns the latest joint states polled by the state stream."""
+        sample = self._state_stream.latest()
+        if sample is not None:
+            self.current_pos[:] = sample.pos
+            self.current_vel[:] = sample.vel
+            self.current_eff[:] = sample.eff
+        return self.current_pos.clone(), self.current_vel.clone(), self.current_eff.clone()
+
+    def _receive_state(self) -> JointStateSample | None:
+        """Blocking call to get_joint_states, called by the state stream thread at most once per poll period."""
+        delay = self._next_poll_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_poll_time = time.monotonic() + self.cfg.state_poll_period
+        arm = self._arm
+        try:
+            code, (pos, vel, eff) = arm.get_joint_states(is_radian=True)
+        except Exception:
+            self._reconnect(arm)
+            raise
+        timestamp = time.monotonic()
+        if code != 0:
+            self._log(f"Warning: get_joint_states returned code={code}", is_error=True)
+            self._reconnect(arm)
+            return None
+        return JointStateSample(
+            timestamp=timestamp,
+            pos=torch.tensor(pos[:5], device=self.device).view(1, -1),
+            vel=torch.tensor(vel[:5], device=self.device).view(1, -1),
+            eff=torch.tensor(eff[:5], device=self.device).view(1, -1),
+        )
 
     def _get_forward_kinematics(self, pos: torch.Tensor):
         code = 1
         while code != 0:
-            code, pose = self._arm.get_forward_kinematics(pos[0].tolist(), input_is_radian=self.is_radian)
+            arm = self._arm
+            code, pose = arm.get_forward_kinematics(pos[0].tolist(), input_is_radian=self.is_radian)
             if code != 0:
                 self._log(f"Warning: get_forward_kinematics returned code={code}", is_error=True)
-                self._prepare()
+                self._reconnect(arm)
         ee_pose = torch.tensor(pose, device=self.device) / 1000  # convert to meter
         return ee_pose
 
     def write_dof_targets(self, pos_target: torch.Tensor, vel_target: torch.Tensor, eff_target: torch.Tensor):
-        # Non-blocking motion
+        # Non-blocking motion, a command still waiting to be sent is replaced by this one
         position_error = pos_target - self.current_pos
         command = position_error * self.p_gain_scaler + self.current_pos
+        self._command_writer.submit(command)
 
+    def _send_command(self, command: torch.Tensor):
+        """Blocking workspace check and servo command, called by the command writer thread."""
         ee_pose = self._get_forward_kinematics(command)
         within_workspace_limits = ((ee_pose[:3] > self.min_limits) & (ee_pose[:3] < self.max_limits)).all()
 
@@ -78,10 +132,11 @@ class XarmDriver(ArticulationDrive):
             return
         code = 1
         while code != 0:
-            code = self._arm.set_servo_angle_j(command[0].tolist(), is_radian=True, wait=False)
+            arm = self._arm
+            code = arm.set_servo_angle_j(command[0].tolist(), is_radian=True, wait=False)
             if code != 0:
                 self._log(f"Warning: set_servo_angle_j returned code={code}", is_error=True)
-                self._prepare()
+                self._reconnect(arm)
 
     def set_dof_stiffnesses(self, stiffnesses):
         pass
@@ -98,6 +153,21 @@ class XarmDriver(ArticulationDrive):
     def set_dof_limits(self, limits):
         pass
 
+    def _reconnect(self, failed_arm):
+        """Replace the failed connection, unless another thread already replaced it.
+
+        Args:
+            failed_arm: The connection on which the error occurred.
+        """
+        with self._connection_lock:
+            if self._arm is not failed_arm:
+                return
+            try:
+                failed_arm.disconnect()
+            except Exception as e:
+                self._log(f"Warning: disconnecting the failed connection raised {e!r}", is_error=True)
+            self._prepare()
+
     def _prepare(self):
         from xarm.wrapper import XArmAPI
 
@@ -25,3 +25,12 @@ class XarmDriverCfg(ArticulationDriveCfg):
     is_radian: bool = True
 
     p_gain_scaler: float = 0.01
+
+    connect_timeout: float = 5.0
+    """Time in seconds to wait for the first joint state after connecting."""
+
+    state_poll_period: float = 0.004
+    """Minimum time in seconds between two polls of the joint states. Defaults to 0.004 (250 Hz).
+
+    The joint states are polled over the same connection as the servo commands, so polling as fast as possible
+    competes with the commands."""